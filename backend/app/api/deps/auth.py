@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.domain.enums import UserRole
-from app.infrastructure.db.models.system import MaintenanceLogDB
+from app.infrastructure.db.identity import RequestIdentity, bind_identity, bound_identity, load_identity
+from app.infrastructure.db.maintenance_state import maintenance_state_cache
 from app.infrastructure.db.session import get_db
 from app.infrastructure.repositories.sqlalchemy_user_repository import SqlAlchemyUserRepository
 from app.infrastructure.security.tokens import token_manager
@@ -23,9 +23,13 @@ def get_current_user(
 	user_id = token_manager.resolve_access_token(credentials.credentials)
 	if not user_id:
 		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-	user = SqlAlchemyUserRepository(db).findById(user_id)
-	if not user:
+	identity = load_identity(db, user_id)
+	if not identity:
 		raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+	# Profile ids for the rest of the request; the rows themselves are now in the session,
+	# so findById builds the domain user without another query.
+	bind_identity(db, identity)
+	user = SqlAlchemyUserRepository(db).findById(identity.userId)
 	
 	# Check maintenance mode - block non-admin users
 	_check_maintenance_mode(db, user)
@@ -33,24 +37,33 @@ def get_current_user(
 	return user
 
 
+def get_identity(user=Depends(get_current_user), db: Session = Depends(get_db)) -> RequestIdentity:
+	"""Identity (user id, role, profile row ids) of the current request, resolved once by get_current_user."""
+	identity = bound_identity(db, int(user.userId))
+	if identity is None:
+		identity = load_identity(db, int(user.userId))
+		if not identity:
+			raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+		bind_identity(db, identity)
+	return identity
+
+
 def _check_maintenance_mode(db: Session, user):
 	"""Check if maintenance mode is active and block non-admin users."""
-	open_log = db.scalar(
-		select(MaintenanceLogDB)
-		.where(MaintenanceLogDB.end_time.is_(None))
-		.order_by(MaintenanceLogDB.start_time.desc())
-		.limit(1)
-	)
+	if user.role == UserRole.ADMIN:
+		return
+	# Cached per worker; revalidated against the shared version at most once per poll interval.
+	state = maintenance_state_cache.get(db)
 	
-	if open_log and user.role != UserRole.ADMIN:
+	if state.enabled:
 		# Maintenance mode is active and user is not an admin
-		announcement = open_log.announcement or "The system is currently under maintenance. Please try again later."
+		announcement = state.announcement or "The system is currently under maintenance. Please try again later."
 		raise HTTPException(
 			status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
 			detail={
 				"message": "System is under maintenance",
 				"announcement": announcement,
-				"reason": open_log.reason,
+				"reason": state.reason,
 			}
 		)
 
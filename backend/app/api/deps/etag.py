@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+ETAG_HEADER = "ETag"
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+	if not if_none_match:
+		return False
+	candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+	return "*" in candidates or etag in candidates
+
+
+def etag_response(request: Request, body: BaseModel) -> Response:
+	"""JSON response for `body` with a strong ETag over its bytes; 304 when If-None-Match matches.
+
+	Cache-Control: no-cache lets the client keep the body and revalidate on every use.
+	"""
+	content = body.model_dump_json().encode()
+	etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+	headers = {ETAG_HEADER: etag, "Cache-Control": "private, no-cache"}
+	if _matches(request.headers.get("if-none-match"), etag):
+		return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+	return Response(content=content, media_type="application/json", headers=headers)
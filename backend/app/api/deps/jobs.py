@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from fastapi import Header, status
+from fastapi.responses import JSONResponse
+
+from app.api.schemas.jobs import JobAcceptedResponse
+from app.config.settings import get_settings
+from app.infrastructure.db.models.job import JobDB
+
+
+def prefers_async(prefer: str | None = Header(default=None)) -> bool:
+	"""True when the client sent `Prefer: respond-async` (RFC 7240).
+
+	Endpoints backed by slow AI work then enqueue a job and answer 202 instead of blocking.
+	"""
+	if not prefer:
+		return False
+	return any(p.split("=", 1)[0].strip().lower() == "respond-async" for p in prefer.split(","))
+
+
+def job_accepted_response(job: JobDB) -> JSONResponse:
+	base = f"{get_settings().api_prefix}/jobs/{job.id}"
+	body = JobAcceptedResponse(
+		jobId=str(job.id),
+		status=job.status,  # type: ignore[arg-type]
+		statusUrl=base,
+		eventsUrl=f"{base}/events",
+	)
+	return JSONResponse(
+		status_code=status.HTTP_202_ACCEPTED,
+		content=body.model_dump(),
+		headers={"Location": base, "Preference-Applied": "respond-async"},
+	)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Query, Response, status
+
+from app.infrastructure.db.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class PageParams:
+	limit: int
+	cursor: str | None
+
+
+def page_params(
+	limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+	cursor: str | None = Query(default=None),
+) -> PageParams:
+	"""`?limit=&cursor=` for keyset-paginated list endpoints.
+
+	The response body keeps the endpoint's usual shape (the first page when no cursor is
+	given); the cursor for the next page is sent in the X-Next-Cursor header.
+	"""
+	if cursor:
+		try:
+			decode_cursor(cursor)
+		except ValueError as e:
+			raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+	return PageParams(limit=limit, cursor=cursor or None)
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+	if next_cursor:
+		response.headers[NEXT_CURSOR_HEADER] = next_cursor
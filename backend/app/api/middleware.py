@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.db.instrumentation import SQLStatsRecorder
+
+
+def _path_template(scope: Scope) -> str:
+	"""The request path with matched path parameters put back as `{name}`, so /users/7 and /users/8 group together."""
+	by_value = {str(v): k for k, v in (scope.get("path_params") or {}).items()}
+	if not by_value:
+		return scope["path"]
+	return "/".join(f"{{{by_value[seg]}}}" if seg in by_value else seg for seg in scope["path"].split("/"))
+
+
+class SQLInstrumentationMiddleware:
+	"""Attribute the SQL statements of each HTTP request to it (see infrastructure/db/instrumentation.py).
+
+	With `server_timing` the response gets a `Server-Timing: db;dur=<ms>;desc="<n> queries"` header,
+	covering the statements issued before the response started.
+	"""
+
+	def __init__(self, app: ASGIApp, recorder: SQLStatsRecorder, *, server_timing: bool = False) -> None:
+		self.app = app
+		self.recorder = recorder
+		self.server_timing = server_timing
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+
+		stats, token = self.recorder.start_request(scope["method"], scope["path"])
+		started = time.perf_counter()
+
+		async def _send(message: Message) -> None:
+			if message["type"] == "http.response.start":
+				stats.status_code = int(message["status"])
+				if self.server_timing:
+					MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+			await send(message)
+
+		try:
+			await self.app(scope, receive, _send)
+		finally:
+			stats.path = _path_template(scope)
+			stats.duration_ms = (time.perf_counter() - started) * 1000
+			self.recorder.finish_request(stats, token)
@@ -31,9 +31,9 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(system_feedback.router, prefix="/system-feedback", tags=["system-feedback"])
 
 # Additive router registrations (no changes to existing routes)
-from app.api.routes import data_export, progress, rewards
+from app.api.routes import data_export, jobs, progress, rewards
 
 api_router.include_router(progress.router, prefix="/progress", tags=["progress"])
 api_router.include_router(data_export.router, prefix="/export", tags=["export"])
 api_router.include_router(rewards.router, prefix="/rewards", tags=["rewards"])
-
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import require_role
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.api.schemas.admin import (
 	AdminUserListResponse,
 	AdminUserOut,
+	CacheStatsOut,
 	MaintenanceStatusOut,
 	SetMaintenanceRequest,
+	SqlStatsOut,
 	SystemStatsOut,
 	UpdateUserRoleRequest,
 	UpdateUserVerifiedRequest,
@@ -16,7 +19,9 @@ from app.api.schemas.admin import (
 from app.application.controllers.admin_controller import AdminController
 from app.application.services.admin_service import AdminService
 from app.domain.enums import UserRole
+from app.infrastructure.db.instrumentation import get_sql_stats
 from app.infrastructure.db.session import get_db
+from app.infrastructure.repositories.cached_progress_repository import progress_cache
 
 router = APIRouter()
 
@@ -34,10 +39,16 @@ def _to_user_out(u) -> AdminUserOut:
 
 
 @router.get("/users", response_model=AdminUserListResponse)
-def list_users(db: Session = Depends(get_db), _admin=Depends(require_role(UserRole.ADMIN))) -> AdminUserListResponse:
+def list_users(
+	response: Response,
+	page: PageParams = Depends(page_params),
+	db: Session = Depends(get_db),
+	_admin=Depends(require_role(UserRole.ADMIN)),
+) -> AdminUserListResponse:
 	ctrl = AdminController(AdminService(db))
-	users = ctrl.getUserList()
-	return AdminUserListResponse(users=[_to_user_out(u) for u in users])
+	result = ctrl.getUserPage(limit=page.limit, cursor=page.cursor)
+	set_next_cursor(response, result.next_cursor)
+	return AdminUserListResponse(users=[_to_user_out(u) for u in result.items])
 
 
 @router.patch("/users/{userId}/role", response_model=AdminUserOut)
@@ -80,6 +91,19 @@ def get_stats(db: Session = Depends(get_db), admin=Depends(require_role(UserRole
 	return SystemStatsOut(**ctrl.getSystemPerformance())
 
 
+@router.get("/sql-stats", response_model=SqlStatsOut)
+def get_sql_stats_report(admin=Depends(require_role(UserRole.ADMIN))) -> SqlStatsOut:
+	"""Recent per-request SQL statistics of this worker process (statement counts, N+1 suspects, slow queries)."""
+	return SqlStatsOut(**get_sql_stats().snapshot())
+
+
+@router.get("/progress-cache-stats", response_model=CacheStatsOut)
+def get_progress_cache_stats(admin=Depends(require_role(UserRole.ADMIN))) -> CacheStatsOut:
+	"""Hit ratio and size of this worker's progress cache."""
+	stats = progress_cache.stats()
+	return CacheStatsOut(**{k: v for k, v in stats.items() if k != "hit_ratio"}, hitRatio=stats["hit_ratio"])
+
+
 @router.get("/maintenance", response_model=MaintenanceStatusOut)
 def get_maintenance(db: Session = Depends(get_db), admin=Depends(require_role(UserRole.ADMIN))) -> MaintenanceStatusOut:
 	svc = AdminService(db)
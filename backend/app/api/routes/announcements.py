@@ -3,16 +3,20 @@ from __future__ import annotations
 import json
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, require_role
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.api.schemas.communication import AnnouncementResponse, CreateAnnouncementRequest
 from app.domain.enums import UserRole
 from app.infrastructure.db.models.messaging import AnnouncementDB
 from app.infrastructure.db.models.user import TeacherDB, UserDB
-from app.infrastructure.db.session import get_db
+from app.infrastructure.db.pagination import build_page, encode_cursor, keyset
+from app.infrastructure.db.session import get_async_db, get_db
+from app.infrastructure.db.identity import teacher_for_user
 
 router = APIRouter()
 
@@ -43,16 +47,14 @@ def _parse_recipient_group(raw: str | None) -> tuple[str, list[int] | None]:
 	return ("all", None)
 
 
-def _to_response(db: Session, a: AnnouncementDB) -> AnnouncementResponse:
-	teacher = db.get(TeacherDB, a.teacher_id)
-	author_user = db.get(UserDB, teacher.user_id) if teacher else None
+def _announcement_response(a: AnnouncementDB, author: tuple[int, str] | None) -> AnnouncementResponse:
 	target, _recips = _parse_recipient_group(a.recipient_group_json)
 	if target not in ("all", "students", "teachers"):
 		target = "all"
 	return AnnouncementResponse(
 		id=str(a.id),
-		authorId=str(author_user.id) if author_user else "0",
-		authorName=author_user.name if author_user else "Unknown",
+		authorId=str(author[0]) if author else "0",
+		authorName=author[1] if author else "Unknown",
 		title=a.title,
 		content=a.content,
 		targetAudience=target,  # type: ignore[arg-type]
@@ -60,30 +62,62 @@ def _to_response(db: Session, a: AnnouncementDB) -> AnnouncementResponse:
 	)
 
 
-@router.get("", response_model=list[AnnouncementResponse])
-def list_announcements(user=Depends(get_current_user), db: Session = Depends(get_db)) -> list[AnnouncementResponse]:
-	anns = list(db.scalars(select(AnnouncementDB).order_by(AnnouncementDB.created_at.desc())).all())
+def _to_response(db: Session, a: AnnouncementDB) -> AnnouncementResponse:
+	teacher = db.get(TeacherDB, a.teacher_id)
+	author_user = db.get(UserDB, teacher.user_id) if teacher else None
+	return _announcement_response(a, (int(author_user.id), author_user.name) if author_user else None)
+
+
+def _is_visible(a: AnnouncementDB, user) -> bool:
 	if user.role == UserRole.ADMIN:
-		return [_to_response(db, a) for a in anns]
-	out: list[AnnouncementResponse] = []
-	for a in anns:
-		target, recipients = _parse_recipient_group(a.recipient_group_json)
-
-		# Visibility rules:
-		# - all: visible to everyone
-		# - recipients list: visible if user in list
-		# - students/teachers: visible by role (best-effort)
-		if recipients is not None:
-			if user.userId not in recipients:
-				continue
-		else:
-			if target == "students" and user.role != UserRole.STUDENT:
-				continue
-			if target == "teachers" and user.role != UserRole.TEACHER:
-				continue
-
-		out.append(_to_response(db, a))
-	return out
+		return True
+	target, recipients = _parse_recipient_group(a.recipient_group_json)
+
+	# Visibility rules:
+	# - all: visible to everyone
+	# - recipients list: visible if user in list
+	# - students/teachers: visible by role (best-effort)
+	if recipients is not None:
+		return user.userId in recipients
+	if target == "students" and user.role != UserRole.STUDENT:
+		return False
+	if target == "teachers" and user.role != UserRole.TEACHER:
+		return False
+	return True
+
+
+@router.get("", response_model=list[AnnouncementResponse])
+async def list_announcements(
+	response: Response,
+	page: PageParams = Depends(page_params),
+	user=Depends(get_current_user),
+	db: AsyncSession = Depends(get_async_db),
+) -> list[AnnouncementResponse]:
+	# Visibility is decided from recipient_group_json in Python, so keep reading
+	# batches until the page (plus one look-ahead row) is full or the table ends.
+	visible: list[AnnouncementDB] = []
+	cursor = page.cursor
+	while True:
+		stmt = keyset(select(AnnouncementDB), AnnouncementDB.created_at, AnnouncementDB.id, cursor=cursor, limit=page.limit)
+		batch = (await db.scalars(stmt)).all()
+		visible.extend(a for a in batch[: page.limit] if _is_visible(a, user))
+		if len(batch) <= page.limit or len(visible) > page.limit:
+			break
+		cursor = encode_cursor(batch[page.limit - 1].created_at, batch[page.limit - 1].id)
+	result = build_page(visible, limit=page.limit, key=lambda a: (a.created_at, a.id))
+	set_next_cursor(response, result.next_cursor)
+	anns = result.items
+	# Resolve authors (teacher -> user) in one query.
+	teacher_ids = {int(a.teacher_id) for a in anns}
+	authors: dict[int, tuple[int, str]] = {}
+	if teacher_ids:
+		rows = await db.execute(
+			select(TeacherDB.id, UserDB.id, UserDB.name)
+			.join(UserDB, UserDB.id == TeacherDB.user_id)
+			.where(TeacherDB.id.in_(teacher_ids))
+		)
+		authors = {int(tid): (int(uid), name) for tid, uid, name in rows.all()}
+	return [_announcement_response(a, authors.get(int(a.teacher_id))) for a in anns]
 
 
 @router.post("", response_model=AnnouncementResponse, status_code=status.HTTP_201_CREATED)
@@ -93,7 +127,7 @@ def create_announcement(
 	db: Session = Depends(get_db),
 ) -> AnnouncementResponse:
 	# Determine teacher_id (teacher row is required by schema)
-	teacher = db.scalar(select(TeacherDB).where(TeacherDB.user_id == user.userId))
+	teacher = teacher_for_user(db, user.userId)
 	if not teacher:
 		raise HTTPException(status_code=400, detail="Teacher profile not found")
 
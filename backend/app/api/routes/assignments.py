@@ -21,6 +21,7 @@ from app.api.schemas.assignments import (
 from app.application.controllers.assignment_controller import AssignmentController
 from app.application.services.assignment_service import AssignmentService
 from app.domain.enums import UserRole
+from app.infrastructure.db.bulk import bulk_values
 from app.infrastructure.db.models.user import TeacherDB
 from app.infrastructure.db.session import get_db
 
@@ -125,9 +126,10 @@ def student_my_assignments(db: Session = Depends(get_db), student=Depends(requir
 	except ValueError as e:
 		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+	teacher_user_ids = bulk_values(db, TeacherDB.id, TeacherDB.user_id, (int(a.teacher_id) for _, a in rows))
 	out: list[StudentAssignmentOut] = []
 	for sa, a in rows:
-		teacher_user_id = db.scalar(select(TeacherDB.user_id).where(TeacherDB.id == int(a.teacher_id)))
+		teacher_user_id = teacher_user_ids.get(int(a.teacher_id))
 		out.append(
 			StudentAssignmentOut(
 				studentAssignmentId=int(sa.id),
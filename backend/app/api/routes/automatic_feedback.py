@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from app.api.deps.auth import require_role
 from app.domain.enums import UserRole
 from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
-from app.infrastructure.db.models.user import StudentDB
+from app.infrastructure.db.identity import student_for_user
 from app.infrastructure.db.session import get_db
 
 router = APIRouter()
@@ -20,7 +20,7 @@ def get_feedback(
 	db: Session = Depends(get_db)
 ) -> dict:
 	"""Get feedback for a completed content."""
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+	student = student_for_user(db, int(user.userId))
 	if not student:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
 
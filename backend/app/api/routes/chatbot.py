@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from datetime import datetime
+from typing import Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps.auth import require_role
+from app.api.deps.auth import get_identity, require_role
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.api.schemas.communication import ChatMessageResponse, ChatbotSendRequest, ChatbotCapabilitiesResponse
 from app.application.controllers.chatbot_controller import ChatbotController
+from app.application.services.chatbot_service import ChatbotStreamEvent
 from app.domain.enums import UserRole
-from app.infrastructure.db.models.chatbot import ChatMessageDB
-from app.infrastructure.db.models.user import StudentDB
-from app.infrastructure.db.session import get_db
+from app.infrastructure.db.models.chatbot import ChatMessageDB, ChatSessionDB
+from app.infrastructure.db.pagination import build_page, keyset
+from app.infrastructure.db.session import get_async_db, get_db
+from app.infrastructure.db.identity import RequestIdentity, student_for_user
 
 router = APIRouter()
 
@@ -21,22 +30,46 @@ def _to_response(m: ChatMessageDB) -> ChatMessageResponse:
 
 
 def _get_student_id(db: Session, user_id: int) -> int:
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == user_id))
+	student = student_for_user(db, user_id)
 	if not student:
 		raise HTTPException(status_code=400, detail="Student profile not found")
 	return int(student.id)
 
 
 @router.get("/history", response_model=list[ChatMessageResponse])
-def get_history(
+async def get_history(
+	response: Response,
+	page: PageParams = Depends(page_params),
 	user=Depends(require_role(UserRole.STUDENT)),
-	db: Session = Depends(get_db),
+	identity: RequestIdentity = Depends(get_identity),
+	db: AsyncSession = Depends(get_async_db),
 ) -> list[ChatMessageResponse]:
-	student_id = _get_student_id(db, user.userId)
-	controller = ChatbotController(db)
-	session = controller.service.getOrCreateOpenSession(student_id)
-	msgs = controller.getChatHistory(session.id)
-	return [_to_response(m) for m in msgs]
+	"""Messages of the open session, oldest first. A page holds the most recent `limit`
+	messages; X-Next-Cursor points to the older ones."""
+	student_id = identity.studentId
+	if not student_id:
+		raise HTTPException(status_code=400, detail="Student profile not found")
+	session_id = await db.scalar(
+		select(ChatSessionDB.id)
+		.where(ChatSessionDB.student_id == student_id, ChatSessionDB.ended_at.is_(None))
+		.order_by(ChatSessionDB.started_at.desc())
+		.limit(1)
+	)
+	if session_id is None:
+		# Same as ChatbotService.getOrCreateOpenSession: opening the chat starts a session.
+		db.add(ChatSessionDB(student_id=int(student_id), started_at=datetime.utcnow(), ended_at=None))
+		await db.commit()
+		return []
+	stmt = keyset(
+		select(ChatMessageDB).where(ChatMessageDB.session_id == session_id),
+		ChatMessageDB.timestamp,
+		ChatMessageDB.id,
+		cursor=page.cursor,
+		limit=page.limit,
+	)
+	result = build_page((await db.scalars(stmt)).all(), limit=page.limit, key=lambda m: (m.timestamp, m.id))
+	set_next_cursor(response, result.next_cursor)
+	return [_to_response(m) for m in reversed(result.items)]
 
 
 @router.post("", response_model=ChatMessageResponse, status_code=status.HTTP_201_CREATED)
@@ -59,6 +92,42 @@ def send_message(
 	return _to_response(bot_msg)
 
 
+def _sse(event: str, data: dict) -> str:
+	return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/stream")
+def send_message_stream(
+	payload: ChatbotSendRequest,
+	user=Depends(require_role(UserRole.STUDENT)),
+	db: Session = Depends(get_db),
+) -> StreamingResponse:
+	"""Server-Sent Events variant of POST /chatbot.
+
+	Emits `delta` events ({"text": ...}) while the reply is generated, then a single `done`
+	event carrying the persisted message (same shape as POST /chatbot).
+	"""
+	from app.application.services.achievement_service import AchievementService
+
+	student_id = _get_student_id(db, user.userId)
+	controller = ChatbotController(db)
+	session = controller.service.getOrCreateOpenSession(student_id)
+
+	def events() -> Iterator[str]:
+		for item in controller.sendMessageStream(session.id, payload.message):
+			if isinstance(item, ChatbotStreamEvent):
+				yield _sse("delta", {"text": item.text})
+			else:
+				AchievementService(db).check_and_award_chatbot_interaction(student_id)
+				yield _sse("done", _to_response(item).model_dump(mode="json"))
+
+	return StreamingResponse(
+		events(),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+	)
+
+
 @router.post("/new-session", status_code=status.HTTP_201_CREATED)
 def new_session(
 	user=Depends(require_role(UserRole.STUDENT)),
@@ -3,57 +3,74 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps.auth import get_current_user, require_role
+from app.api.deps.auth import get_current_user, get_identity, require_role
+from app.api.deps.jobs import job_accepted_response, prefers_async
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
+from app.api.schemas.jobs import JobAcceptedResponse
 from app.api.schemas.learning_content import DeliverContentRequest, DeliverContentResponse, ContentOut
 from app.application.controllers.content_delivery_controller import ContentDeliveryController
+from app.application.services.job_service import JobService, register_job_handler
 from app.domain.enums import LanguageLevel, UserRole
 from app.config.settings import get_settings
-from app.application.services.student_ai_content_delivery_service import StudentAIContentDeliveryService
+from app.application.services.student_ai_content_delivery_service import StudentAIContentDeliveryService, build_plan_topics
+from app.application.services.progress_summary_service import refresh_progress_summary
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.user import StudentDB
-from app.infrastructure.db.session import get_db
+from app.infrastructure.db.session import get_async_db, get_db
 from app.infrastructure.db.models.content import ContentDB
+from app.infrastructure.db.pagination import build_page, keyset
+from app.infrastructure.db.identity import RequestIdentity, student_for_user, student_id_for_user
 
 router = APIRouter()
 
 
 @router.get("/history")
-def get_content_history(
+async def get_content_history(
+	response: Response,
+	page: PageParams = Depends(page_params),
 	user=Depends(require_role(UserRole.STUDENT)),
-	db: Session = Depends(get_db)
+	identity: RequestIdentity = Depends(get_identity),
+	db: AsyncSession = Depends(get_async_db),
 ) -> dict:
-	"""Get all completed AI-generated content for the current student."""
+	"""Get completed AI-generated content for the current student, newest first, one page at a time."""
 	from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
 	
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
-	if not student:
+	student_id = identity.studentId
+	if not student_id:
 		return {"history": []}
 	
-	completed = db.scalars(
-		select(StudentAIContentDB)
+	# Rows without a content record are skipped, as before.
+	stmt = keyset(
+		select(StudentAIContentDB, ContentDB)
+		.join(ContentDB, ContentDB.id == StudentAIContentDB.content_id)
 		.where(
-			StudentAIContentDB.student_id == int(student.id),
+			StudentAIContentDB.student_id == int(student_id),
 			StudentAIContentDB.is_active == False  # noqa: E712
-		)
-		.order_by(StudentAIContentDB.completed_at.desc())
-	).all()
+		),
+		StudentAIContentDB.completed_at,
+		StudentAIContentDB.id,
+		cursor=page.cursor,
+		limit=page.limit,
+	)
+	rows = (await db.execute(stmt)).all()
+	completed = build_page(rows, limit=page.limit, key=lambda r: (r[0].completed_at, r[0].id))
+	set_next_cursor(response, completed.next_cursor)
 	
 	result = []
-	for row in completed:
-		content = db.get(ContentDB, int(row.content_id))
-		if content:
-			result.append({
-				"contentId": int(content.id),
-				"title": content.title,
-				"contentType": content.content_type.value,
-				"level": content.level.value if content.level else None,
-				"completedAt": row.completed_at.isoformat() if row.completed_at else None,
-				"hasFeedback": bool(row.feedback_json),
-			})
+	for row, content in completed.items:
+		result.append({
+			"contentId": int(content.id),
+			"title": content.title,
+			"contentType": content.content_type.value,
+			"level": content.level.value if content.level else None,
+			"completedAt": row.completed_at.isoformat() if row.completed_at else None,
+			"hasFeedback": bool(row.feedback_json),
+		})
 	
 	return {"history": result}
 
@@ -88,7 +105,7 @@ def _parse_json_list(raw: str | None) -> list[str]:
 
 def _derive_plan_from_db(db: Session, *, user_id: int) -> tuple[LanguageLevel | None, list[str], list[str]]:
 	"""Return (level, weaknesses, strengths) from latest test result for a given user_id (UserDB.id)."""
-	student_pk = db.scalar(select(StudentDB.id).where(StudentDB.user_id == int(user_id)))
+	student_pk = student_id_for_user(db, int(user_id))
 	if not student_pk:
 		return None, [], []
 
@@ -110,20 +127,6 @@ def _derive_plan_from_db(db: Session, *, user_id: int) -> tuple[LanguageLevel |
 	return level, weaknesses, strengths
 
 
-def _build_plan_topics(*, weaknesses: list[str], strengths: list[str]) -> list[str]:
-	# Prioritize weaknesses; optionally include one strength for balance.
-	topics: list[str] = []
-	for w in weaknesses:
-		if w not in topics:
-			topics.append(w)
-	for s in strengths:
-		if len(topics) >= 3:
-			break
-		if s not in topics:
-			topics.append(s)
-	return topics[:3]
-
-
 @router.post("", response_model=DeliverContentResponse)
 @router.post("/deliver", response_model=DeliverContentResponse)
 def deliver_content(
@@ -140,7 +143,7 @@ def deliver_content(
 	derived_prefix = ""
 	if not plan_topics or len([t for t in plan_topics if t and t.strip()]) == 0:
 		db_level, weaknesses, strengths = _derive_plan_from_db(db, user_id=int(user.userId))
-		plan_topics = _build_plan_topics(weaknesses=weaknesses, strengths=strengths) or None
+		plan_topics = build_plan_topics(weaknesses=weaknesses, strengths=strengths) or None
 		if not level and db_level:
 			level = db_level
 		if weaknesses or strengths:
@@ -184,7 +187,7 @@ def get_content(contentId: int, user=Depends(get_current_user), db: Session = De
 			raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
 		
 		# Check if content is completed and get answers/feedback
-		student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+		student = student_for_user(db, int(user.userId))
 		row = None
 		if student:
 			row = db.scalar(
@@ -231,23 +234,27 @@ def get_content(contentId: int, user=Depends(get_current_user), db: Session = De
 	}
 
 
-@router.post("/{contentId}/complete")
-def complete_content(contentId: int, payload: dict[str, Any] | None = None, user=Depends(require_role(UserRole.STUDENT)), db: Session = Depends(get_db)) -> dict:
+def _complete_content(
+	db: Session, userId: int, contentId: int, payload: dict[str, Any] | None, *, resume: bool = False
+) -> dict:
 	# Marks as completed and (best-effort) updates strengths/weaknesses via LLM analysis.
+	# With `resume`, content that is already completed returns its stored outcome instead.
 	from app.application.services.achievement_service import AchievementService
 	
 	# Get student
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+	student = student_for_user(db, int(userId))
 	if not student:
-		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
+		raise LookupError("Student not found")
 	
 	# Get content to check type
 	content = db.get(ContentDB, int(contentId))
 	
 	service = StudentAIContentDeliveryService(db=db, settings=get_settings())
-	result = service.completeContent(studentUserId=int(user.userId), contentId=int(contentId), result=payload or None)
+	result = service.completeContent(studentUserId=int(userId), contentId=int(contentId), result=payload or None)
+	if not result and resume:
+		result = service.getCompletedContent(studentUserId=int(userId), contentId=int(contentId))
 	if not result:
-		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
+		raise LookupError("Content not found")
 	
 	# Check for achievements
 	achievement_service = AchievementService(db)
@@ -280,6 +287,8 @@ def complete_content(contentId: int, payload: dict[str, Any] | None = None, user
 			achievement_service.check_and_award_content_completion(int(student.id))
 		)
 	
+	refresh_progress_summary(db, int(student.id))
+
 	return {
 		"message": f"Content {contentId} marked as completed.",
 		"feedback": result.get("feedback"),
@@ -288,6 +297,37 @@ def complete_content(contentId: int, payload: dict[str, Any] | None = None, user
 	}
 
 
+@register_job_handler("content.complete")
+def _run_complete_content_job(db: Session, payload: dict, job) -> dict:
+	# A retried or requeued job may find its work already committed: return the stored outcome.
+	return _complete_content(
+		db, userId=int(payload["userId"]), contentId=int(payload["contentId"]), payload=payload.get("result"), resume=True
+	)
+
+
+@router.post("/{contentId}/complete", responses={202: {"model": JobAcceptedResponse}})
+def complete_content(
+	contentId: int,
+	payload: dict[str, Any] | None = None,
+	user=Depends(require_role(UserRole.STUDENT)),
+	db: Session = Depends(get_db),
+	respond_async: bool = Depends(prefers_async),
+):
+	"""Mark content completed. With `Prefer: respond-async` the feedback work runs as a job (202)."""
+	if respond_async:
+		job = JobService(db).enqueue(
+			"content.complete",
+			{"userId": int(user.userId), "contentId": contentId, "result": payload},
+			user_id=int(user.userId),
+		)
+		return job_accepted_response(job)
+
+	try:
+		return _complete_content(db, userId=int(user.userId), contentId=contentId, payload=payload)
+	except LookupError as e:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
 @router.post("/{contentId}/speaking-feedback")
 async def get_speaking_feedback(
 	contentId: int,
@@ -301,7 +341,7 @@ async def get_speaking_feedback(
 	from app.infrastructure.external.llm.audio_analyzer import AudioAnalyzer
 	
 	# Verify student has access to this content
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+	student = student_for_user(db, int(user.userId))
 	if not student:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
 	
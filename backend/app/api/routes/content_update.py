@@ -14,6 +14,7 @@ from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.user import StudentDB
 from app.infrastructure.db.session import get_db
 from app.infrastructure.repositories.memory_learning_repository import MemoryLearningRepository
+from app.infrastructure.db.identity import student_id_for_user
 
 router = APIRouter()
 
@@ -47,7 +48,7 @@ def _parse_json_list(raw: str | None) -> list[str]:
 
 
 def _derive_plan_from_db(db: Session, *, user_id: int) -> tuple[LanguageLevel | None, list[str], list[str]]:
-	student_pk = db.scalar(select(StudentDB.id).where(StudentDB.user_id == int(user_id)))
+	student_pk = student_id_for_user(db, int(user_id))
 	if not student_pk:
 		return None, [], []
 	latest = db.scalar(
@@ -6,7 +6,7 @@ from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, require_role
@@ -16,13 +16,16 @@ from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
 from app.infrastructure.db.models.content import ContentDB
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.session import get_db
-from app.infrastructure.repositories.sqlalchemy_progress_repository import SqlAlchemyProgressRepository
+from app.infrastructure.repositories.cached_progress_repository import CachedSqlAlchemyProgressRepository
+from app.infrastructure.db.identity import student_id_for_user
+from app.infrastructure.db.daily_activity import daily_totals
+from app.infrastructure.db.streaks import current_streak
 
 router = APIRouter()
 
 
 def _resolve_student_db_id(db: Session, user_id: int) -> int:
-	student_id = db.query(StudentDB.id).filter(StudentDB.user_id == user_id).scalar()
+	student_id = student_id_for_user(db, user_id)
 	if not student_id:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student profile not found")
 	return int(student_id)
@@ -44,7 +47,7 @@ def export_my_progress_csv(user=Depends(get_current_user), db: Session = Depends
 
 @router.get("/progress/{student_id}.csv", dependencies=[Depends(require_role(UserRole.TEACHER, UserRole.ADMIN))])
 def export_progress_csv(student_id: int, db: Session = Depends(get_db)) -> StreamingResponse:
-	repo = SqlAlchemyProgressRepository(db)
+	repo = CachedSqlAlchemyProgressRepository(db)
 	progress = repo.fetch_progress(student_id)
 	snapshots = repo.fetch_snapshots(student_id=student_id, days=365)
 
@@ -111,20 +114,18 @@ def export_my_progress_pdf(user=Depends(get_current_user), db: Session = Depends
 	except ImportError:
 		raise HTTPException(status_code=500, detail="PDF generation library not installed")
 
-	repo = SqlAlchemyProgressRepository(db)
+	repo = CachedSqlAlchemyProgressRepository(db)
 	progress = repo.fetch_progress(student_id)
 	student = db.get(StudentDB, student_id)
 
-	# Get completed content with dates for timeline
-	completed_content = db.scalars(
-		select(StudentAIContentDB)
+	completed_content_count = int(db.scalar(
+		select(func.count())
+		.select_from(StudentAIContentDB)
 		.where(
 			StudentAIContentDB.student_id == student_id,
 			StudentAIContentDB.is_active == False  # noqa: E712
 		)
-	).all()
-
-	completed_content_count = len(completed_content)
+	) or 0)
 
 	# Get test results for CEFR level tracking
 	test_results = db.scalars(
@@ -139,12 +140,12 @@ def export_my_progress_pdf(user=Depends(get_current_user), db: Session = Depends
 		if test_result.completed_at and test_result.level:
 			test_date_map[test_result.completed_at.date()] = test_result.level.value
 
-	# Get completed content by date for timeline
-	content_date_counts: dict[date, int] = {}
-	for content_row in completed_content:
-		if content_row.completed_at:
-			content_date = content_row.completed_at.date()
-			content_date_counts[content_date] = content_date_counts.get(content_date, 0) + 1
+	# Completed content by date for timeline, from the daily_activity rollup
+	content_date_counts = {
+		d: t["content_completed"]
+		for d, t in daily_totals(db, student_id=student_id).items()
+		if t["content_completed"] > 0
+	}
 
 	# Build timeline data matching the graph
 	timeline_entries: list[tuple[date, int, str | None]] = []
@@ -176,7 +177,7 @@ def export_my_progress_pdf(user=Depends(get_current_user), db: Session = Depends
 	stats_data = [
 		["Metric", "Value"],
 		["Current Level", student.level.value if student.level else "N/A"],
-		["Daily Streak", f"{student.daily_streak} days"],
+		["Daily Streak", f"{current_streak(student)} days"],
 		["Content Completed", str(completed_content_count)],
 		["Lessons Completed", str(len(progress.completed_lessons)) if progress else "0"],
 	]
@@ -247,7 +248,7 @@ def export_student_progress_pdf(student_id: int, db: Session = Depends(get_db))
 	except ImportError:
 		raise HTTPException(status_code=500, detail="PDF generation library not installed")
 
-	repo = SqlAlchemyProgressRepository(db)
+	repo = CachedSqlAlchemyProgressRepository(db)
 	progress = repo.fetch_progress(student_id)
 	student = db.get(StudentDB, student_id)
 	
@@ -259,16 +260,14 @@ def export_student_progress_pdf(student_id: int, db: Session = Depends(get_db))
 	user_record = db.get(UserDB, student.user_id)
 	student_name = user_record.name if user_record else f"Student {student_id}"
 
-	# Get completed content with dates for timeline
-	completed_content = db.scalars(
-		select(StudentAIContentDB)
+	completed_content_count = int(db.scalar(
+		select(func.count())
+		.select_from(StudentAIContentDB)
 		.where(
 			StudentAIContentDB.student_id == student_id,
 			StudentAIContentDB.is_active == False  # noqa: E712
 		)
-	).all()
-
-	completed_content_count = len(completed_content)
+	) or 0)
 
 	# Get test results for CEFR level tracking
 	test_results = db.scalars(
@@ -283,12 +282,12 @@ def export_student_progress_pdf(student_id: int, db: Session = Depends(get_db))
 		if test_result.completed_at and test_result.level:
 			test_date_map[test_result.completed_at.date()] = test_result.level.value
 
-	# Get completed content by date for timeline
-	content_date_counts: dict[date, int] = {}
-	for content_row in completed_content:
-		if content_row.completed_at:
-			content_date = content_row.completed_at.date()
-			content_date_counts[content_date] = content_date_counts.get(content_date, 0) + 1
+	# Completed content by date for timeline, from the daily_activity rollup
+	content_date_counts = {
+		d: t["content_completed"]
+		for d, t in daily_totals(db, student_id=student_id).items()
+		if t["content_completed"] > 0
+	}
 
 	# Build timeline data matching the graph
 	timeline_entries: list[tuple[date, int, str | None]] = []
@@ -320,7 +319,7 @@ def export_student_progress_pdf(student_id: int, db: Session = Depends(get_db))
 	stats_data = [
 		["Metric", "Value"],
 		["Current Level", student.level.value if student.level else "N/A"],
-		["Daily Streak", f"{student.daily_streak} days"],
+		["Daily Streak", f"{current_streak(student)} days"],
 		["Content Completed", str(completed_content_count)],
 		["Lessons Completed", str(len(progress.completed_lessons)) if progress else "0"],
 	]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps.auth import get_current_user
+from app.api.schemas.jobs import JobStatusResponse
+from app.application.services.job_service import JobService, JobView
+from app.domain.enums import UserRole
+from app.infrastructure.db.session import SessionLocal, get_db
+
+router = APIRouter()
+
+_POLL_SECONDS = 0.5
+_KEEPALIVE_SECONDS = 15.0
+
+
+def _to_response(view: JobView) -> JobStatusResponse:
+	return JobStatusResponse(
+		id=str(view.id),
+		type=view.jobType,
+		status=view.status,  # type: ignore[arg-type]
+		attempts=view.attempts,
+		maxAttempts=view.maxAttempts,
+		result=view.result,
+		error=view.error,
+		createdAt=view.createdAt,
+		startedAt=view.startedAt,
+		finishedAt=view.finishedAt,
+	)
+
+
+def _get_view_or_404(db: Session, jobId: int, user) -> JobView:
+	job = JobService(db).getJobForUser(jobId, int(user.userId), is_admin=user.role == UserRole.ADMIN)
+	if not job:
+		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+	return JobService.to_view(job)
+
+
+def _load_view(jobId: int) -> JobView | None:
+	db = SessionLocal()
+	try:
+		job = JobService(db).getJob(jobId)
+		return JobService.to_view(job) if job else None
+	finally:
+		db.close()
+
+
+def _sse(event: str, data: dict) -> str:
+	return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/{jobId}", response_model=JobStatusResponse)
+def get_job(
+	jobId: int,
+	db: Session = Depends(get_db),
+	user=Depends(get_current_user),
+) -> JobStatusResponse:
+	return _to_response(_get_view_or_404(db, jobId, user))
+
+
+@router.get("/{jobId}/events")
+def stream_job_events(
+	jobId: int,
+	db: Session = Depends(get_db),
+	user=Depends(get_current_user),
+) -> StreamingResponse:
+	"""Server-Sent Events feed of a job's progress.
+
+	Emits a `status` event whenever the status or attempt count changes, then a final `done`
+	event carrying the full job (same shape as GET /jobs/{jobId}) once it succeeded or failed.
+	"""
+	first = _get_view_or_404(db, jobId, user)
+
+	async def events() -> AsyncIterator[str]:
+		view: JobView | None = first
+		last_seen: tuple[str, int] | None = None
+		idle = 0.0
+		while view is not None:
+			if view.done:
+				yield _sse("done", _to_response(view).model_dump(mode="json"))
+				return
+			current = (view.status, view.attempts)
+			if current != last_seen:
+				last_seen = current
+				idle = 0.0
+				yield _sse("status", {"id": str(view.id), "status": view.status, "attempts": view.attempts})
+			elif idle >= _KEEPALIVE_SECONDS:
+				idle = 0.0
+				yield ": keep-alive\n\n"
+			await asyncio.sleep(_POLL_SECONDS)
+			idle += _POLL_SECONDS
+			view = await run_in_threadpool(_load_view, jobId)
+
+	return StreamingResponse(
+		events(),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+	)
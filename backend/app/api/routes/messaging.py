@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.api.schemas.communication import (
 	ContactResponse,
 	DeleteMessageResponse,
@@ -17,20 +19,20 @@ from app.api.schemas.communication import (
 from app.domain.enums import UserRole
 from app.infrastructure.db.models.messaging import MessageDB
 from app.infrastructure.db.models.user import UserDB
-from app.infrastructure.db.session import get_db
+from app.infrastructure.db.bulk import abulk_values, bulk_values
+from app.infrastructure.db.pagination import build_page, keyset
+from app.infrastructure.db.session import get_async_db, get_db
 
 router = APIRouter()
 
 
-def _to_message(db: Session, m: MessageDB) -> MessageResponse:
-	sender = db.get(UserDB, m.sender_id)
-	recipient = db.get(UserDB, m.recipient_id)
+def _message_response(m: MessageDB, names: dict[int, str]) -> MessageResponse:
 	return MessageResponse(
 		id=str(m.id),
 		senderId=str(m.sender_id),
-		senderName=sender.name if sender else None,
+		senderName=names.get(int(m.sender_id)),
 		receiverId=str(m.recipient_id),
-		receiverName=recipient.name if recipient else None,
+		receiverName=names.get(int(m.recipient_id)),
 		subject=m.subject or "",
 		content=m.body,
 		isRead=bool(m.is_read),
@@ -38,17 +40,33 @@ def _to_message(db: Session, m: MessageDB) -> MessageResponse:
 	)
 
 
+def _to_message(db: Session, m: MessageDB) -> MessageResponse:
+	names = bulk_values(db, UserDB.id, UserDB.name, (int(m.sender_id), int(m.recipient_id)))
+	return _message_response(m, names)
+
+
 @router.get("", response_model=list[MessageResponse])
-def get_messages(user=Depends(get_current_user), db: Session = Depends(get_db)) -> list[MessageResponse]:
-	# inbox + sent (simple)
-	msgs = list(
-		db.scalars(
-			select(MessageDB)
-			.where(or_(MessageDB.recipient_id == user.userId, MessageDB.sender_id == user.userId))
-			.order_by(MessageDB.sent_at.desc())
-		).all()
+async def get_messages(
+	response: Response,
+	page: PageParams = Depends(page_params),
+	user=Depends(get_current_user),
+	db: AsyncSession = Depends(get_async_db),
+) -> list[MessageResponse]:
+	# inbox + sent (simple), newest first, one page at a time
+	stmt = keyset(
+		select(MessageDB).where(or_(MessageDB.recipient_id == user.userId, MessageDB.sender_id == user.userId)),
+		MessageDB.sent_at,
+		MessageDB.id,
+		cursor=page.cursor,
+		limit=page.limit,
 	)
-	return [_to_message(db, m) for m in msgs]
+	result = build_page((await db.scalars(stmt)).all(), limit=page.limit, key=lambda m: (m.sent_at, m.id))
+	set_next_cursor(response, result.next_cursor)
+	msgs = result.items
+	# Resolve every participant name in one query.
+	user_ids = {int(m.sender_id) for m in msgs} | {int(m.recipient_id) for m in msgs}
+	names = await abulk_values(db, UserDB.id, UserDB.name, user_ids)
+	return [_message_response(m, names) for m in msgs]
 
 
 @router.get("/contacts", response_model=list[ContactResponse])
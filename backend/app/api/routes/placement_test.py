@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user
+from app.api.deps.jobs import job_accepted_response, prefers_async
+from app.api.schemas.jobs import JobAcceptedResponse
 from app.api.schemas.placement_test import (
 	ModuleQuestionsResponse,
 	StartPlacementTestResponse,
@@ -20,8 +22,11 @@ from app.api.schemas.placement_test import (
 	ListeningQuestion,
 )
 from app.application.controllers.placement_test_controller import PlacementTestController
+from app.application.services.job_service import JobService, register_job_handler
 from app.application.services.placement_test_service import PlacementTestService
+from app.application.services.progress_summary_service import refresh_progress_summary
 from app.infrastructure.db.session import get_db
+from app.infrastructure.db.identity import student_for_user
 
 router = APIRouter()
 
@@ -179,18 +184,74 @@ def submit_module(
 	)
 
 
-@router.post("/{testId}/module/speaking/submit-audio", response_model=TestModuleResult)
+def _submit_speaking_audio(
+	db: Session,
+	userId: int,
+	testId: int,
+	questionId: str,
+	audioBytes: bytes,
+	contentType: str | None,
+) -> TestModuleResult:
+	controller = PlacementTestController(PlacementTestService(db))
+	result = controller.submitSpeakingAudio(
+		userId=userId,
+		testId=testId,
+		questionId=questionId,
+		audioBytes=audioBytes,
+		contentType=contentType,
+	)
+	return TestModuleResult(
+		moduleType=result.moduleType,
+		level=result.level.value,
+		score=result.score,
+		feedback=result.feedback,
+	)
+
+
+@register_job_handler("placement.speaking_audio")
+def _run_speaking_audio_job(db: Session, payload: dict, job) -> dict:
+	return _submit_speaking_audio(
+		db,
+		userId=int(payload["userId"]),
+		testId=int(payload["testId"]),
+		questionId=str(payload["questionId"]),
+		audioBytes=job.payload_blob or b"",
+		contentType=payload.get("contentType"),
+	).model_dump()
+
+
+@router.post(
+	"/{testId}/module/speaking/submit-audio",
+	response_model=TestModuleResult,
+	responses={202: {"model": JobAcceptedResponse}},
+)
 async def submit_speaking_audio(
 	testId: int,
 	questionId: str = Form(...),
 	audio: UploadFile = File(...),
 	db: Session = Depends(get_db),
 	user=Depends(get_current_user),
-) -> TestModuleResult:
-	controller = PlacementTestController(PlacementTestService(db))
+	respond_async: bool = Depends(prefers_async),
+):
+	"""Analyze a speaking answer. With `Prefer: respond-async` the analysis runs as a job (202)."""
+	audio_bytes = await audio.read()
+	if respond_async:
+		job = JobService(db).enqueue(
+			"placement.speaking_audio",
+			{
+				"userId": int(user.userId),
+				"testId": testId,
+				"questionId": questionId,
+				"contentType": audio.content_type,
+			},
+			user_id=int(user.userId),
+			blob=audio_bytes,
+		)
+		return job_accepted_response(job)
+
 	try:
-		audio_bytes = await audio.read()
-		result = controller.submitSpeakingAudio(
+		return _submit_speaking_audio(
+			db,
 			userId=user.userId,
 			testId=testId,
 			questionId=questionId,
@@ -200,35 +261,27 @@ async def submit_speaking_audio(
 	except ValueError as e:
 		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-	return TestModuleResult(
-		moduleType=result.moduleType,
-		level=result.level.value,
-		score=result.score,
-		feedback=result.feedback,
-	)
-
 
-@router.post("/{testId}/complete")
-def complete_test(
-	testId: int,
-	db: Session = Depends(get_db),
-	user=Depends(get_current_user),
-):
+def _complete_test(db: Session, userId: int, testId: int, *, resume: bool = False) -> dict:
+	"""Score the test. With `resume`, an already stored result is returned without scoring again."""
 	from app.application.services.achievement_service import AchievementService
-	from app.infrastructure.db.models.user import StudentDB
-	from sqlalchemy import select
-	
+
 	controller = PlacementTestController(PlacementTestService(db))
-	try:
-		res = controller.completeTest(userId=user.userId, testId=testId)
-	except ValueError as e:
-		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-	
+	res = None
+	if resume:
+		try:
+			res = controller.getTestResult(userId=userId, testId=testId)
+		except ValueError:
+			res = None
+	if res is None:
+		res = controller.completeTest(userId=userId, testId=testId)
+
 	# Check for first placement test achievement
-	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+	student = student_for_user(db, int(userId))
 	if student:
 		achievement_service = AchievementService(db)
 		achievement_service.check_and_award_placement_test(int(student.id))
+		refresh_progress_summary(db, int(student.id))
 
 	return {
 		"id": str(res.id),
@@ -242,6 +295,34 @@ def complete_test(
 	}
 
 
+@register_job_handler("placement.complete")
+def _run_complete_test_job(db: Session, payload: dict, job) -> dict:
+	# A retried or requeued job may find the result already stored; achievements are idempotent.
+	return _complete_test(db, userId=int(payload["userId"]), testId=int(payload["testId"]), resume=True)
+
+
+@router.post("/{testId}/complete", responses={202: {"model": JobAcceptedResponse}})
+def complete_test(
+	testId: int,
+	db: Session = Depends(get_db),
+	user=Depends(get_current_user),
+	respond_async: bool = Depends(prefers_async),
+):
+	"""Score the test. With `Prefer: respond-async` scoring runs as a job (202)."""
+	if respond_async:
+		job = JobService(db).enqueue(
+			"placement.complete",
+			{"userId": int(user.userId), "testId": testId},
+			user_id=int(user.userId),
+		)
+		return job_accepted_response(job)
+
+	try:
+		return _complete_test(db, userId=user.userId, testId=testId)
+	except ValueError as e:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/active", response_model=list[ActiveTestResponse])
 def list_active_tests(
 	db: Session = Depends(get_db),
@@ -9,8 +9,7 @@ from app.api.schemas.rewards import StudentRewardOut, AchievementNotification
 from app.application.services.achievement_service import AchievementService
 from app.domain.enums import UserRole
 from app.infrastructure.db.session import get_db
-from app.infrastructure.db.models.user import StudentDB
-from sqlalchemy import select
+from app.infrastructure.db.identity import student_for_user
 
 
 router = APIRouter()
@@ -22,7 +21,7 @@ def get_my_achievements(
     db: Session = Depends(get_db)
 ) -> list[StudentRewardOut]:
     """Get all achievements earned by the current student."""
-    student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+    student = student_for_user(db, int(user.userId))
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +41,7 @@ def check_new_achievements(
     db: Session = Depends(get_db)
 ) -> AchievementNotification:
     """Check for new achievements earned since last check."""
-    student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(user.userId)))
+    student = student_for_user(db, int(user.userId))
     if not student:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
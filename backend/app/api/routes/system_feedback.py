@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, require_role
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.api.schemas.system_feedback import (
 	SubmitSystemFeedbackRequest,
 	SystemFeedbackOut,
@@ -57,11 +58,15 @@ def submit_system_feedback(
 
 @router.get("", response_model=list[SystemFeedbackOut])
 def list_system_feedback(
+	response: Response,
+	page: PageParams = Depends(page_params),
 	db: Session = Depends(get_db),
 	_admin=Depends(require_role(UserRole.ADMIN)),
 ) -> list[SystemFeedbackOut]:
 	ctrl = SystemFeedbackController(SystemFeedbackService(SqlAlchemySystemFeedbackRepository(db)))
-	items = ctrl.listFeedback() or []
+	result = ctrl.listFeedbackPage(limit=page.limit, cursor=page.cursor)
+	set_next_cursor(response, result.next_cursor)
+	items = result.items
 
 	# Resolve usernames efficiently
 	user_ids = {int(i.userId) for i in items}
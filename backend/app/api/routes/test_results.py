@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, require_role
+from app.api.deps.pagination import PageParams, page_params, set_next_cursor
 from app.application.controllers.placement_test_controller import PlacementTestController
 from app.application.services.placement_test_service import PlacementTestService
 from app.domain.enums import LanguageLevel, UserRole
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.user import StudentDB
+from app.infrastructure.db.pagination import MAX_PAGE_SIZE, build_page, keyset
 from app.infrastructure.db.session import get_db
 
 router = APIRouter()
@@ -17,66 +19,67 @@ router = APIRouter()
 
 @router.get("/my-results")
 def my_results(
+	response: Response,
+	page: PageParams = Depends(page_params),
 	db: Session = Depends(get_db),
 	user=Depends(get_current_user),
 ):
 	# Keep payload stable with frontend expectations.
 	controller = PlacementTestController(PlacementTestService(db))
-	rows = controller.listMyResults(user.userId)
+	try:
+		result = controller.listMyResultsPage(user.userId, limit=page.limit, cursor=page.cursor)
+	except ValueError as e:
+		raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+	set_next_cursor(response, result.next_cursor)
 
-	# Prefer returning placements only when possible (by joining tests table).
-	# Without additional repos, we keep this lightweight and filter by existing TestDB rows.
+	# Per-module levels are derived by the service when a row lacks them.
 	# If a row belongs to a non-placement test, the frontend can ignore it.
-	results = []
-	for row in rows:
-		# Derive per-module levels on the fly.
-		try:
-			res_view = controller.getTestResult(userId=user.userId, testId=int(row.test_id))
-		except Exception:
-			continue
-		results.append(
-			{
-				"id": str(res_view.id),
-				"studentId": str(res_view.studentId),
-				"overallLevel": res_view.overallLevel.value,
-				"readingLevel": res_view.readingLevel.value,
-				"writingLevel": res_view.writingLevel.value,
-				"listeningLevel": res_view.listeningLevel.value,
-				"speakingLevel": res_view.speakingLevel.value,
-				"completedAt": res_view.completedAt,
-			}
-		)
-
-	return results
+	return [
+		{
+			"id": str(res_view.id),
+			"studentId": str(res_view.studentId),
+			"overallLevel": res_view.overallLevel.value,
+			"readingLevel": res_view.readingLevel.value,
+			"writingLevel": res_view.writingLevel.value,
+			"listeningLevel": res_view.listeningLevel.value,
+			"speakingLevel": res_view.speakingLevel.value,
+			"completedAt": res_view.completedAt,
+		}
+		for res_view in result.items
+	]
 
 
 @router.get("/student/{student_user_id}", dependencies=[Depends(require_role(UserRole.TEACHER, UserRole.ADMIN))])
 def get_student_results(
 	student_user_id: int,
+	response: Response,
 	limit: int = 20,
+	cursor: str | None = None,
 	db: Session = Depends(get_db),
 ):
-	"""UC6 (teacher/admin): list a student's test results."""
+	"""UC6 (teacher/admin): list a student's test results (X-Next-Cursor pages further back)."""
 	if limit < 1:
 		limit = 1
-	if limit > 200:
-		limit = 200
+	if limit > MAX_PAGE_SIZE:
+		limit = MAX_PAGE_SIZE
+	page = page_params(limit=limit, cursor=cursor)
 
 	student = db.scalar(select(StudentDB).where(StudentDB.user_id == int(student_user_id)))
 	if not student:
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
 
-	rows = list(
-		db.scalars(
-			select(TestResultDB)
-			.where(TestResultDB.student_id == int(student.id))
-			.order_by(TestResultDB.completed_at.desc())
-			.limit(limit)
-		).all()
+	stmt = keyset(
+		select(TestResultDB).where(TestResultDB.student_id == int(student.id)),
+		TestResultDB.completed_at,
+		TestResultDB.id,
+		cursor=page.cursor,
+		limit=page.limit,
 	)
+	result = build_page(db.scalars(stmt).all(), limit=page.limit, key=lambda r: (r.completed_at, r.id))
+	set_next_cursor(response, result.next_cursor)
 
 	out = []
-	for r in rows:
+	for r in result.items:
 		overall = r.level or LanguageLevel.A1
 		out.append(
 			{
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_user, require_role
 from app.domain.enums import LanguageLevel, UserRole
+from app.infrastructure.db.bulk import latest_by
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.user import StudentDB, UserDB
 from app.infrastructure.db.session import get_db
@@ -44,13 +45,16 @@ def _parse_sw_list(raw: str | None) -> list[str]:
 	return out[:5]
 
 
-def _student_overview(db: Session, u: UserDB, s: StudentDB) -> dict:
-	latest = db.scalar(
-		select(TestResultDB)
-		.where(TestResultDB.student_id == int(s.id))
-		.order_by(TestResultDB.completed_at.desc())
-		.limit(1)
-	)
+def _new_student_row(u: UserDB) -> StudentDB:
+	# Best-effort: if a student user exists without StudentDB row, create a minimal one.
+	return StudentDB(user_id=int(u.id), level=LanguageLevel.A1, daily_streak=0, total_points=0, enrollment_date=datetime.utcnow())
+
+
+def _latest_results(db: Session, student_ids: list[int]) -> dict[int, TestResultDB]:
+	return latest_by(db, TestResultDB, TestResultDB.student_id, TestResultDB.completed_at, student_ids)
+
+
+def _student_overview(u: UserDB, s: StudentDB, latest: TestResultDB | None) -> dict:
 	level = (latest.level if latest and latest.level else s.level) or LanguageLevel.A1
 	strengths = _parse_sw_list(latest.strengths_json) if latest else []
 	weaknesses = _parse_sw_list(latest.weaknesses_json) if latest else []
@@ -76,17 +80,24 @@ def _student_overview(db: Session, u: UserDB, s: StudentDB) -> dict:
 @router.get("/teacher/students", dependencies=[Depends(require_role(UserRole.TEACHER, UserRole.ADMIN))])
 def list_teacher_students(db: Session = Depends(get_db)) -> list[dict]:
 	"""UC6 teacher view: list students (minimal class roster for demo)."""
-	users = list(db.scalars(select(UserDB).where(UserDB.role == UserRole.STUDENT).order_by(UserDB.name.asc())).all())
-	out: list[dict] = []
-	for u in users:
-		s = db.scalar(select(StudentDB).where(StudentDB.user_id == int(u.id)))
-		if not s:
-			# Best-effort: if a student user exists without StudentDB row, create a minimal one.
-			s = StudentDB(user_id=int(u.id), level=LanguageLevel.A1, daily_streak=0, total_points=0, enrollment_date=datetime.utcnow())
-			db.add(s)
-			db.commit()
-			db.refresh(s)
-		out.append(_student_overview(db, u, s))
+	# Users, their student rows and their latest results: a fixed number of queries for any roster size.
+	rows = db.execute(
+		select(UserDB, StudentDB)
+		.outerjoin(StudentDB, StudentDB.user_id == UserDB.id)
+		.where(UserDB.role == UserRole.STUDENT)
+		.order_by(UserDB.name.asc())
+	).all()
+	missing = [_new_student_row(u) for u, s in rows if s is None]
+	if missing:
+		db.add_all(missing)
+		db.flush()
+	created = {int(s.user_id): s for s in missing}
+	pairs = [(u, s if s is not None else created[int(u.id)]) for u, s in rows]
+	latest = _latest_results(db, [int(s.id) for _, s in pairs])
+	out = [_student_overview(u, s, latest.get(int(s.id))) for u, s in pairs]
+	if missing:
+		# Committed last: the commit expires every loaded row.
+		db.commit()
 	return out
 
 
@@ -106,10 +117,10 @@ def get_student_details(
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
 	s = db.scalar(select(StudentDB).where(StudentDB.user_id == int(u.id)))
 	if not s:
-		s = StudentDB(user_id=int(u.id), level=LanguageLevel.A1, daily_streak=0, total_points=0, enrollment_date=datetime.utcnow())
+		s = _new_student_row(u)
 		db.add(s)
 		db.commit()
 		db.refresh(s)
-	return _student_overview(db, u, s)
+	return _student_overview(u, s, _latest_results(db, [int(s.id)]).get(int(s.id)))
 
 
@@ -57,3 +57,21 @@ class SetMaintenanceRequest(BaseModel):
 	announcement: str | None = None
 
 
+class CacheStatsOut(BaseModel):
+	enabled: bool
+	hits: int
+	misses: int
+	hitRatio: float
+	expired: int
+	evicted: int
+	invalidated: int
+	entries: int
+
+
+class SqlStatsOut(BaseModel):
+	nPlusOneThreshold: int
+	slowQueryMs: float
+	routes: list[dict] = Field(default_factory=list)
+	requests: list[dict] = Field(default_factory=list)
+	nPlusOne: list[dict] = Field(default_factory=list)
+	slowQueries: list[dict] = Field(default_factory=list)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobAcceptedResponse(BaseModel):
+	jobId: str
+	status: JobStatus
+	statusUrl: str
+	eventsUrl: str
+
+
+class JobStatusResponse(BaseModel):
+	id: str
+	type: str
+	status: JobStatus
+	attempts: int
+	maxAttempts: int
+	result: dict[str, Any] | None = None
+	error: str | None = None
+	createdAt: datetime
+	startedAt: datetime | None = None
+	finishedAt: datetime | None = None
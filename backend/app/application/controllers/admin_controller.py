@@ -10,6 +10,9 @@ class AdminController:
 	def getUserList(self):
 		return self.service.getAllUsers()
 
+	def getUserPage(self, limit: int, cursor: str | None = None):
+		return self.service.getUsersPage(limit=limit, cursor=cursor)
+
 	def updateUserRole(self, userId: int, role: UserRole):
 		return self.service.updateUserRole(userId, role)
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 from sqlalchemy.orm import Session
 
-from app.application.services.chatbot_service import ChatbotService
+from app.application.services.chatbot_service import ChatbotService, ChatbotStreamEvent
 from app.infrastructure.db.models.chatbot import ChatMessageDB, ChatSessionDB
 
 
@@ -20,7 +22,23 @@ class ChatbotController:
         self.service.saveMessage(sessionId, sender="user", content=message)
         # produce + persist bot reply
         reply = self.service.processMessage(sessionId, message)
-        return self.service.saveMessage(sessionId, sender="bot", content=reply)
+        bot_msg = self.service.saveMessage(sessionId, sender="bot", content=reply)
+        self.service.scheduleSummaryRefresh(sessionId)
+        return bot_msg
+
+    def sendMessageStream(self, sessionId: int, message: str) -> Iterator[ChatbotStreamEvent | ChatMessageDB]:
+        """Like sendMessage, but yields reply deltas as they arrive.
+
+        The final item is the persisted bot ChatMessageDB.
+        """
+        self.service.saveMessage(sessionId, sender="user", content=message)
+        for event in self.service.processMessageStream(sessionId, message):
+            if event.type == "done":
+                bot_msg = self.service.saveMessage(sessionId, sender="bot", content=event.text)
+                self.service.scheduleSummaryRefresh(sessionId)
+                yield bot_msg
+            else:
+                yield event
 
     def endChatSession(self, sessionId: int) -> None:
         self.service.endSession(sessionId)
@@ -36,6 +36,9 @@ class PlacementTestController:
     def listMyResults(self, userId: int):
         return self.placement_test_service.listMyPlacementResults(userId=userId)
 
+    def listMyResultsPage(self, userId: int, limit: int, cursor: str | None = None):
+        return self.placement_test_service.listMyPlacementResultsPage(userId=userId, limit=limit, cursor=cursor)
+
     def saveProgress(self, studentId: int, progress: Any):
         # Not implemented in the DB schema yet.
         raise NotImplementedError
@@ -13,5 +13,8 @@ class SystemFeedbackController:
     def listFeedback(self):
         return self.service.listFeedback()
 
+    def listFeedbackPage(self, limit: int, cursor: str | None = None):
+        return self.service.listFeedbackPage(limit=limit, cursor=cursor)
+
     def updateFeedbackStatus(self, feedbackId: int, status: str):
         return self.service.updateFeedbackStatus(feedbackId=feedbackId, status=status)
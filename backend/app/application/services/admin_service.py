@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any, Callable
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.config.settings import get_settings
 from app.domain.enums import UserRole
 from app.infrastructure.db.models.system import MaintenanceLogDB, SystemPerformanceDB
 from app.infrastructure.db.models.system import MaintenanceLogDB, SystemPerformanceDB
@@ -12,6 +19,72 @@ from app.infrastructure.db.models.user import AdminDB, StudentDB, TeacherDB, Use
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.assignments import AssignmentDB
 from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.pagination import Page, build_page, keyset
+from app.infrastructure.db.identity import admin_id_for_user
+from app.infrastructure.db.daily_activity import daily_totals
+from app.infrastructure.db.maintenance_state import maintenance_state_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _StatsEntry:
+	stats: dict
+	computed_at: float
+	refreshing: bool = False
+
+
+class _SystemStatsCache:
+	"""Dashboard stats per database, served stale-while-revalidate.
+
+	Within `ttl` the cached payload is returned as is. Past it, the stale payload is still
+	returned and one background thread recomputes it on its own session. Past `max_stale`
+	(or on the first call) the caller computes synchronously.
+	"""
+
+	def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+		self._clock = clock
+		self._lock = threading.Lock()
+		self._entries: weakref.WeakKeyDictionary[Any, _StatsEntry] = weakref.WeakKeyDictionary()
+
+	def get(self, db: Session, compute: Callable[[Session], dict], *, ttl: float, max_stale: float) -> dict:
+		bind = db.get_bind()
+		now = self._clock()
+		with self._lock:
+			entry = self._entries.get(bind)
+			if entry is not None and now - entry.computed_at < max_stale:
+				if now - entry.computed_at >= ttl and not entry.refreshing:
+					entry.refreshing = True
+					threading.Thread(
+						target=self._refresh, args=(bind, compute), name="admin-stats-refresh", daemon=True
+					).start()
+				return entry.stats
+		stats = compute(db)
+		with self._lock:
+			self._entries[bind] = _StatsEntry(stats, self._clock())
+		return stats
+
+	def _refresh(self, bind: Any, compute: Callable[[Session], dict]) -> None:
+		try:
+			with Session(bind=bind) as db:
+				stats = compute(db)
+		except Exception as e:
+			logger.warning("Admin stats refresh failed: %s", str(e))
+			with self._lock:
+				entry = self._entries.get(bind)
+				if entry is not None:
+					entry.refreshing = False
+			return
+		with self._lock:
+			self._entries[bind] = _StatsEntry(stats, self._clock())
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+
+_stats_cache = _SystemStatsCache()
 
 
 class AdminService:
@@ -21,6 +94,11 @@ class AdminService:
 	def getAllUsers(self) -> list[UserDB]:
 		return list(self.db.scalars(select(UserDB).order_by(UserDB.id.asc())).all())
 
+	def getUsersPage(self, limit: int, cursor: str | None = None) -> Page[UserDB]:
+		"""Users in id order, keyset-paginated."""
+		stmt = keyset(select(UserDB), None, UserDB.id, cursor=cursor, limit=limit, descending=False)
+		return build_page(self.db.scalars(stmt).all(), limit=limit, key=lambda u: (None, u.id))
+
 	def updateUserRole(self, userId: int, role: UserRole) -> UserDB:
 		user = self.db.get(UserDB, int(userId))
 		if not user:
@@ -71,13 +149,45 @@ class AdminService:
 		return user
 
 	def getSystemStats(self) -> dict:
-		total_users = int(self.db.scalar(select(func.count()).select_from(UserDB)) or 0)
-		total_students = int(self.db.scalar(select(func.count()).select_from(StudentDB)) or 0)
-		total_teachers = int(self.db.scalar(select(func.count()).select_from(TeacherDB)) or 0)
-		total_admins = int(self.db.scalar(select(func.count()).select_from(AdminDB)) or 0)
-		verified_users = int(self.db.scalar(select(func.count()).select_from(UserDB).where(UserDB.is_verified == True)) or 0)  # noqa: E712
+		"""Dashboard statistics, served from a short-TTL cache refreshed in the background.
+
+		The maintenance flag comes from the (separately cached) maintenance state, so it is
+		never older than its poll interval even when the rest of the payload is.
+		"""
+		settings = get_settings()
+		stats = _stats_cache.get(
+			self.db,
+			lambda db: AdminService(db).computeSystemStats(),
+			ttl=settings.admin_stats_ttl_seconds,
+			max_stale=settings.admin_stats_max_stale_seconds,
+		)
+		maintenance = maintenance_state_cache.get(self.db)
+		return {**stats, "maintenanceEnabled": maintenance.enabled, "maintenanceReason": maintenance.reason}
+
+	def computeSystemStats(self) -> dict:
+		"""Uncached dashboard statistics: a fixed number of queries regardless of table sizes."""
+		today = datetime.utcnow().date()
+		seven_days_ago = datetime.utcnow() - timedelta(days=7)
+
+		def _count(model, *where):
+			return select(func.count()).select_from(model).where(*where).scalar_subquery()
+
+		# Every total in one statement.
+		counts = self.db.execute(
+			select(
+				_count(UserDB).label("users"),
+				_count(StudentDB).label("students"),
+				_count(TeacherDB).label("teachers"),
+				_count(AdminDB).label("admins"),
+				_count(UserDB, UserDB.is_verified == True).label("verified"),  # noqa: E712
+				_count(UserDB, UserDB.created_at >= seven_days_ago).label("new_users_7d"),
+				_count(TestResultDB).label("test_results"),
+				_count(StudentAIContentDB, StudentAIContentDB.completed_at.is_not(None)).label("lessons_completed"),
+				_count(AssignmentDB).label("assignments"),
+				_count(StudentAIContentDB).label("ai_content"),
+			)
+		).one()
 
-		maintenance = self.getMaintenanceStatus()
 		last_perf = self.db.scalar(select(SystemPerformanceDB).order_by(SystemPerformanceDB.recorded_at.desc()).limit(1))
 		last_perf_out = None
 		if last_perf:
@@ -88,63 +198,61 @@ class AdminService:
 				"recordedAt": last_perf.recorded_at,
 			}
 
-		# New stats
-		seven_days_ago = datetime.utcnow() - timedelta(days=7)
-		new_users_7d = int(self.db.scalar(select(func.count()).select_from(UserDB).where(UserDB.created_at >= seven_days_ago)) or 0)
-
-		# Learning Activity
-		tests_completed = int(self.db.scalar(select(func.count()).select_from(TestResultDB)) or 0)
-		lessons_completed = int(self.db.scalar(select(func.count()).select_from(StudentAIContentDB).where(StudentAIContentDB.completed_at.is_not(None))) or 0)
-		assignments_created = int(self.db.scalar(select(func.count()).select_from(AssignmentDB)) or 0)
-		ai_content_generated = int(self.db.scalar(select(func.count()).select_from(StudentAIContentDB)) or 0)
-
-		# Usage History (Last 7 days)
+		# Usage History (Last 7 days): signups per day, activity from the daily_activity rollup
+		days = [today - timedelta(days=i) for i in range(6, -1, -1)]
+		since = datetime.combine(days[0], datetime.min.time())
+		new_users = self._countPerDay(UserDB.created_at, since)
+		activity = daily_totals(self.db, since=days[0])
 		history = []
-		today = datetime.utcnow().date()
-		for i in range(6, -1, -1):
-			day = today - timedelta(days=i)
-			day_start = datetime.combine(day, datetime.min.time())
-			day_end = datetime.combine(day, datetime.max.time())
-			
-			# Count activities for this day
-			new_users = self.db.scalar(select(func.count()).select_from(UserDB).where(UserDB.created_at >= day_start, UserDB.created_at <= day_end)) or 0
-			tests = self.db.scalar(select(func.count()).select_from(TestResultDB).where(TestResultDB.completed_at >= day_start, TestResultDB.completed_at <= day_end)) or 0
-			lessons = self.db.scalar(select(func.count()).select_from(StudentAIContentDB).where(StudentAIContentDB.completed_at >= day_start, StudentAIContentDB.completed_at <= day_end)) or 0
-			
+		for day in days:
+			key = day.strftime("%Y-%m-%d")
+			totals = activity.get(day, {})
 			history.append({
-				"date": day.strftime("%Y-%m-%d"),
+				"date": key,
 				"day": day.strftime("%a"),
-				"users": new_users,
-				"activity": tests + lessons
+				"users": new_users.get(key, 0),
+				"activity": totals.get("tests_completed", 0) + totals.get("content_completed", 0)
 			})
 
-		# Database statistics
-		db_stats = self._getDatabaseStats()
+		table_counts = {
+			"users": int(counts.users),
+			"students": int(counts.students),
+			"teachers": int(counts.teachers),
+			"test_results": int(counts.test_results),
+			"assignments": int(counts.assignments),
+			"ai_content": int(counts.ai_content),
+		}
+		maintenance = maintenance_state_cache.get(self.db)
 
 		return {
-			"totalUsers": total_users,
-			"totalStudents": total_students,
-			"totalTeachers": total_teachers,
-			"totalAdmins": total_admins,
-			"verifiedUsers": verified_users,
-			"maintenanceEnabled": bool(maintenance["enabled"]),
-			"maintenanceReason": maintenance.get("reason"),
+			"totalUsers": int(counts.users),
+			"totalStudents": int(counts.students),
+			"totalTeachers": int(counts.teachers),
+			"totalAdmins": int(counts.admins),
+			"verifiedUsers": int(counts.verified),
+			"maintenanceEnabled": maintenance.enabled,
+			"maintenanceReason": maintenance.reason,
 			"lastPerformance": last_perf_out,
-			"newUsers7d": new_users_7d,
+			"newUsers7d": int(counts.new_users_7d),
 			"learningActivity": {
-				"testsCompleted": tests_completed,
-				"lessonsCompleted": lessons_completed,
-				"assignmentsCreated": assignments_created,
-				"aiContentGenerated": ai_content_generated,
+				"testsCompleted": int(counts.test_results),
+				"lessonsCompleted": int(counts.lessons_completed),
+				"assignmentsCreated": int(counts.assignments),
+				"aiContentGenerated": int(counts.ai_content),
 			},
 			"usageHistory": history,
-			"databaseStats": db_stats,
+			"databaseStats": self._getDatabaseStats(table_counts),
 		}
 
-	def _getDatabaseStats(self) -> dict:
+	def _countPerDay(self, column, since: datetime) -> dict[str, int]:
+		"""{'YYYY-MM-DD': rows} for rows with `column` on or after `since`."""
+		day = func.date(column)
+		rows = self.db.execute(select(day, func.count()).where(column >= since).group_by(day)).all()
+		return {str(d): int(n) for d, n in rows if d is not None}
+
+	def _getDatabaseStats(self, table_counts: dict[str, int]) -> dict:
 		"""Calculate database statistics including size, table counts, and connection info."""
 		import os
-		from app.config.settings import get_settings
 		
 		settings = get_settings()
 		db_url = settings.database_url
@@ -160,23 +268,8 @@ class AdminService:
 			except Exception:
 				pass
 		
-		# Count total records across key tables
-		total_records = 0
-		table_counts = {}
-		try:
-			for model, name in [
-				(UserDB, "users"),
-				(StudentDB, "students"),
-				(TeacherDB, "teachers"),
-				(TestResultDB, "test_results"),
-				(AssignmentDB, "assignments"),
-				(StudentAIContentDB, "ai_content"),
-			]:
-				count = self.db.scalar(select(func.count()).select_from(model)) or 0
-				table_counts[name] = count
-				total_records += count
-		except Exception:
-			pass
+		# Key table counts come from the totals query
+		total_records = sum(table_counts.values())
 		
 		# Get last maintenance log as proxy for "last backup"
 		last_maintenance = self.db.scalar(
@@ -199,13 +292,11 @@ class AdminService:
 		}
 
 	def getMaintenanceStatus(self) -> dict:
-		open_log = self.db.scalar(select(MaintenanceLogDB).where(MaintenanceLogDB.end_time.is_(None)).order_by(MaintenanceLogDB.start_time.desc()).limit(1))
-		if not open_log:
-			return {"enabled": False, "reason": None, "announcement": None, "startedAt": None}
-		return {"enabled": True, "reason": open_log.reason, "announcement": open_log.announcement, "startedAt": open_log.start_time}
+		# Admin views read the database (and refresh this worker's cached flag on the way).
+		return maintenance_state_cache.refresh(self.db).as_dict()
 
 	def setMaintenanceMode(self, *, enabled: bool, adminUserId: int, reason: str | None = None, announcement: str | None = None) -> dict:
-		admin_pk = self.db.scalar(select(AdminDB.id).where(AdminDB.user_id == int(adminUserId)))
+		admin_pk = admin_id_for_user(self.db, int(adminUserId))
 		if not admin_pk:
 			raise ValueError("Admin profile not found")
 
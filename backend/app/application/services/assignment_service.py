@@ -8,20 +8,21 @@ from sqlalchemy.orm import Session
 
 from app.domain.enums import AssignmentStatus
 from app.infrastructure.db.models.assignments import AssignmentDB, AssignmentQuestionDB, StudentAssignmentAnswerDB, StudentAssignmentDB
-from app.infrastructure.db.models.user import StudentDB, TeacherDB
+from app.infrastructure.db.identity import student_id_for_user, teacher_id_for_user
+from app.infrastructure.repositories.cached_progress_repository import invalidate_progress_cache
 
 class AssignmentService:
 	def __init__(self, db: Session):
 		self.db = db
 
 	def _teacher_pk_from_user(self, teacherUserId: int) -> int:
-		teacher_pk = self.db.scalar(select(TeacherDB.id).where(TeacherDB.user_id == int(teacherUserId)))
+		teacher_pk = teacher_id_for_user(self.db, int(teacherUserId))
 		if not teacher_pk:
 			raise ValueError("Teacher profile not found")
 		return int(teacher_pk)
 
 	def _student_pk_from_user(self, studentUserId: int) -> int:
-		student_pk = self.db.scalar(select(StudentDB.id).where(StudentDB.user_id == int(studentUserId)))
+		student_pk = student_id_for_user(self.db, int(studentUserId))
 		if not student_pk:
 			raise ValueError("Student profile not found")
 		return int(student_pk)
@@ -229,6 +230,7 @@ class AssignmentService:
 		row.submitted_at = datetime.utcnow()
 		row.score = int(score_100)
 		self.db.commit()
+		invalidate_progress_cache(self.db, int(row.student_id))
 		self.db.refresh(row)
 		return row, int(score_100), 100, breakdown
 
@@ -298,5 +300,6 @@ class AssignmentService:
 		row.status = AssignmentStatus.GRADED
 		row.score = int(score)
 		self.db.commit()
+		invalidate_progress_cache(self.db, int(row.student_id))
 		self.db.refresh(row)
 		return row
@@ -13,32 +13,107 @@ This service aggregates student data to provide the chatbot with full context:
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import Any
 
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import Session
 
 from app.domain.enums import LanguageLevel
+from app.infrastructure.db.context_versions import get_student_context_version
 from app.infrastructure.db.models.content import LessonPlanDB
 from app.infrastructure.db.models.feedback import FeedbackDB
-from app.infrastructure.db.models.progress import ProgressDB
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
 from app.infrastructure.db.models.user import StudentDB, UserDB
+from app.infrastructure.db.streaks import current_streak
+from app.infrastructure.repositories.sqlalchemy_progress_repository import SqlAlchemyProgressRepository
 from app.application.services.teacher_directive_service import TeacherDirectiveService
 
 
+@dataclass(frozen=True)
+class CachedStudentContext:
+    version: int
+    # UTC day it was built on: the streak in it lapses at day rollover without any write.
+    built_on: date
+    context: dict[str, Any]
+    prompt_text: str
+
+
+class _StudentContextCache:
+    """Process-wide LRU of built contexts, validated against StudentContextVersionDB and the UTC day."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, CachedStudentContext] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, student_id: int, version: int, today: date) -> CachedStudentContext | None:
+        with self._lock:
+            entry = self._entries.get(student_id)
+            if entry is None or entry.version != version or entry.built_on != today:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(student_id)
+            self.hits += 1
+            return entry
+
+    def put(self, student_id: int, entry: CachedStudentContext) -> None:
+        with self._lock:
+            self._entries[student_id] = entry
+            self._entries.move_to_end(student_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_context_cache = _StudentContextCache()
+
+
 class ChatbotContextService:
     """Builds context for chatbot LLM prompts based on student data."""
 
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def build_student_context(self, student_id: int) -> dict[str, Any]:
+    def get_student_context(self, student_id: int) -> CachedStudentContext:
+        """Cached build_student_context + format_context_for_prompt.
+
+        Rebuilt only when the student's context version changed (test results, plan,
+        AI content completion, feedback, teacher directives or profile writes), and once
+        per UTC day so the daily streak stays current.
+        """
+        version = get_student_context_version(self.db, student_id)
+        today = datetime.utcnow().date()
+        cached = _context_cache.get(student_id, version, today)
+        if cached is not None:
+            return cached
+
+        context = self.build_student_context(student_id, today=today)
+        entry = CachedStudentContext(
+            version=version,
+            built_on=today,
+            context=context,
+            prompt_text=self.format_context_for_prompt(context),
+        )
+        if "error" not in context:
+            _context_cache.put(student_id, entry)
+        return entry
+
+    def build_student_context(self, student_id: int, today: date | None = None) -> dict[str, Any]:
         """Build comprehensive context for a student.
 
         Args:
             student_id: The student.id (not user_id)
+            today: UTC day the daily streak is evaluated for (default: today)
 
         Returns:
             Dictionary containing all relevant student context for the chatbot
@@ -57,7 +132,7 @@ class ChatbotContextService:
             "student_id": student_id,
             "enrollment_date": student.enrollment_date.isoformat() if student.enrollment_date else None,
             "overall_level": student.level.value if student.level else "Not assessed",
-            "daily_streak": student.daily_streak,
+            "daily_streak": current_streak(student, today),
             "total_points": student.total_points,
         }
 
@@ -78,6 +153,9 @@ class ChatbotContextService:
         context["strengths"] = sw["strengths"]
         context["weaknesses"] = sw["weaknesses"]
 
+        # Get progress summary
+        context["progress"] = self._get_progress(student_id)
+
         # Get AI content stats
         content_stats = self._get_ai_content_stats(student_id)
         context["ai_content_stats"] = content_stats
@@ -243,6 +321,19 @@ class ChatbotContextService:
 
         return {"strengths": strengths, "weaknesses": weaknesses}
 
+    def _get_progress(self, student_id: int) -> dict[str, Any]:
+        """Correct answer rate and completed lesson/test counts from the progress row."""
+        # Uncached: the built context is kept until the next version bump, not just a TTL.
+        progress = SqlAlchemyProgressRepository(self.db).fetch_progress(student_id)
+        if not progress:
+            return {"exists": False}
+        return {
+            "exists": True,
+            "correct_answer_rate": progress.correct_answer_rate,
+            "completed_lessons": len(progress.completed_lessons),
+            "completed_tests": len(progress.completed_tests),
+        }
+
     def _get_ai_content_stats(self, student_id: int) -> dict[str, Any]:
         """Get AI content completion stats and recent feedbacks."""
         total = self.db.scalar(
@@ -408,6 +499,14 @@ class ChatbotContextService:
         else:
             lines.append("- Not assessed yet")
 
+        progress = context.get("progress", {})
+        if progress.get("exists"):
+            lines.append("")
+            lines.append("## Progress")
+            lines.append(f"- Correct Answer Rate: {round(progress.get('correct_answer_rate', 0.0) * 100)}%")
+            lines.append(f"- Completed Lessons: {progress.get('completed_lessons', 0)}")
+            lines.append(f"- Completed Tests: {progress.get('completed_tests', 0)}")
+
         lines.append("")
         lines.append("## AI Content Progress")
         stats = context.get("ai_content_stats", {})
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import json
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterator, Literal
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.application.services.chatbot_context_service import ChatbotContextService
 from app.config.settings import get_settings
@@ -14,7 +20,111 @@ from app.infrastructure.external.llm.factory import get_llm_client
 from app.infrastructure.external.llm.types import LLMChatRequest, LLMMessage
 
 
+logger = logging.getLogger(__name__)
+
+# Summaries are folded off the request path, one at a time per session.
+_summary_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chat-summary")
+_summaries_in_flight: set[int] = set()
+_summary_lock = threading.Lock()
+
+_LLM_ERROR_REPLY = (
+    "I'm having trouble processing your request right now. "
+    "Please try rephrasing your question or contact support if the issue persists."
+)
+
+
+def _unsent_tail(final: str, sent: str) -> str:
+    """Part of `final` the client has not been streamed yet ("" if `sent` is not its prefix)."""
+    # The final reply is stripped, the streamed text is not (e.g. leading newlines).
+    for prefix in (sent, sent.strip()):
+        if final.startswith(prefix):
+            return final[len(prefix):]
+    return ""
+
+
+@dataclass(frozen=True)
+class ChatbotStreamEvent:
+    type: Literal["delta", "done"]
+    text: str
+
+
+class _MessageFieldStreamer:
+    """Incrementally extracts what the user should see from a streamed LLM reply.
+
+    Plain-text replies pass through unchanged. JSON replies (the structured format in
+    the system prompt) only yield the decoded value of the "message" string field.
+    """
+
+    _ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._mode: Literal["detect", "plain", "json"] = "detect"
+        self._pos = 0  # next undecoded index in _buf (json mode)
+        self._in_value = False
+        self._closed = False
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        if self._mode == "detect":
+            head = self._buf.lstrip()
+            if not head:
+                return ""
+            self._mode = "json" if head.startswith("{") else "plain"
+            if self._mode == "plain":
+                return self._buf
+        if self._mode == "plain":
+            return chunk
+        return self._drain_json()
+
+    def _drain_json(self) -> str:
+        if self._closed:
+            return ""
+        if not self._in_value:
+            match = re.search(r'"message"\s*:\s*"', self._buf)
+            if not match:
+                return ""
+            self._in_value = True
+            self._pos = match.end()
+
+        out: list[str] = []
+        buf = self._buf
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._closed = True
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(buf):
+                break  # escape split across chunks
+            esc = buf[i + 1]
+            if esc == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    out.append(chr(int(buf[i + 2 : i + 6], 16)))
+                except ValueError:
+                    pass
+                i += 6
+                continue
+            out.append(self._ESCAPES.get(esc, esc))
+            i += 2
+        self._pos = i
+        return "".join(out)
+
+
 class ChatbotService:
+    # Turns sent verbatim to the LLM; older turns are folded into ChatSessionDB.summary.
+    HISTORY_WINDOW = 10
+    # Fold once this many turns have fallen out of the window (keeps summarisation calls rare).
+    SUMMARY_BATCH = 10
+    SUMMARY_MAX_CHARS = 2000
+
     def __init__(self, db: Session, llm_client: LLMClient | None = None) -> None:
         self.db = db
         self.context_service = ChatbotContextService(db)
@@ -47,13 +157,69 @@ class ChatbotService:
             return "Error: Session not found."
 
         student_id = session.student_id
+        request = self._build_request(session, message)
 
-        # Build comprehensive student context
-        context = self.context_service.build_student_context(student_id)
-        context_text = self.context_service.format_context_for_prompt(context)
+        # Call LLM
+        try:
+            response = self.llm_client.generate(request)
+            return self._finalize_reply(student_id, response.text.strip())
+        except Exception:
+            logger.exception("Chatbot LLM call failed (session=%s)", sessionId)
+            return _LLM_ERROR_REPLY
+
+    def processMessageStream(self, sessionId: int, message: str) -> Iterator[ChatbotStreamEvent]:
+        """Streaming variant of processMessage.
+
+        Yields "delta" events while the LLM generates. If the model answers with the
+        structured JSON format, only the "message" field is streamed. The last event is
+        "done" with the final reply text (including any learning-plan update notice),
+        which is what callers should persist.
+        """
+        session = self.db.get(ChatSessionDB, sessionId)
+        if not session:
+            yield ChatbotStreamEvent(type="done", text="Error: Session not found.")
+            return
 
-        # Get conversation history for this session
-        history = self.getChatHistory(sessionId)
+        student_id = session.student_id
+        request = self._build_request(session, message)
+
+        buffer: list[str] = []
+        streamer = _MessageFieldStreamer()
+        emitted: list[str] = []
+        try:
+            for chunk in self.llm_client.generate_stream(request):
+                buffer.append(chunk)
+                delta = streamer.feed(chunk)
+                if delta:
+                    emitted.append(delta)
+                    yield ChatbotStreamEvent(type="delta", text=delta)
+            final = self._finalize_reply(student_id, "".join(buffer).strip())
+        except Exception:
+            logger.exception("Chatbot LLM call failed (session=%s, streaming)", sessionId)
+            final = _LLM_ERROR_REPLY
+
+        # Emit whatever the client has not seen yet (e.g. the plan update notice). If the
+        # streamed text is not a prefix of the final reply, "done" carries the reply instead.
+        tail = _unsent_tail(final, "".join(emitted))
+        if tail:
+            yield ChatbotStreamEvent(type="delta", text=tail)
+        yield ChatbotStreamEvent(type="done", text=final)
+
+    def _build_request(self, session: ChatSessionDB, message: str) -> LLMChatRequest:
+        # Build comprehensive student context (cached until the student's data changes)
+        context_text = self.context_service.get_student_context(session.student_id).prompt_text
+
+        # Bounded read: the last HISTORY_WINDOW turns not yet folded into session.summary
+        # (+1 for the current message). Older unfolded turns wait for refreshSummary.
+        history = self.getRecentMessages(
+            session.id,
+            self.HISTORY_WINDOW + 1,
+            after_message_id=session.summary_through_message_id,
+        )
+        # The controller persists the user message before calling us; it is appended below.
+        if history and history[-1].sender == "user" and history[-1].content == message:
+            history = history[:-1]
+        history = history[-self.HISTORY_WINDOW:]
 
         # Build messages for LLM
         messages: list[LLMMessage] = []
@@ -62,54 +228,53 @@ class ChatbotService:
         system_prompt = self._build_system_prompt(context_text)
         messages.append(LLMMessage(role="system", content=system_prompt))
 
-        # Add conversation history (last 10 messages to avoid token limits)
-        for msg in history[-10:]:
+        if session.summary:
+            messages.append(
+                LLMMessage(role="system", content=f"## Earlier in this conversation (summary)\n{session.summary}")
+            )
+
+        # Add recent conversation history
+        for msg in history:
             role = "assistant" if msg.sender == "bot" else "user"
             messages.append(LLMMessage(role=role, content=msg.content))
 
         # Add current user message
         messages.append(LLMMessage(role="user", content=message))
 
-        # Call LLM
+        return LLMChatRequest(
+            messages=messages,
+            temperature=0.7,  # More conversational
+            max_output_tokens=1024,
+            lane="chat",
+        )
+
+    def _finalize_reply(self, student_id: int, response_text: str) -> str:
+        """Turn the raw LLM output into the reply text, applying structured actions."""
+        # Try to parse JSON response for structured actions
         try:
-            request = LLMChatRequest(
-                messages=messages,
-                temperature=0.7,  # More conversational
-                max_output_tokens=1024,
-            )
-            response = self.llm_client.generate(request)
-            
-            # Try to parse JSON response for structured actions
-            response_text = response.text.strip()
-            try:
-                parsed = json.loads(response_text)
-                
-                # Check if LLM wants to update learning plan
-                if parsed.get("action") == "update_learning_plan":
-                    plan_updates = parsed.get("plan_updates", {})
-                    update_result = self._update_learning_plan(student_id, plan_updates)
-                    
-                    # Return the response message with update confirmation
-                    bot_message = parsed.get("message", "I've updated your learning plan.")
-                    if update_result.get("success"):
-                        bot_message += f"\n\n✓ {update_result.get('message', 'Plan updated successfully.')}"
-                    else:
-                        bot_message += f"\n\n⚠ {update_result.get('message', 'Could not update plan.')}"
-                    
-                    return bot_message
-                
-                # Return the message from structured response
-                return parsed.get("message", response_text)
-            except json.JSONDecodeError:
-                # Not JSON, return as-is
-                return response_text
-                
-        except Exception as e:
-            print(f"Error calling LLM: {e}")
-            return (
-                "I'm having trouble processing your request right now. "
-                "Please try rephrasing your question or contact support if the issue persists."
-            )
+            parsed = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Not JSON, return as-is
+            return response_text
+        if not isinstance(parsed, dict):
+            return response_text
+
+        # Check if LLM wants to update learning plan
+        if parsed.get("action") == "update_learning_plan":
+            plan_updates = parsed.get("plan_updates", {})
+            update_result = self._update_learning_plan(student_id, plan_updates)
+
+            # Return the response message with update confirmation
+            bot_message = parsed.get("message", "I've updated your learning plan.")
+            if update_result.get("success"):
+                bot_message += f"\n\n✓ {update_result.get('message', 'Plan updated successfully.')}"
+            else:
+                bot_message += f"\n\n⚠ {update_result.get('message', 'Could not update plan.')}"
+
+            return bot_message
+
+        # Return the message from structured response
+        return parsed.get("message", response_text)
 
     def saveMessage(self, sessionId: int, *, sender: str, content: str) -> ChatMessageDB:
         msg = ChatMessageDB(session_id=sessionId, sender=sender, content=content, timestamp=datetime.utcnow())
@@ -132,6 +297,114 @@ class ChatbotService:
             return
         self.endSession(session.id)
 
+    def getRecentMessages(
+        self, sessionId: int, limit: int, *, after_message_id: int | None = None
+    ) -> list[ChatMessageDB]:
+        """Last `limit` messages of a session, oldest first (single LIMIT query)."""
+        stmt = select(ChatMessageDB).where(ChatMessageDB.session_id == sessionId)
+        if after_message_id:
+            stmt = stmt.where(ChatMessageDB.id > after_message_id)
+        rows = list(
+            self.db.scalars(
+                stmt.order_by(ChatMessageDB.timestamp.desc(), ChatMessageDB.id.desc()).limit(limit)
+            ).all()
+        )
+        rows.reverse()
+        return rows
+
+    def scheduleSummaryRefresh(self, sessionId: int) -> None:
+        """Fold old turns into the session summary in the background, if enough piled up."""
+        session_factory = sessionmaker(bind=self.db.get_bind(), autoflush=False)
+        llm_client = self.llm_client
+        with _summary_lock:
+            if sessionId in _summaries_in_flight:
+                return
+            _summaries_in_flight.add(sessionId)
+
+        def _run() -> None:
+            db = session_factory()
+            try:
+                ChatbotService(db, llm_client=llm_client).refreshSummary(sessionId)
+            except Exception as e:
+                db.rollback()
+                logger.warning("Chat summary refresh failed (session=%s): %s", sessionId, e)
+            finally:
+                db.close()
+                with _summary_lock:
+                    _summaries_in_flight.discard(sessionId)
+
+        _summary_executor.submit(_run)
+
+    def refreshSummary(self, sessionId: int) -> bool:
+        """Fold turns older than HISTORY_WINDOW into ChatSessionDB.summary.
+
+        Returns True if the summary was updated.
+        """
+        session = self.db.get(ChatSessionDB, sessionId)
+        if not session:
+            return False
+        through = int(session.summary_through_message_id or 0)
+        pending = self.db.scalar(
+            select(func.count(ChatMessageDB.id)).where(
+                ChatMessageDB.session_id == sessionId, ChatMessageDB.id > through
+            )
+        ) or 0
+        to_fold = int(pending) - self.HISTORY_WINDOW
+        if to_fold < self.SUMMARY_BATCH:
+            return False
+
+        turns = list(
+            self.db.scalars(
+                select(ChatMessageDB)
+                .where(ChatMessageDB.session_id == sessionId, ChatMessageDB.id > through)
+                .order_by(ChatMessageDB.id.asc())
+                .limit(to_fold)
+            ).all()
+        )
+        if not turns:
+            return False
+
+        transcript = "\n".join(
+            f"{'Tutor' if m.sender == 'bot' else 'Student'}: {m.content}" for m in turns
+        )
+        prompt = (
+            "Update the running summary of a tutoring conversation between an English tutor and a student.\n"
+            "Keep facts the tutor needs later: the student's goals, questions asked, explanations given, "
+            "mistakes noticed, and any agreed plan changes. Be concise (max 150 words).\n\n"
+            f"Current summary:\n{session.summary or '(none)'}\n\n"
+            f"New turns to fold in:\n{transcript}\n\n"
+            'Return ONLY JSON: {"summary": "..."}'
+        )
+        response = self.llm_client.generate(
+            LLMChatRequest(
+                messages=[
+                    LLMMessage(role="system", content="You summarise conversations. Output strict JSON."),
+                    LLMMessage(role="user", content=prompt),
+                ],
+                temperature=0.2,
+                max_output_tokens=512,
+                lane="background",
+            )
+        )
+        summary = self._parse_summary(response.text)
+        if not summary:
+            return False
+
+        session.summary = summary[: self.SUMMARY_MAX_CHARS]
+        session.summary_through_message_id = int(turns[-1].id)
+        self.db.commit()
+        return True
+
+    def _parse_summary(self, text: str) -> str:
+        text = (text or "").strip()
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            return text
+        if isinstance(parsed, dict):
+            return str(parsed.get("summary") or "").strip()
+        return text
+
     def getChatHistory(self, sessionId: int) -> list[ChatMessageDB]:
         return list(
             self.db.scalars(
@@ -0,0 +1,363 @@
+"""Persistent background jobs for slow AI work.
+
+Endpoints that would otherwise hold a request open for tens of seconds (speaking
+analysis, placement scoring, content completion feedback) can enqueue a JobDB row and
+answer 202 with its id. A small in-process worker pool claims due jobs from the table,
+runs the handler registered for the job type and stores the JSON result. Because the
+queue lives in the database, queued work survives restarts, and jobs that were running
+when a process died are picked up again once their heartbeat goes stale.
+
+Handlers raise ValueError / LookupError / PermissionError for problems retrying cannot
+fix; any other exception is retried with exponential backoff up to `max_attempts`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import exists, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.job import JobDB
+
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+# Errors that would fail the same way on every attempt (mirrors the 4xx mapping in routes).
+PERMANENT_ERRORS: tuple[type[BaseException], ...] = (ValueError, LookupError, PermissionError)
+
+JobHandler = Callable[[Session, dict[str, Any], JobDB], dict[str, Any]]
+_HANDLERS: dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Decorator registering the function that executes jobs of `job_type`."""
+
+    def _register(fn: JobHandler) -> JobHandler:
+        _HANDLERS[job_type] = fn
+        return fn
+
+    return _register
+
+
+def get_job_handler(job_type: str) -> JobHandler | None:
+    return _HANDLERS.get(job_type)
+
+
+def retry_delay_seconds(attempt: int, base_seconds: float = 5.0, max_seconds: float = 300.0) -> float:
+    """Exponential backoff after the given (1-based) failed attempt."""
+    return min(max_seconds, base_seconds * (2 ** max(0, attempt - 1)))
+
+
+def _utcnow() -> datetime:
+    # Naive UTC, matching func.now() on SQLite.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class JobView:
+    id: int
+    jobType: str
+    status: str
+    attempts: int
+    maxAttempts: int
+    result: dict[str, Any] | None
+    error: str | None
+    createdAt: datetime
+    startedAt: datetime | None
+    finishedAt: datetime | None
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+class JobService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self,
+        job_type: str,
+        payload: dict[str, Any],
+        *,
+        user_id: int | None = None,
+        blob: bytes | None = None,
+        max_attempts: int = 3,
+    ) -> JobDB:
+        if job_type not in _HANDLERS:
+            raise ValueError(f"Unknown job type: {job_type}")
+        job = JobDB(
+            job_type=job_type,
+            status=JOB_QUEUED,
+            user_id=user_id,
+            payload_json=json.dumps(payload),
+            payload_blob=blob,
+            max_attempts=max(1, int(max_attempts)),
+            run_after=_utcnow(),
+        )
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        notify_job_runner()
+        return job
+
+    def enqueue_unique(self, job_type: str, payload: dict[str, Any], *, max_attempts: int = 3) -> JobDB | None:
+        """Queue a job unless one of the same type is already queued or running.
+
+        The existence check and the insert are one statement, so workers scheduling the same
+        periodic job at the same time still end up with a single row. Returns None when skipped.
+        """
+        if job_type not in _HANDLERS:
+            raise ValueError(f"Unknown job type: {job_type}")
+        pending = select(JobDB.id).where(JobDB.job_type == job_type, JobDB.status.in_((JOB_QUEUED, JOB_RUNNING)))
+        row = select(
+            literal(job_type),
+            literal(JOB_QUEUED),
+            literal(json.dumps(payload)),
+            literal(0),
+            literal(max(1, int(max_attempts))),
+            literal(_utcnow()),
+        ).where(~exists(pending))
+        inserted = self.db.execute(
+            insert(JobDB).from_select(
+                ["job_type", "status", "payload_json", "attempts", "max_attempts", "run_after"], row
+            )
+        ).rowcount
+        self.db.commit()
+        if not inserted:
+            return None
+        notify_job_runner()
+        return self.db.scalar(
+            select(JobDB).where(JobDB.job_type == job_type, JobDB.status == JOB_QUEUED).order_by(JobDB.id.desc()).limit(1)
+        )
+
+    def getJob(self, jobId: int) -> JobDB | None:
+        return self.db.get(JobDB, int(jobId))
+
+    def getJobForUser(self, jobId: int, userId: int, *, is_admin: bool = False) -> JobDB | None:
+        """Jobs are only visible to the user who created them (and admins)."""
+        job = self.getJob(jobId)
+        if job is None or (not is_admin and job.user_id != int(userId)):
+            return None
+        return job
+
+    @staticmethod
+    def to_view(job: JobDB) -> JobView:
+        result = None
+        if job.result_json:
+            try:
+                result = json.loads(job.result_json)
+            except Exception:
+                result = None
+        return JobView(
+            id=int(job.id),
+            jobType=job.job_type,
+            status=job.status,
+            attempts=int(job.attempts or 0),
+            maxAttempts=int(job.max_attempts or 0),
+            result=result,
+            error=job.error,
+            createdAt=job.created_at,
+            startedAt=job.started_at,
+            finishedAt=job.finished_at,
+        )
+
+    # ---- worker side ----
+
+    def claim_next(self, worker_id: str) -> JobDB | None:
+        """Atomically move one due queued job to running. Safe across threads and processes."""
+        now = _utcnow()
+        candidates = self.db.scalars(
+            select(JobDB.id)
+            .where(JobDB.status == JOB_QUEUED, JobDB.run_after <= now)
+            .order_by(JobDB.run_after, JobDB.id)
+            .limit(5)
+        ).all()
+        for job_id in candidates:
+            claimed = self.db.execute(
+                update(JobDB)
+                .where(JobDB.id == job_id, JobDB.status == JOB_QUEUED)
+                .values(
+                    status=JOB_RUNNING,
+                    attempts=JobDB.attempts + 1,
+                    locked_by=worker_id,
+                    started_at=now,
+                    heartbeat_at=now,
+                    updated_at=now,
+                )
+            ).rowcount
+            self.db.commit()
+            if claimed:
+                return self.db.get(JobDB, job_id, populate_existing=True)
+        return None
+
+    def run(self, job: JobDB) -> JobDB:
+        """Execute a claimed job and record the outcome."""
+        handler = _HANDLERS.get(job.job_type)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job type {job.job_type!r}")
+            payload = json.loads(job.payload_json or "{}")
+            result = handler(self.db, payload, job)
+        except Exception as e:
+            self.db.rollback()
+            self._record_failure(job, e)
+            return job
+
+        job.status = JOB_SUCCEEDED
+        job.result_json = json.dumps(result, default=str)
+        job.error = None
+        job.payload_blob = None
+        job.locked_by = None
+        job.finished_at = _utcnow()
+        self.db.commit()
+        return job
+
+    def heartbeat(self, worker_id: str) -> None:
+        self.db.execute(
+            update(JobDB)
+            .where(JobDB.status == JOB_RUNNING, JobDB.locked_by == worker_id)
+            .values(heartbeat_at=_utcnow())
+        )
+        self.db.commit()
+
+    def requeue_stale(self, stale_after_seconds: float) -> int:
+        """Return jobs whose worker stopped heartbeating (e.g. the process restarted) to the queue."""
+        cutoff = _utcnow() - timedelta(seconds=stale_after_seconds)
+        stale = self.db.scalars(
+            select(JobDB).where(JobDB.status == JOB_RUNNING, JobDB.heartbeat_at < cutoff)
+        ).all()
+        for job in stale:
+            logger.warning("Job %s (%s) was interrupted on %s; requeueing", job.id, job.job_type, job.locked_by)
+            self._record_failure(job, RuntimeError("Worker stopped before the job finished"), commit=False)
+        self.db.commit()
+        return len(stale)
+
+    def _record_failure(self, job: JobDB, error: Exception, *, commit: bool = True) -> None:
+        attempts = int(job.attempts or 0)
+        permanent = isinstance(error, PERMANENT_ERRORS)
+        job.error = str(error) or error.__class__.__name__
+        job.locked_by = None
+        if permanent or attempts >= int(job.max_attempts or 1):
+            job.status = JOB_FAILED
+            job.finished_at = _utcnow()
+            job.payload_blob = None
+            logger.error("Job %s (%s) failed after %s attempt(s): %s", job.id, job.job_type, attempts, job.error)
+        else:
+            job.status = JOB_QUEUED
+            job.run_after = _utcnow() + timedelta(seconds=retry_delay_seconds(attempts))
+            logger.warning("Job %s (%s) attempt %s failed, retrying: %s", job.id, job.job_type, attempts, job.error)
+        if commit:
+            self.db.commit()
+
+
+class JobRunner:
+    """In-process worker pool draining the jobs table."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        workers: int = 2,
+        poll_interval_seconds: float = 1.0,
+        stale_after_seconds: float = 60.0,
+    ):
+        self.session_factory = session_factory
+        self.workers = max(1, int(workers))
+        self.poll_interval_seconds = max(0.05, float(poll_interval_seconds))
+        self.stale_after_seconds = max(self.poll_interval_seconds * 3, float(stale_after_seconds))
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        global _active_runner
+        if self._threads:
+            return
+        self._stop.clear()
+        # Jobs left running by a previous process are requeued by the first maintenance pass.
+        targets = [(self._maintain_loop, "job-maintenance")]
+        targets += [(self._work_loop, f"job-worker-{i}") for i in range(self.workers)]
+        for target, name in targets:
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self._threads.append(t)
+        _active_runner = self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        global _active_runner
+        if _active_runner is self:
+            _active_runner = None
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def run_once(self) -> JobDB | None:
+        """Claim and execute at most one due job. Returns the job, or None if the queue was empty."""
+        db = self.session_factory()
+        try:
+            service = JobService(db)
+            job = service.claim_next(self.worker_id)
+            if job is None:
+                return None
+            return service.run(job)
+        except Exception as e:
+            db.rollback()
+            logger.error("Job worker error: %s", str(e), exc_info=True)
+            return None
+        finally:
+            db.close()
+
+    def maintain(self) -> None:
+        """Heartbeat our running jobs and requeue jobs abandoned by dead workers."""
+        db = self.session_factory()
+        try:
+            service = JobService(db)
+            service.heartbeat(self.worker_id)
+            service.requeue_stale(self.stale_after_seconds)
+        except Exception as e:
+            db.rollback()
+            logger.warning("Job maintenance failed: %s", str(e))
+        finally:
+            db.close()
+
+    def _work_loop(self) -> None:
+        while not self._stop.is_set():
+            if self.run_once() is not None:
+                continue
+            self._wake.wait(self.poll_interval_seconds)
+            self._wake.clear()
+
+    def _maintain_loop(self) -> None:
+        # A separate thread so heartbeats keep flowing while every worker is busy in a handler.
+        while not self._stop.is_set():
+            self.maintain()
+            self._stop.wait(self.stale_after_seconds / 3)
+
+
+_active_runner: JobRunner | None = None
+
+
+def notify_job_runner() -> None:
+    """Wake the in-process worker pool (no-op when none is running, e.g. in scripts)."""
+    if _active_runner is not None:
+        _active_runner.notify()
@@ -0,0 +1,291 @@
+"""Pre-generated listening question bank.
+
+Question sets are generated once per (transcript, level) from the audio files
+known to AudioFileManager, validated, and stored in ListeningQuestionDB keyed by
+`bank_key`. Starting a placement test only samples from the bank, so no LLM call
+happens on the request path. A refill (CLI script or background job) tops the
+bank up whenever new audio files appear or earlier generations failed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.domain.enums import LanguageLevel
+from app.infrastructure.db.models.tests import ListeningQuestionDB
+from app.infrastructure.external.audio_manager import AudioFile, AudioFileManager
+from app.application.services.job_service import JobService, register_job_handler
+from app.application.services.listening_question_generator_service import ListeningQuestionGeneratorService
+
+
+logger = logging.getLogger(__name__)
+
+PLACEMENT_LEVELS: tuple[LanguageLevel, ...] = (
+    LanguageLevel.A1,
+    LanguageLevel.A2,
+    LanguageLevel.B1,
+    LanguageLevel.B2,
+)
+QUESTIONS_PER_SET = 3
+
+
+def bank_key_for(script: str, level: LanguageLevel) -> str:
+    """Stable key for a question set: sha256 of level + normalized transcript."""
+    normalized = " ".join((script or "").split())
+    return hashlib.sha256(f"{level.value}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class BankRefillReport:
+    scanned: int
+    generated: int
+    already_banked: int
+    failed: int
+
+
+class ListeningQuestionBankService:
+    def __init__(
+        self,
+        db: Session,
+        audio_manager: AudioFileManager | None = None,
+        question_generator: ListeningQuestionGeneratorService | None = None,
+    ):
+        self.db = db
+        self.audio_manager = audio_manager or AudioFileManager()
+        # Created lazily: sampling never needs an LLM client.
+        self._question_generator = question_generator
+
+    @property
+    def question_generator(self) -> ListeningQuestionGeneratorService:
+        if self._question_generator is None:
+            self._question_generator = ListeningQuestionGeneratorService()
+        return self._question_generator
+
+    # ---- refill ----
+
+    def refill(self, max_new_sets: int | None = None) -> BankRefillReport:
+        """Generate and store question sets for every audio file not yet in the bank."""
+        audio_files = self.audio_manager.get_all()
+        banked = self.banked_keys()
+        generated = already = failed = 0
+
+        for audio_file in audio_files:
+            key = bank_key_for(audio_file.script, audio_file.level)
+            if key in banked:
+                already += 1
+                continue
+            if max_new_sets is not None and generated >= max_new_sets:
+                break
+
+            questions = self.question_generator.generate_validated_questions(
+                script=audio_file.script,
+                level=audio_file.level,
+                num_questions=QUESTIONS_PER_SET,
+            )
+            questions = self._validate_set(questions)
+            if questions is None:
+                logger.warning(
+                    "Listening bank: rejected generated set (level=%s, audio=%s)",
+                    audio_file.level.value,
+                    audio_file.filename,
+                )
+                failed += 1
+                continue
+
+            # Another refill may have stored the same set meanwhile.
+            if self._has_set(key):
+                already += 1
+                continue
+
+            self._store_set(key, audio_file, questions)
+            banked.add(key)
+            generated += 1
+            logger.info(
+                "Listening bank: stored set (level=%s, audio=%s, key=%s)",
+                audio_file.level.value,
+                audio_file.filename,
+                key[:12],
+            )
+
+        return BankRefillReport(
+            scanned=len(audio_files),
+            generated=generated,
+            already_banked=already,
+            failed=failed,
+        )
+
+    def banked_keys(self) -> set[str]:
+        rows = self.db.scalars(
+            select(ListeningQuestionDB.bank_key).where(ListeningQuestionDB.bank_key.is_not(None)).distinct()
+        ).all()
+        return {str(k) for k in rows}
+
+    def set_counts_by_level(self) -> dict[LanguageLevel, int]:
+        rows = self.db.execute(
+            select(ListeningQuestionDB.difficulty, func.count(func.distinct(ListeningQuestionDB.bank_key)))
+            .where(ListeningQuestionDB.bank_key.is_not(None))
+            .group_by(ListeningQuestionDB.difficulty)
+        ).all()
+        return {level: int(count) for level, count in rows}
+
+    def _has_set(self, key: str) -> bool:
+        return self.db.scalar(select(ListeningQuestionDB.id).where(ListeningQuestionDB.bank_key == key).limit(1)) is not None
+
+    def _validate_set(self, questions: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        if len(questions) < QUESTIONS_PER_SET:
+            return None
+        seen: set[str] = set()
+        for q in questions:
+            text = q["question"].strip().lower()
+            if text in seen:
+                return None
+            seen.add(text)
+            if len(set(q["options"])) != len(q["options"]):
+                return None
+        return questions[:QUESTIONS_PER_SET]
+
+    def _store_set(self, key: str, audio_file: AudioFile, questions: list[dict[str, Any]]) -> None:
+        audio_url = self.audio_manager.get_audio_url(audio_file.filename)
+        for q in questions:
+            self.db.add(
+                ListeningQuestionDB(
+                    audio_url=audio_url,
+                    transcript=audio_file.script,
+                    question_text=q["question"],
+                    options_json=json.dumps(q["options"]),
+                    correct_answer=q["correct_answer"],
+                    difficulty=audio_file.level,
+                    bank_key=key,
+                )
+            )
+        self.db.commit()
+
+    # ---- sampling ----
+
+    def sample_placement_set(self) -> list[ListeningQuestionDB]:
+        """Pick one question set per placement level (A1-B2). Never calls the LLM.
+
+        Levels without a banked set use generic questions over a random audio file of that
+        level (the same shape the generator falls back to), so the test still has real audio
+        until the next refill fills the gap.
+        """
+        questions: list[ListeningQuestionDB] = []
+        for level in PLACEMENT_LEVELS:
+            rows = self._sample_banked(level)
+            if not rows:
+                rows = self._unbanked_for_level(level)
+            questions.extend(rows)
+        return questions
+
+    def _sample_banked(self, level: LanguageLevel) -> list[ListeningQuestionDB]:
+        keys = self.db.scalars(
+            select(ListeningQuestionDB.bank_key)
+            .where(ListeningQuestionDB.difficulty == level, ListeningQuestionDB.bank_key.is_not(None))
+            .distinct()
+        ).all()
+        if not keys:
+            return []
+        key = random.choice(list(keys))
+        return list(
+            self.db.scalars(
+                select(ListeningQuestionDB).where(ListeningQuestionDB.bank_key == key).order_by(ListeningQuestionDB.id)
+            ).all()
+        )
+
+    def _unbanked_for_level(self, level: LanguageLevel) -> list[ListeningQuestionDB]:
+        audio_list = self.audio_manager.get_random_by_level(level, count=1)
+        if not audio_list:
+            return []
+        audio_file = audio_list[0]
+        audio_url = self.audio_manager.get_audio_url(audio_file.filename)
+
+        existing = list(
+            self.db.scalars(
+                select(ListeningQuestionDB)
+                .where(ListeningQuestionDB.audio_url == audio_url, ListeningQuestionDB.bank_key.is_(None))
+                .order_by(ListeningQuestionDB.id)
+                .limit(QUESTIONS_PER_SET)
+            ).all()
+        )
+        if existing:
+            return existing
+
+        rows = []
+        for q in ListeningQuestionGeneratorService.fallback_questions(level):
+            row = ListeningQuestionDB(
+                audio_url=audio_url,
+                transcript=audio_file.script,
+                question_text=q["question"],
+                options_json=json.dumps(q["options"]),
+                correct_answer=q["correct_answer"],
+                difficulty=level,
+            )
+            self.db.add(row)
+            rows.append(row)
+        self.db.commit()
+        for row in rows:
+            self.db.refresh(row)
+        return rows
+
+
+REFILL_JOB_TYPE = "listening_bank.refill"
+
+
+@register_job_handler(REFILL_JOB_TYPE)
+def _run_refill_job(db: Session, payload: dict[str, Any], job: Any) -> dict[str, Any]:
+    report = ListeningQuestionBankService(db).refill()
+    logger.info("Listening bank refill: %s", report)
+    return asdict(report)
+
+
+class ListeningQuestionBankRefillJob:
+    """Background thread that periodically schedules a listening question bank refill.
+
+    Every app worker runs this thread, but it only queues a `listening_bank.refill` job when
+    none is queued or running; the JobRunner executes it, so one refill happens at a time.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], interval_seconds: float):
+        self.session_factory = session_factory
+        self.interval_seconds = max(1.0, float(interval_seconds))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="listening-bank-refill", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def run_once(self) -> int | None:
+        """Queue a refill job. Returns its id, or None if one was already pending."""
+        db = self.session_factory()
+        try:
+            job = JobService(db).enqueue_unique(REFILL_JOB_TYPE, {}, max_attempts=1)
+            return int(job.id) if job is not None else None
+        except Exception as e:
+            db.rollback()
+            logger.error("Scheduling listening bank refill failed: %s", str(e), exc_info=True)
+            return None
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval_seconds)
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import replace
 from typing import Any
 
 from app.config.settings import get_settings
 from app.domain.enums import LanguageLevel
-from app.infrastructure.external.llm import LLMChatRequest, LLMMessage, get_llm_client
+from app.infrastructure.external.llm import LLMCachePolicy, LLMChatRequest, LLMMessage, get_llm_client
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class ListeningQuestionGeneratorService:
         script: str,
         level: LanguageLevel,
         num_questions: int = 3,
+        cache: LLMCachePolicy | None = None,
     ) -> list[dict[str, Any]]:
         """Generate listening comprehension questions from an audio transcript.
         
@@ -32,6 +34,7 @@ class ListeningQuestionGeneratorService:
             script: The audio transcript/script
             level: The CEFR level of the audio
             num_questions: Number of questions to generate
+            cache: Optional LLM response cache policy for this call
             
         Returns:
             List of question dictionaries with structure:
@@ -41,7 +44,26 @@ class ListeningQuestionGeneratorService:
                 "correct_answer": str,
             }
         """
+        questions = self.generate_validated_questions(script, level, num_questions, cache=cache)
+        if not questions:
+            return self.fallback_questions(level)
+        return questions
+    
+    def generate_validated_questions(
+        self,
+        script: str,
+        level: LanguageLevel,
+        num_questions: int = 3,
+        cache: LLMCachePolicy | None = None,
+    ) -> list[dict[str, Any]]:
+        """Same as generate_questions, but returns [] instead of generic fallback questions.
+        
+        Used by the listening question bank, which must never persist fallbacks.
+        """
         prompt = self._build_prompt(script, level, num_questions)
+        if cache is not None and cache.accept is None:
+            # Only responses that yield questions are worth replaying.
+            cache = replace(cache, accept=lambda text: bool(self._parse_questions(text)))
         
         try:
             provider = str(getattr(self.settings, "ai_provider", "mock") or "mock")
@@ -61,6 +83,7 @@ class ListeningQuestionGeneratorService:
                     model=getattr(self.settings, "google_genai_model", None),
                     temperature=float(getattr(self.settings, "google_genai_temperature", 0.2)),
                     max_output_tokens=int(getattr(self.settings, "google_genai_max_output_tokens", 1024)),
+                    cache=cache,
                 )
             )
             
@@ -68,59 +91,53 @@ class ListeningQuestionGeneratorService:
             
             if not raw_text:
                 logger.warning("LLM returned empty text for listening questions")
-                return self._fallback_questions(level)
+                return []
             
             logger.info("LLM response length: %s chars", len(raw_text))
             
-            # Try to extract JSON
-            data = self._extract_json(raw_text)
-            
-            if not isinstance(data, dict) or "questions" not in data:
-                logger.warning("LLM response was not valid JSON or missing 'questions' key")
-                return self._fallback_questions(level)
-            
-            questions = data.get("questions", [])
-            
-            if not isinstance(questions, list):
-                logger.warning("'questions' field is not a list")
-                return self._fallback_questions(level)
-            
-            # Validate and clean questions
-            validated_questions = []
-            for q in questions:
-                if not isinstance(q, dict):
-                    continue
-                
-                question_text = q.get("question", "").strip()
-                options = q.get("options", [])
-                correct = q.get("correct_answer", "").strip()
-                
-                if not question_text or not options or not correct:
-                    continue
-                
-                if not isinstance(options, list) or len(options) != 4:
-                    continue
-                
-                # Ensure correct answer is one of the options
-                if correct not in options:
-                    continue
-                
-                validated_questions.append({
-                    "question": question_text,
-                    "options": options,
-                    "correct_answer": correct,
-                })
-            
+            validated_questions = self._parse_questions(raw_text)
             if not validated_questions:
-                logger.warning("No valid questions after validation")
-                return self._fallback_questions(level)
+                logger.warning("LLM response had no valid listening questions")
+                return []
             
             logger.info("Successfully generated %s listening questions", len(validated_questions))
             return validated_questions[:num_questions]  # Return at most num_questions
         
         except Exception as e:
             logger.error("Error generating listening questions: %s", str(e), exc_info=True)
-            return self._fallback_questions(level)
+            return []
+    
+    def _parse_questions(self, raw_text: str) -> list[dict[str, Any]]:
+        """Valid questions in an LLM response ([] if it is not usable)."""
+        data = self._extract_json(raw_text)
+        if not isinstance(data, dict) or not isinstance(data.get("questions"), list):
+            return []
+        
+        validated_questions = []
+        for q in data["questions"]:
+            if not isinstance(q, dict):
+                continue
+            
+            question_text = str(q.get("question") or "").strip()
+            options = q.get("options", [])
+            correct = str(q.get("correct_answer") or "").strip()
+            
+            if not question_text or not options or not correct:
+                continue
+            
+            if not isinstance(options, list) or len(options) != 4:
+                continue
+            
+            # Ensure correct answer is one of the options
+            if correct not in options:
+                continue
+            
+            validated_questions.append({
+                "question": question_text,
+                "options": options,
+                "correct_answer": correct,
+            })
+        return validated_questions
     
     def _build_prompt(self, script: str, level: LanguageLevel, num_questions: int) -> str:
         """Build the prompt for LLM question generation."""
@@ -180,7 +197,8 @@ Do not include markdown code blocks, backticks, or any other formatting. Return
         except json.JSONDecodeError:
             return None
     
-    def _fallback_questions(self, level: LanguageLevel) -> list[dict[str, Any]]:
+    @staticmethod
+    def fallback_questions(level: LanguageLevel) -> list[dict[str, Any]]:
         """Generate simple fallback questions when LLM fails."""
         return [
             {
@@ -14,16 +14,25 @@ from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.tests import (
     PlacementTestDB,
     QuestionDB,
+    SpeakingAnalysisDB,
     TestDB,
     TestModuleDB,
+    TestModuleQuestionDB,
+    TestModuleSubmissionDB,
     ReadingQuestionDB,
     WritingQuestionDB,
     ListeningQuestionDB,
     TestSessionDB,
 )
 from app.infrastructure.db.models.user import StudentDB
-from app.infrastructure.external.audio_manager import AudioFileManager
-from app.application.services.listening_question_generator_service import ListeningQuestionGeneratorService
+from app.infrastructure.db.pagination import Page, build_page, keyset
+from app.application.services.listening_question_bank_service import (
+    PLACEMENT_LEVELS,
+    QUESTIONS_PER_SET,
+    ListeningQuestionBankService,
+)
+from app.infrastructure.db.identity import student_for_user
+from app.infrastructure.repositories.cached_progress_repository import invalidate_progress_cache
 
 
 logger = logging.getLogger(__name__)
@@ -121,15 +130,13 @@ class PlacementTestService:
 
         modules: dict[ModuleType, TestModuleDB] = {}
         for module_type in ("reading", "writing", "listening", "speaking"):
-            question_ids = [q.id for q in seed[module_type]]
-            module = TestModuleDB(
-                module_type=module_type,
-                questions_json=json.dumps({"question_ids": question_ids}),
-                score=0,
-            )
+            module = TestModuleDB(module_type=module_type, score=0)
             self.db.add(module)
-            self.db.commit()
-            self.db.refresh(module)
+            self.db.flush()
+            self.db.add_all(
+                TestModuleQuestionDB(module_id=module.id, position=position, question_id=int(q.id))
+                for position, q in enumerate(seed[module_type])
+            )
             modules[module_type] = module
 
         placement = PlacementTestDB(
@@ -154,8 +161,13 @@ class PlacementTestService:
 
     def getModuleQuestions(self, testId: int, moduleType: ModuleType) -> list[Any]:
         module = self._get_module_for_test(testId, moduleType)
-        payload = self._parse_questions_json(module.questions_json)
-        question_ids: list[int] = [int(qid) for qid in payload.get("question_ids", [])]
+        question_ids = list(
+            self.db.scalars(
+                select(TestModuleQuestionDB.question_id)
+                .where(TestModuleQuestionDB.module_id == module.id)
+                .order_by(TestModuleQuestionDB.position)
+            ).all()
+        )
         if not question_ids:
             return []
 
@@ -186,25 +198,48 @@ class PlacementTestService:
             else:
                 points_by_id[str(q.id)] = 1
 
+        # A resubmission replaces the module's answers: upsert one row per question, drop the rest.
+        existing = {
+            row.question_id: row
+            for row in self.db.scalars(
+                select(TestModuleSubmissionDB).where(TestModuleSubmissionDB.module_id == module.id)
+            ).all()
+        }
+        now = datetime.utcnow()
+        seen: set[str] = set()
         score = 0
         for sub in submissions:
             qid = str(sub.get("questionId") or "")
             ans = (sub.get("answer") or "").strip()
+            is_correct: bool | None = None
             correct = correct_by_id.get(qid)
-            if not correct:
-                continue
             # For open-ended modules, score stays 0 for now (dummy).
-            if moduleType in ("writing", "speaking"):
+            if correct and moduleType not in ("writing", "speaking"):
+                is_correct = ans.lower() == correct.strip().lower()
+                if is_correct:
+                    score += points_by_id.get(qid, 0)
+
+            if not qid or qid in seen:
                 continue
-            if ans.lower() == correct.strip().lower():
-                score += points_by_id.get(qid, 0)
+            seen.add(qid)
+            row = existing.get(qid)
+            if row is None:
+                self.db.add(
+                    TestModuleSubmissionDB(
+                        module_id=module.id, question_id=qid, answer=ans, is_correct=is_correct, submitted_at=now
+                    )
+                )
+            else:
+                row.answer = ans
+                row.is_correct = is_correct
+                row.submitted_at = now
+        for qid, row in existing.items():
+            if qid not in seen:
+                self.db.delete(row)
 
         # Don't overwrite any speaking score computed via audio upload.
         if moduleType not in ("writing", "speaking"):
             module.score = int(score)
-        payload = self._parse_questions_json(module.questions_json)
-        payload["submissions"] = submissions
-        module.questions_json = json.dumps(payload)
         self.db.commit()
 
         final_score = int(module.score) if moduleType in ("writing", "speaking") else int(score)
@@ -226,7 +261,6 @@ class PlacementTestService:
         
         _ = self._require_student(userId)
         module = self._get_module_for_test(testId, "speaking")
-        payload = self._parse_questions_json(module.questions_json)
 
         audio_len = len(audioBytes or b"")
         if audio_len == 0:
@@ -243,40 +277,33 @@ class PlacementTestService:
         try:
             analyzer = AudioAnalyzer(api_key=settings.google_api_key or "")
             result = analyzer.analyze_for_placement(audioBytes, contentType, question=question_text)
-            
-            analysis = {
-                "questionId": str(questionId),
-                "receivedBytes": audio_len,
-                "contentType": contentType,
-                "transcript": result.transcript,
-                "pronunciationScore": result.pronunciation_score,
-                "fluencyScore": result.fluency_score,
-                "grammarScore": result.grammar_score,
-                "vocabularyScore": result.vocabulary_score,
-                "overallScore": result.overall_score,
-                "cefrLevel": result.cefr_level,
-                "strengthTags": result.strength_tags,
-                "weaknessTags": result.weakness_tags,
-            }
         except Exception as e:
             # If Gemini API fails, return error
             logger.error(f"Failed to analyze speaking audio: {str(e)}")
             raise ValueError(f"Audio analysis failed: {str(e)}")
         
-        items = payload.get("speaking_audio", [])
-        if not isinstance(items, list):
-            items = []
-        # Replace prior upload for same questionId
-        items = [it for it in items if not (isinstance(it, dict) and str(it.get("questionId")) == str(questionId))]
-        items.append(analysis)
-        payload["speaking_audio"] = items
-        
-        # Store the CEFR level in payload for later retrieval
-        payload["cefr_level"] = result.cefr_level
-        payload["strength_tags"] = result.strength_tags
-        payload["weakness_tags"] = result.weakness_tags
-        
-        module.questions_json = json.dumps(payload)
+        # Replace prior upload for same questionId; the latest analysis also sets the module's CEFR level.
+        analysis = self.db.scalar(
+            select(SpeakingAnalysisDB).where(
+                SpeakingAnalysisDB.module_id == module.id,
+                SpeakingAnalysisDB.question_id == str(questionId),
+            )
+        )
+        if analysis is None:
+            analysis = SpeakingAnalysisDB(module_id=module.id, question_id=str(questionId))
+            self.db.add(analysis)
+        analysis.received_bytes = audio_len
+        analysis.content_type = contentType
+        analysis.transcript = result.transcript
+        analysis.pronunciation_score = float(result.pronunciation_score)
+        analysis.fluency_score = float(result.fluency_score)
+        analysis.grammar_score = float(result.grammar_score)
+        analysis.vocabulary_score = float(result.vocabulary_score)
+        analysis.overall_score = float(result.overall_score)
+        analysis.cefr_level = result.cefr_level
+        analysis.strength_tags_json = json.dumps(result.strength_tags or [])
+        analysis.weakness_tags_json = json.dumps(result.weakness_tags or [])
+        analysis.analyzed_at = datetime.utcnow()
 
         # Score based on overall score from Gemini (0-100 scale, convert to 0-3)
         module.score = int(result.overall_score / 100 * 3)
@@ -315,10 +342,11 @@ class PlacementTestService:
         if not placement:
             raise ValueError("Placement test not found")
 
-        reading = self.db.get(TestModuleDB, placement.reading_module_id) if placement.reading_module_id else None
-        writing = self.db.get(TestModuleDB, placement.writing_module_id) if placement.writing_module_id else None
-        listening = self.db.get(TestModuleDB, placement.listening_module_id) if placement.listening_module_id else None
-        speaking = self.db.get(TestModuleDB, placement.speaking_module_id) if placement.speaking_module_id else None
+        modules = self._load_modules(placement)
+        reading = modules.get("reading")
+        writing = modules.get("writing")
+        listening = modules.get("listening")
+        speaking = modules.get("speaking")
 
         reading_score = int(reading.score) if reading else 0
         writing_score = int(writing.score) if writing else 0
@@ -332,9 +360,13 @@ class PlacementTestService:
         
         # For speaking, use the CEFR level from Gemini if available
         speaking_level = self._level_for_module_score("speaking", speaking_score)
-        if speaking and speaking.questions_json:
-            speaking_payload = self._parse_questions_json(speaking.questions_json)
-            cefr_level = speaking_payload.get("cefr_level")
+        if speaking:
+            cefr_level = self.db.scalar(
+                select(SpeakingAnalysisDB.cefr_level)
+                .where(SpeakingAnalysisDB.module_id == speaking.id)
+                .order_by(SpeakingAnalysisDB.analyzed_at.desc(), SpeakingAnalysisDB.id.desc())
+                .limit(1)
+            )
             if cefr_level:
                 level_map = {
                     "A1": LanguageLevel.A1,
@@ -403,6 +435,7 @@ class PlacementTestService:
         )
         self.db.add(result)
         self.db.commit()
+        invalidate_progress_cache(self.db, int(student.id))
         self.db.refresh(result)
 
         return PlacementTestResultView(
@@ -428,6 +461,21 @@ class PlacementTestService:
         # Keep it simple: return all results for this student.
         return list(self.db.scalars(select(TestResultDB).where(TestResultDB.student_id == student.id).order_by(TestResultDB.completed_at.desc())).all())
 
+    def listMyPlacementResultsPage(
+        self, userId: int, *, limit: int, cursor: str | None = None
+    ) -> Page[PlacementTestResultView]:
+        """Newest results first, keyset-paginated by (completed_at, id)."""
+        student = self._require_student(userId)
+        stmt = keyset(
+            select(TestResultDB).where(TestResultDB.student_id == student.id),
+            TestResultDB.completed_at,
+            TestResultDB.id,
+            cursor=cursor,
+            limit=limit,
+        )
+        page = build_page(self.db.scalars(stmt).all(), limit=limit, key=lambda r: (r.completed_at, r.id))
+        return Page(items=[self._to_result_view(r, student.id) for r in page.items], next_cursor=page.next_cursor)
+
     def _to_result_view(self, result: TestResultDB, student_id: int) -> PlacementTestResultView:
         overall = result.level or LanguageLevel.A1
 
@@ -439,27 +487,11 @@ class PlacementTestService:
         # Fallback: if per-module levels are missing, derive once from module scores.
         if not all([reading_level, writing_level, listening_level, speaking_level]):
             placement = self.db.scalar(select(PlacementTestDB).where(PlacementTestDB.test_id == int(result.test_id)))
-            reading_score = writing_score = listening_score = speaking_score = 0
-            if placement:
-                for mtype, mid in (
-                    ("reading", placement.reading_module_id),
-                    ("writing", placement.writing_module_id),
-                    ("listening", placement.listening_module_id),
-                    ("speaking", placement.speaking_module_id),
-                ):
-                    if not mid:
-                        continue
-                    m = self.db.get(TestModuleDB, mid)
-                    if not m:
-                        continue
-                    if mtype == "reading":
-                        reading_score = int(m.score)
-                    elif mtype == "writing":
-                        writing_score = int(m.score)
-                    elif mtype == "listening":
-                        listening_score = int(m.score)
-                    elif mtype == "speaking":
-                        speaking_score = int(m.score)
+            scores = {mtype: int(m.score) for mtype, m in self._load_modules(placement).items()} if placement else {}
+            reading_score = scores.get("reading", 0)
+            writing_score = scores.get("writing", 0)
+            listening_score = scores.get("listening", 0)
+            speaking_score = scores.get("speaking", 0)
             reading_level = reading_level or self._level_for_module_score("reading", reading_score)
             writing_level = writing_level or self._level_for_module_score("writing", writing_score)
             listening_level = listening_level or self._level_for_module_score("listening", listening_score)
@@ -477,7 +509,7 @@ class PlacementTestService:
         )
 
     def _require_student(self, userId: int) -> StudentDB:
-        student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == int(userId)))
+        student = student_for_user(self.db, int(userId))
         if not student:
             raise ValueError("Student profile not found")
         return student
@@ -504,6 +536,22 @@ class PlacementTestService:
             raise ValueError("Module not found")
         return module
 
+    def _load_modules(self, placement: PlacementTestDB) -> dict[ModuleType, TestModuleDB]:
+        """All modules of a placement test in one query, keyed by module type."""
+        ids: dict[int, ModuleType] = {}
+        for mtype, mid in (
+            ("reading", placement.reading_module_id),
+            ("writing", placement.writing_module_id),
+            ("listening", placement.listening_module_id),
+            ("speaking", placement.speaking_module_id),
+        ):
+            if mid:
+                ids[int(mid)] = mtype
+        if not ids:
+            return {}
+        rows = self.db.scalars(select(TestModuleDB).where(TestModuleDB.id.in_(ids))).all()
+        return {ids[int(m.id)]: m for m in rows}
+
     def saveProgress(self, userId: int, testId: int, currentStep: int, answers: dict[str, Any]) -> None:
         student = self._require_student(userId)
         session = self.db.scalar(select(TestSessionDB).where(
@@ -537,15 +585,6 @@ class PlacementTestService:
             TestSessionDB.status == "in_progress"
         )).all())
 
-    def _parse_questions_json(self, raw: str | None) -> dict[str, Any]:
-        if not raw:
-            return {}
-        try:
-            obj = json.loads(raw)
-            return obj if isinstance(obj, dict) else {"question_ids": obj}
-        except Exception:
-            return {}
-
     def _ensure_seed_questions(self) -> dict[ModuleType, list[Any]]:
         """Create deterministic seed questions if missing."""
         # Reading
@@ -734,7 +773,7 @@ class PlacementTestService:
             self.db.commit()
             reading_qs = list(self.db.scalars(select(ReadingQuestionDB)).all())
 
-        # Listening - Use audio files with LLM-generated questions
+        # Listening - Sampled from the pre-generated question bank
         listening_qs = self._generate_listening_questions_for_placement()
 
         # Writing
@@ -886,11 +925,16 @@ class PlacementTestService:
           "weaknesses": list[str],
         }
         """
-        if not writing_module or not writing_module.questions_json:
+        if not writing_module:
             return None
-        payload = self._parse_questions_json(writing_module.questions_json)
-        subs = payload.get("submissions")
-        if not isinstance(subs, list) or len(subs) == 0:
+        subs = list(
+            self.db.scalars(
+                select(TestModuleSubmissionDB)
+                .where(TestModuleSubmissionDB.module_id == writing_module.id)
+                .order_by(TestModuleSubmissionDB.id)
+            ).all()
+        )
+        if not subs:
             return None
 
         # Pull question text so the LLM sees prompt + answer.
@@ -898,10 +942,8 @@ class PlacementTestService:
         q_by_id: dict[str, str] = {str(q.id): str(getattr(q, "prompt", getattr(q, "text", ""))) for q in questions}
         pairs: list[str] = []
         for sub in subs:
-            if not isinstance(sub, dict):
-                continue
-            qid = str(sub.get("questionId") or "").strip()
-            ans = str(sub.get("answer") or "").strip()
+            qid = str(sub.question_id or "").strip()
+            ans = str(sub.answer or "").strip()
             if not qid or not ans:
                 continue
             qtext = q_by_id.get(qid, "(unknown question)")
@@ -949,6 +991,7 @@ class PlacementTestService:
                     model=getattr(settings, "google_genai_model", None),
                     temperature=float(getattr(settings, "google_genai_temperature", 0.2)),
                     max_output_tokens=int(getattr(settings, "google_genai_max_output_tokens", 512)),
+                    lane="placement",
                 )
             )
             raw_text = (resp.text or "").strip()
@@ -1012,6 +1055,7 @@ class PlacementTestService:
                             model=getattr(settings, "google_genai_model", None),
                             temperature=0.0,
                             max_output_tokens=int(getattr(settings, "google_genai_max_output_tokens", 1024)),
+                            lane="placement",
                         )
                     )
                     retry_text = (retry.text or "").strip()
@@ -1085,87 +1129,43 @@ class PlacementTestService:
             return None
 
     def _generate_listening_questions_for_placement(self) -> list[ListeningQuestionDB]:
-        """Generate listening questions for placement test using audio files and LLM.
+        """Pick listening questions for the placement test from the pre-generated bank.
         
-        Randomly selects one audio file per level (A1, A2, B1, B2) and generates
-        3 questions per audio using the LLM.
+        One question set per level (A1, A2, B1, B2). Sets are generated offline by
+        ListeningQuestionBankService.refill, so no LLM call happens here.
         """
         try:
-            audio_manager = AudioFileManager()
-            question_generator = ListeningQuestionGeneratorService()
-            
-            # Get one random audio for each level
-            audio_by_level = audio_manager.get_random_for_placement_test()
-            
-            all_questions = []
-            
-            for level, audio_file in audio_by_level.items():
-                logger.info(
-                    "Generating listening questions for placement test (level=%s, audio=%s)",
-                    level.value,
-                    audio_file.filename,
-                )
-                
-                # Generate 3 questions per audio
-                questions = question_generator.generate_questions(
-                    script=audio_file.script,
-                    level=level,
-                    num_questions=3,
-                )
-                
-                # Create ListeningQuestionDB objects
-                for q_data in questions:
-                    # Check if question already exists to avoid duplicates
-                    existing = self.db.scalar(
-                        select(ListeningQuestionDB).where(
-                            ListeningQuestionDB.audio_url == audio_manager.get_audio_url(audio_file.filename),
-                            ListeningQuestionDB.question_text == q_data["question"]
-                        )
-                    )
-                    
-                    if existing:
-                        all_questions.append(existing)
-                        continue
-                    
-                    q_obj = ListeningQuestionDB(
-                        audio_url=audio_manager.get_audio_url(audio_file.filename),
-                        transcript=audio_file.script,
-                        question_text=q_data["question"],
-                        options_json=json.dumps(q_data["options"]),
-                        correct_answer=q_data["correct_answer"],
-                        difficulty=level,
-                    )
-                    self.db.add(q_obj)
-                    all_questions.append(q_obj)
-            
-            self.db.commit()
-            
-            # Refresh all objects to get IDs
-            for q in all_questions:
-                self.db.refresh(q)
-            
-            logger.info(
-                "Generated %s listening questions for placement test",
-                len(all_questions)
-            )
-            
-            return all_questions
+            questions = ListeningQuestionBankService(self.db).sample_placement_set()
+            if questions:
+                logger.info("Sampled %s listening questions for placement test", len(questions))
+                return questions
         
         except Exception as e:
+            self.db.rollback()
             logger.error(
-                "Failed to generate listening questions for placement test: %s",
+                "Failed to sample listening questions for placement test: %s",
                 str(e),
                 exc_info=True
             )
-            # Fall back to existing questions if available
-            existing_qs = list(self.db.scalars(select(ListeningQuestionDB)).all())
-            if existing_qs:
-                logger.info("Using existing listening questions as fallback")
-                return existing_qs
-            
-            # Last resort: create minimal fallback questions
-            logger.warning("Creating minimal fallback listening questions")
-            return self._create_fallback_listening_questions()
+        
+        # Fall back to existing questions if available (at most one set per level)
+        existing_qs = []
+        for level in PLACEMENT_LEVELS:
+            existing_qs.extend(
+                self.db.scalars(
+                    select(ListeningQuestionDB)
+                    .where(ListeningQuestionDB.difficulty == level)
+                    .order_by(ListeningQuestionDB.id)
+                    .limit(QUESTIONS_PER_SET)
+                ).all()
+            )
+        if existing_qs:
+            logger.info("Using existing listening questions as fallback")
+            return existing_qs
+        
+        # Last resort: create minimal fallback questions
+        logger.warning("Creating minimal fallback listening questions")
+        return self._create_fallback_listening_questions()
     
     def _create_fallback_listening_questions(self) -> list[ListeningQuestionDB]:
         """Create minimal fallback listening questions when audio generation fails."""
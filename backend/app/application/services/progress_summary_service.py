@@ -0,0 +1,279 @@
+"""Materialised GET /progress response per student (`student_progress_summary`).
+
+The summary row holds the response computed from the progress rows, snapshots, the
+daily_activity rollup, completed content, the learning plan and test results, stamped with
+the student's context version. Completion, test and plan writes bump that version in their
+own transaction (app/infrastructure/db/context_versions.py), which makes the row stale
+atomically. The completion and placement flows rebuild it right after committing, and
+`ProgressSummaryRefreshJob` rebuilds the ones other writes left stale. Reads never write: a
+read that finds the row stale builds the response in memory. Serving a current summary is
+one statement.
+
+What depends on the current date (the streak's day rollover and the timeline window) is
+applied when serving, in `render_progress_summary`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.context_versions import get_student_context_version
+from app.infrastructure.db.daily_activity import daily_totals
+from app.infrastructure.db.models.content import ContentDB, LessonPlanDB
+from app.infrastructure.db.models.progress import StudentProgressSummaryDB
+from app.infrastructure.db.models.results import TestResultDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.models.student_context_version import StudentContextVersionDB
+from app.infrastructure.db.models.user import StudentDB
+from app.infrastructure.db.streaks import current_streak
+from app.infrastructure.repositories.cached_progress_repository import CachedSqlAlchemyProgressRepository
+from app.infrastructure.repositories.sqlalchemy_progress_repository import SqlAlchemyProgressRepository
+
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_DAYS = 30
+# Topic progress is a 0..1 fraction; counts are estimated against this many items per topic.
+ITEMS_PER_TOPIC = 5
+
+
+class ProgressSummaryService:
+	def __init__(self, db: Session):
+		self.db = db
+
+	def getSummary(self, studentId: int) -> dict[str, Any]:
+		"""Stored summary of the student; built in memory (not stored) if missing or stale."""
+		version = (
+			select(StudentContextVersionDB.version)
+			.where(StudentContextVersionDB.student_id == int(studentId))
+			.scalar_subquery()
+		)
+		row = self.db.execute(
+			select(
+				StudentProgressSummaryDB.payload_json,
+				StudentProgressSummaryDB.context_version,
+				func.coalesce(version, 0),
+			).where(StudentProgressSummaryDB.student_id == int(studentId))
+		).first()
+		if row is not None and int(row[1]) == int(row[2]):
+			return json.loads(row[0])
+		return self.buildSummary(studentId, cached=True)
+
+	def refreshSummary(self, studentId: int) -> dict[str, Any]:
+		"""Rebuild and store the summary. Commits."""
+		# Read before building: a change in between leaves an older stamp on newer data,
+		# which the next read rebuilds, never the reverse.
+		version = get_student_context_version(self.db, int(studentId))
+		payload = self.buildSummary(studentId)
+		self._store(int(studentId), version, json.dumps(payload))
+		self.db.commit()
+		return payload
+
+	def buildSummary(self, studentId: int, cached: bool = False) -> dict[str, Any]:
+		"""The ProgressResponse fields (JSON-ready) except dailyStreak, from the source tables.
+
+		`cached` reads progress rows through the per-worker progress cache, which may be up to
+		its TTL behind; only for results that are served once, never for what gets stored.
+		"""
+		student_id = int(studentId)
+		repo = CachedSqlAlchemyProgressRepository(self.db) if cached else SqlAlchemyProgressRepository(self.db)
+		progress = repo.fetch_progress(student_id)
+		snapshots = repo.fetch_snapshots(student_id=student_id, days=TIMELINE_DAYS)
+		student = self.db.get(StudentDB, student_id)
+
+		completed_lessons = progress.completed_lessons if progress else []
+		last_updated = progress.last_updated if progress else None
+		current_level = student.level.value if student and student.level else None
+
+		# Completed AI contents per content type (missing content rows still count)
+		type_counts = self.db.execute(
+			select(ContentDB.content_type, func.count())
+			.select_from(StudentAIContentDB)
+			.outerjoin(ContentDB, ContentDB.id == StudentAIContentDB.content_id)
+			.where(
+				StudentAIContentDB.student_id == student_id,
+				StudentAIContentDB.is_active == False  # noqa: E712
+			)
+			.group_by(ContentDB.content_type)
+		).all()
+
+		# CEFR level by test date, and completed content per day from the rollup
+		test_levels: dict[date, str] = {}
+		for completed_at, level in self.db.execute(
+			select(TestResultDB.completed_at, TestResultDB.level)
+			.where(TestResultDB.student_id == student_id)
+			.order_by(TestResultDB.completed_at.asc())
+		):
+			if completed_at and level:
+				test_levels[completed_at.date()] = level.value
+		content_per_day = {
+			d: t["content_completed"]
+			for d, t in daily_totals(self.db, student_id=student_id).items()
+			if t["content_completed"] > 0
+		}
+
+		timeline = []
+		for s in snapshots:
+			cefr_level = None
+			for test_date in sorted(test_levels):
+				if test_date <= s.snapshot_date:
+					cefr_level = test_levels[test_date]
+			timeline.append({
+				"date": s.snapshot_date.isoformat(),
+				"correctAnswerRate": s.correct_answer_rate,
+				"completedContentCount": sum(n for d, n in content_per_day.items() if d <= s.snapshot_date),
+				"cefrLevel": cefr_level,
+			})
+
+		return {
+			"studentId": student_id,
+			"completedLessons": completed_lessons,
+			"completedTests": progress.completed_tests if progress else [],
+			"correctAnswerRate": float(progress.correct_answer_rate) if progress else 0.0,
+			"lastUpdated": last_updated.isoformat() if last_updated else None,
+			# Simple completion rate heuristic: progress on completed lesson count.
+			"completionRate": min(1.0, len(completed_lessons) / 20.0) if completed_lessons else 0.0,
+			"timeline": timeline,
+			"currentLevel": current_level,
+			"totalPoints": int(student.total_points or 0) if student else 0,
+			"completedContentCount": sum(int(n) for _, n in type_counts),
+			"topicProgress": self._topic_progress(student_id),
+			"contentTypeProgress": [
+				{"contentType": content_type.value, "completedCount": int(n)}
+				for content_type, n in type_counts
+				if content_type
+			],
+		}
+
+	def _topic_progress(self, student_id: int) -> list[dict[str, Any]]:
+		plan = self.db.scalar(
+			select(LessonPlanDB)
+			.where(LessonPlanDB.student_id == student_id)
+			.order_by(LessonPlanDB.updated_at.desc())
+			.limit(1)
+		)
+		if not plan:
+			return []
+		topics = []
+		try:
+			progress_tracking = json.loads(plan.progress_tracking_json or "{}")
+			for topic in json.loads(plan.topics_json or "[]"):
+				topic_name = topic.get("name", "")
+				if topic_name:
+					progress_val = float(progress_tracking.get(topic_name, 0.0))
+					topics.append({
+						"topicName": topic_name,
+						"progress": progress_val,
+						"completedCount": int(progress_val * ITEMS_PER_TOPIC),
+						"totalCount": ITEMS_PER_TOPIC,
+					})
+		except Exception:
+			return []
+		return topics
+
+	def _store(self, student_id: int, version: int, payload_json: str) -> None:
+		now = datetime.utcnow()
+		table = StudentProgressSummaryDB.__table__
+		values = {"context_version": version, "payload_json": payload_json, "built_at": now}
+		if self.db.get_bind().dialect.name == "sqlite":
+			stmt = sqlite_insert(table).values(student_id=student_id, **values)
+			self.db.execute(stmt.on_conflict_do_update(index_elements=[table.c.student_id], set_=values))
+			return
+		result = self.db.execute(update(table).where(table.c.student_id == student_id).values(**values))
+		if not result.rowcount:
+			self.db.execute(insert(table).values(student_id=student_id, **values))
+
+
+def render_progress_summary(payload: dict[str, Any], student: StudentDB | None, today: date | None = None) -> dict[str, Any]:
+	"""ProgressResponse fields for `today`: current streak, timeline limited to the window."""
+	today = today or date.today()
+	start = (today - timedelta(days=TIMELINE_DAYS)).isoformat()
+	timeline = [p for p in payload["timeline"] if p["date"] >= start]
+	if not timeline:
+		# Ensure we have at least one point for the graph
+		last_updated = payload["lastUpdated"]
+		timeline = [{
+			"date": last_updated[:10] if last_updated else today.isoformat(),
+			"correctAnswerRate": payload["correctAnswerRate"],
+			"completedContentCount": payload["completedContentCount"],
+			"cefrLevel": payload["currentLevel"],
+		}]
+	return {**payload, "timeline": timeline, "dailyStreak": current_streak(student)}
+
+
+def stale_summary_student_ids(db: Session, limit: int) -> list[int]:
+	"""Students whose stored summary is missing or older than their context version."""
+	summary = StudentProgressSummaryDB
+	version = func.coalesce(StudentContextVersionDB.version, 0)
+	return [
+		int(student_id)
+		for student_id in db.scalars(
+			select(StudentDB.id)
+			.outerjoin(StudentContextVersionDB, StudentContextVersionDB.student_id == StudentDB.id)
+			.outerjoin(summary, summary.student_id == StudentDB.id)
+			.where(or_(summary.student_id.is_(None), summary.context_version != version))
+			.order_by(StudentDB.id)
+			.limit(int(limit))
+		)
+	]
+
+
+def refresh_progress_summary(db: Session, studentId: int) -> None:
+	"""Rebuild after a progress event (best-effort: a failure leaves it to the next read)."""
+	try:
+		ProgressSummaryService(db).refreshSummary(studentId)
+	except Exception as e:
+		db.rollback()
+		logger.warning(f"Failed to refresh progress summary of student {studentId}: {e}")
+
+
+class ProgressSummaryRefreshJob:
+	"""Background thread that periodically rebuilds stale progress summaries."""
+
+	def __init__(self, session_factory: Callable[[], Session], interval_seconds: float, batch_size: int = 100):
+		self.session_factory = session_factory
+		self.interval_seconds = max(1.0, float(interval_seconds))
+		self.batch_size = max(1, int(batch_size))
+		self._stop = threading.Event()
+		self._thread: threading.Thread | None = None
+
+	def start(self) -> None:
+		if self._thread is not None and self._thread.is_alive():
+			return
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._run, name="progress-summary-refresh", daemon=True)
+		self._thread.start()
+
+	def stop(self, timeout: float | None = 5.0) -> None:
+		self._stop.set()
+		if self._thread is not None:
+			self._thread.join(timeout=timeout)
+			self._thread = None
+
+	def run_once(self) -> int:
+		"""Rebuild up to `batch_size` stale summaries. Returns how many were rebuilt."""
+		db = self.session_factory()
+		try:
+			student_ids = stale_summary_student_ids(db, self.batch_size)
+			for student_id in student_ids:
+				refresh_progress_summary(db, student_id)
+			return len(student_ids)
+		except Exception as e:
+			db.rollback()
+			logger.error("Progress summary refresh failed: %s", str(e), exc_info=True)
+			return 0
+		finally:
+			db.close()
+
+	def _run(self) -> None:
+		while not self._stop.is_set():
+			self.run_once()
+			self._stop.wait(self.interval_seconds)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import random
@@ -7,20 +8,25 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from app.config.settings import Settings
 from app.domain.enums import ContentType, LanguageLevel
 from app.infrastructure.db.models.content import ContentDB, LessonPlanDB, TopicDB
+from app.infrastructure.db.models.prefetched_content import PrefetchedContentDB
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
 from app.infrastructure.db.models.tests import ListeningQuestionDB
 from app.infrastructure.db.models.user import StudentDB
-from app.infrastructure.external.llm import LLMChatRequest, LLMMessage, get_llm_client
+from app.infrastructure.external.llm import LLMCachePolicy, LLMChatRequest, LLMMessage, get_llm_client
 from app.infrastructure.external.audio_manager import AudioFileManager
+from app.application.services.job_service import JobService, register_job_handler
 from app.application.services.listening_question_generator_service import ListeningQuestionGeneratorService
 from app.application.services.teacher_directive_service import TeacherDirectiveService
+from app.infrastructure.db.identity import student_for_user
+from app.infrastructure.db.streaks import record_activity
+from app.infrastructure.repositories.cached_progress_repository import invalidate_progress_cache
 
 
 logger = logging.getLogger(__name__)
@@ -67,6 +73,25 @@ def _safe_json_loads(text: str) -> Any | None:
 		return None
 
 
+def build_plan_topics(*, weaknesses: list[str], strengths: list[str]) -> list[str]:
+	# Prioritize weaknesses; optionally include one strength for balance.
+	topics: list[str] = []
+	for w in weaknesses:
+		if w not in topics:
+			topics.append(w)
+	for s in strengths:
+		if len(topics) >= 3:
+			break
+		if s not in topics:
+			topics.append(s)
+	return topics[:3]
+
+
+def _plan_topics_key(planTopics: list[str] | None) -> str:
+	topics = [t.strip().lower() for t in (planTopics or []) if isinstance(t, str) and t.strip()]
+	return hashlib.sha256(json.dumps(topics).encode("utf-8")).hexdigest()
+
+
 @dataclass(frozen=True)
 class StudentSnapshot:
 	student_db_id: int
@@ -89,6 +114,9 @@ class StudentAIContentDeliveryService:
 	- Generate a new batch only when there are 0 active items.
 	- Listening/speaking modules are dummy for now.
 	- Teacher directives (FR35) are included in all LLM prompts.
+	- After a completion (or a new plan) the next item is prefetched in the background;
+	  it is served only while the student's levels, strengths/weaknesses, directives and
+	  target topic still match what it was generated from.
 	"""
 
 	ACTIVE_LIMIT = 1
@@ -112,14 +140,22 @@ class StudentAIContentDeliveryService:
 
 		active_rows = self._list_active(student.id)
 		if len(active_rows) == 0:
-			# Create a new batch of 5 and return the first.
-			active_rows = self._generate_batch(
+			# Serve a still-valid prefetched item if there is one; otherwise generate now.
+			promoted = self._promote_prefetched(
 				student_user_id=int(studentUserId),
 				student_db_id=int(student.id),
 				snapshot=snapshot,
 				contentType=contentType,
 				planTopics=planTopics,
 			)
+			if promoted is None:
+				self._generate_batch(
+					student_user_id=int(studentUserId),
+					student_db_id=int(student.id),
+					snapshot=snapshot,
+					contentType=contentType,
+					planTopics=planTopics,
+				)
 			active_rows = self._list_active(student.id)
 
 		# If there are already active contents, we should not generate more.
@@ -152,7 +188,7 @@ class StudentAIContentDeliveryService:
 		return content, rationale
 
 	def getDeliveredContentForStudent(self, *, studentUserId: int, contentId: int) -> ContentDB | None:
-		student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == int(studentUserId)))
+		student = student_for_user(self.db, int(studentUserId))
 		if not student:
 			return None
 		row = self.db.scalar(
@@ -173,7 +209,7 @@ class StudentAIContentDeliveryService:
 		contentId: int,
 		result: dict[str, Any] | None = None,
 	) -> dict[str, Any] | None:
-		student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == int(studentUserId)))
+		student = student_for_user(self.db, int(studentUserId))
 		if not student:
 			return None
 
@@ -192,37 +228,7 @@ class StudentAIContentDeliveryService:
 		
 		# Evaluate listening answers if provided
 		if result and "answers" in result and content:
-			try:
-				content_body = json.loads(content.body)
-				if content_body.get("formatVersion") == 1:
-					blocks = content_body.get("blocks", [])
-					
-					# Check if this is listening content with multiple choice questions
-					has_audio = any(b.get("type") == "audio" for b in blocks)
-					questions = [b for b in blocks if b.get("type") == "multiple_choice"]
-					
-					if has_audio and questions:
-						# Grade the listening questions
-						answers = result["answers"]
-						correct_count = 0
-						total_count = len(questions)
-						
-						for q in questions:
-							q_id = q.get("id")
-							correct_ans = q.get("correctAnswer", "")
-							user_ans = answers.get(q_id, "")
-							
-							if user_ans.strip().lower() == correct_ans.strip().lower():
-								correct_count += 1
-						
-						# Calculate score percentage
-						score = (correct_count / total_count * 100) if total_count > 0 else 0
-						result["score"] = score
-						result["correct"] = correct_count
-						result["total"] = total_count
-			
-			except Exception as e:
-				logger.error(f"Failed to evaluate listening content: {e}")
+			result.update(self._grade_listening_answers(content, result["answers"]))
 
 		# Store user answers if provided
 		if result and "answers" in result:
@@ -234,40 +240,9 @@ class StudentAIContentDeliveryService:
 		
 		row.is_active = False
 		row.completed_at = datetime.utcnow()
+		record_activity(student, row.completed_at.date())
 		self.db.commit()
-
-
-		# Update Daily Streak
-		# We check the LATEST completed content (excluding this one, which is currently being completed)
-		# Actually, since we just marked this one as completed in memory (but potentially not flushed query-wise for "latest"?), 
-		# let's look at the student's *previous* last activity via the same table.
-		last_completed = self.db.scalar(
-			select(StudentAIContentDB)
-			.where(
-				StudentAIContentDB.student_id == student.id,
-				StudentAIContentDB.is_active == False, # noqa: E712
-				StudentAIContentDB.completed_at.is_not(None),
-				StudentAIContentDB.id != row.id # Exclude current one just in case
-			)
-			.order_by(StudentAIContentDB.completed_at.desc())
-			.limit(1)
-		)
-
-		now_date = datetime.utcnow().date()
-		last_date = last_completed.completed_at.date() if last_completed and last_completed.completed_at else None
-
-		if last_date == now_date:
-			# Already active today, streak doesn't change
-			pass
-		elif last_date == (now_date - timedelta(days=1)):
-			# Active yesterday, increment streak
-			student.daily_streak = (student.daily_streak or 0) + 1
-		else:
-			# Missed a day or first time, reset/start at 1
-			# Note: if they had a streak but missed a day, it resets to 1 (for today)
-			student.daily_streak = 1
-		
-		# Commit happens below
+		invalidate_progress_cache(self.db, int(student.id))
 
 		# Update topic progress
 		self._update_topic_progress(studentUserId, row, result)
@@ -276,6 +251,7 @@ class StudentAIContentDeliveryService:
 		if speaking_feedback:
 			row.feedback_json = json.dumps({"speakingFeedback": speaking_feedback})
 			self.db.commit()
+			self._schedule_prefetch_after(studentUserId, row)
 			return {"feedback": {"speakingFeedback": speaking_feedback}, "score": result.get("score") if result else None}
 
 		# Generate feedback and update strengths/weaknesses for non-speaking content
@@ -296,10 +272,243 @@ class StudentAIContentDeliveryService:
 			# Non-fatal: completion should succeed even if analysis fails
 			pass
 
+		# Strengths/weaknesses are final now, so the prefetched item is built from them.
+		self._schedule_prefetch_after(studentUserId, row)
 		return {"feedback": feedback_data, "score": result.get("score") if result else None}
 
+	def getCompletedContent(self, *, studentUserId: int, contentId: int) -> dict[str, Any] | None:
+		"""Stored outcome of an already completed item ({feedback, score}), or None if not completed."""
+		student = student_for_user(self.db, int(studentUserId))
+		if not student:
+			return None
+		row = self.db.scalar(
+			select(StudentAIContentDB)
+			.where(
+				StudentAIContentDB.student_id == int(student.id),
+				StudentAIContentDB.content_id == int(contentId),
+				StudentAIContentDB.is_active == False,  # noqa: E712
+				StudentAIContentDB.completed_at.is_not(None),
+			)
+			.order_by(StudentAIContentDB.completed_at.desc())
+			.limit(1)
+		)
+		if not row:
+			return None
+		feedback = json.loads(row.feedback_json) if row.feedback_json else None
+		score = None
+		content = self.db.get(ContentDB, int(contentId))
+		if row.user_answers_json and content:
+			score = self._grade_listening_answers(content, json.loads(row.user_answers_json)).get("score")
+		return {"feedback": feedback, "score": score}
+
+	def _grade_listening_answers(self, content: ContentDB, answers: dict[str, Any]) -> dict[str, Any]:
+		"""{score, correct, total} for listening content with multiple choice questions, else {}."""
+		try:
+			content_body = json.loads(content.body)
+			if content_body.get("formatVersion") != 1:
+				return {}
+			blocks = content_body.get("blocks", [])
+
+			# Check if this is listening content with multiple choice questions
+			has_audio = any(b.get("type") == "audio" for b in blocks)
+			questions = [b for b in blocks if b.get("type") == "multiple_choice"]
+			if not has_audio or not questions:
+				return {}
+
+			# Grade the listening questions
+			correct_count = 0
+			total_count = len(questions)
+			for q in questions:
+				q_id = q.get("id")
+				correct_ans = q.get("correctAnswer", "")
+				user_ans = answers.get(q_id, "")
+
+				if user_ans.strip().lower() == correct_ans.strip().lower():
+					correct_count += 1
+
+			# Calculate score percentage
+			score = (correct_count / total_count * 100) if total_count > 0 else 0
+			return {"score": score, "correct": correct_count, "total": total_count}
+		except Exception as e:
+			logger.error(f"Failed to evaluate listening content: {e}")
+			return {}
+
+	# ---- prefetch ----
+
+	def prefetchNextContent(
+		self,
+		studentUserId: int,
+		*,
+		contentType: ContentType = ContentType.LESSON,
+		planTopics: list[str] | None = None,
+	) -> PrefetchedContentDB | None:
+		"""Generate the student's next item ahead of time (runs in a background job).
+
+		`planTopics` are the topics of the item the student just finished (what the client
+		sent last time); without them, uses the topics the delivery endpoint derives when the
+		client sends none. Skips generation when a matching item is already ready or the
+		per-student cap is reached.
+		"""
+		student = student_for_user(self.db, int(studentUserId))
+		if not student:
+			return None
+		snapshot = self._snapshot_student(student.id, fallback_level=None)
+		if not [t for t in (planTopics or []) if isinstance(t, str) and t.strip()]:
+			planTopics = build_plan_topics(weaknesses=snapshot.weaknesses, strengths=snapshot.strengths) or None
+		target_topic = self._resolve_target_topic(int(student.id))
+		fingerprint = self._prefetch_fingerprint(int(studentUserId), snapshot, target_topic)
+		topics_key = _plan_topics_key(planTopics)
+
+		ready = self._valid_prefetched(int(student.id), fingerprint)
+		if any(p.content_type == contentType and p.plan_topics_key == topics_key for p in ready):
+			return None
+		if len(ready) >= max(0, int(self.settings.content_prefetch_max_per_student)):
+			return None
+
+		title, body, rationale, prompt_ctx = self._generate_one(
+			student_user_id=int(studentUserId),
+			snapshot=snapshot,
+			contentType=contentType,
+			planTopics=planTopics,
+			batch_index=1,
+			target_topic=target_topic,
+		)
+		prompt_ctx["prefetched"] = True
+		item = PrefetchedContentDB(
+			student_id=int(student.id),
+			content_type=contentType,
+			plan_topics_key=topics_key,
+			fingerprint=fingerprint,
+			title=title[:255],
+			body=body,
+			level=snapshot.overall_level,
+			rationale=rationale,
+			prompt_context_json=json.dumps(prompt_ctx) if prompt_ctx is not None else None,
+			expires_at=datetime.utcnow() + timedelta(hours=int(self.settings.content_prefetch_ttl_hours)),
+		)
+		self.db.add(item)
+		self.db.commit()
+		return item
+
+	def _schedule_prefetch_after(self, studentUserId: int, row: StudentAIContentDB) -> None:
+		# Prefetch with the same content type and plan topics the finished item was requested with.
+		content_type = ContentType.LESSON
+		plan_topics: list[str] | None = None
+		try:
+			ctx = json.loads(row.prompt_context_json or "{}")
+			content_type = ContentType(ctx.get("contentType") or ContentType.LESSON.value)
+			plan_topics = [t for t in (ctx.get("planTopics") or []) if isinstance(t, str)] or None
+		except Exception:
+			pass
+		schedule_content_prefetch(
+			self.db, self.settings, int(studentUserId), contentType=content_type, planTopics=plan_topics
+		)
+
+	def _prefetch_fingerprint(
+		self,
+		student_user_id: int,
+		snapshot: StudentSnapshot,
+		target_topic: dict[str, Any] | None,
+	) -> str:
+		directives = [
+			[d["id"], d["contentType"], d["focusAreas"], d["instructions"]]
+			for d in self.directive_service.get_directives_as_dict(student_user_id)
+		]
+		inputs = {
+			"levels": [
+				snapshot.overall_level.value,
+				snapshot.reading_level.value,
+				snapshot.writing_level.value,
+				snapshot.listening_level.value,
+				snapshot.speaking_level.value,
+			],
+			"strengths": snapshot.strengths,
+			"weaknesses": snapshot.weaknesses,
+			"directives": sorted(directives, key=lambda d: d[0]),
+			"targetTopic": (target_topic or {}).get("name"),
+		}
+		return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+	def _valid_prefetched(self, student_db_id: int, fingerprint: str) -> list[PrefetchedContentDB]:
+		"""Ready items for the student; expired or outdated ones are dropped on the way."""
+		now = datetime.utcnow()
+		rows = self.db.scalars(
+			select(PrefetchedContentDB)
+			.where(PrefetchedContentDB.student_id == int(student_db_id))
+			.order_by(PrefetchedContentDB.created_at.asc(), PrefetchedContentDB.id.asc())
+		).all()
+		valid: list[PrefetchedContentDB] = []
+		stale_ids: list[int] = []
+		for p in rows:
+			if p.expires_at <= now or p.fingerprint != fingerprint:
+				stale_ids.append(int(p.id))
+			else:
+				valid.append(p)
+		if stale_ids:
+			# A bulk delete does not fail when a concurrent request already removed some of them.
+			self.db.execute(delete(PrefetchedContentDB).where(PrefetchedContentDB.id.in_(stale_ids)))
+			self.db.commit()
+		return valid
+
+	def _promote_prefetched(
+		self,
+		*,
+		student_user_id: int,
+		student_db_id: int,
+		snapshot: StudentSnapshot,
+		contentType: ContentType,
+		planTopics: list[str] | None,
+	) -> StudentAIContentDB | None:
+		if not self.settings.content_prefetch_enabled:
+			return None
+		target_topic = self._resolve_target_topic(student_db_id)
+		fingerprint = self._prefetch_fingerprint(student_user_id, snapshot, target_topic)
+		topics_key = _plan_topics_key(planTopics)
+		match = next(
+			(
+				p for p in self._valid_prefetched(student_db_id, fingerprint)
+				if p.content_type == contentType and p.plan_topics_key == topics_key
+			),
+			None,
+		)
+		if match is None:
+			return None
+		item = {c: getattr(match, c) for c in ("title", "body", "content_type", "level", "rationale", "prompt_context_json")}
+		# Claim the item: of two concurrent requests only one deletes the row; the other generates.
+		claimed = self.db.execute(
+			delete(PrefetchedContentDB).where(PrefetchedContentDB.id == int(match.id)),
+			execution_options={"synchronize_session": False},
+		)
+		self.db.expunge(match)
+		if claimed.rowcount != 1:
+			self.db.rollback()
+			return None
+
+		content = ContentDB(
+			title=item["title"],
+			body=item["body"],
+			content_type=item["content_type"],
+			level=item["level"],
+			created_by=int(student_user_id),
+			is_draft=False,
+		)
+		self.db.add(content)
+		self.db.flush()
+		row = StudentAIContentDB(
+			student_id=int(student_db_id),
+			content_id=int(content.id),
+			prompt_context_json=item["prompt_context_json"],
+			rationale=item["rationale"],
+			is_active=True,
+			completed_at=None,
+			batch_index=1,
+		)
+		self.db.add(row)
+		self.db.commit()
+		return row
+
 	def _get_or_create_student(self, studentUserId: int) -> StudentDB:
-		student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == int(studentUserId)))
+		student = student_for_user(self.db, int(studentUserId))
 		if student:
 			return student
 		# mirror StudentAnalysisService behavior (lazy create)
@@ -378,29 +587,7 @@ class StudentAIContentDeliveryService:
 		if int(active_count) > 0:
 			return []
 
-		# Fetch active plan and determine target topic
-		plan = self.db.scalar(
-			select(LessonPlanDB)
-			.where(LessonPlanDB.student_id == student_db_id)
-			.order_by(LessonPlanDB.created_at.desc())
-		)
-
-		target_topic = None
-		if plan and plan.topics_json:
-			try:
-				topics = json.loads(plan.topics_json)
-				progress = {}
-				if plan.progress_tracking_json:
-					progress = json.loads(plan.progress_tracking_json)
-				
-				for t in topics:
-					topic_name = t.get("name")
-					p = progress.get(topic_name, 0)
-					if p < 100:
-						target_topic = t
-						break
-			except Exception:
-				pass
+		target_topic = self._resolve_target_topic(student_db_id)
 
 		rows: list[StudentAIContentDB] = []
 		for i in range(1, self.ACTIVE_LIMIT + 1):
@@ -439,6 +626,32 @@ class StudentAIContentDeliveryService:
 		self.db.commit()
 		return rows
 
+	def _resolve_target_topic(self, student_db_id: int) -> dict[str, Any] | None:
+		"""First topic of the latest plan that is not yet at 100% progress."""
+		plan = self.db.scalar(
+			select(LessonPlanDB)
+			.where(LessonPlanDB.student_id == student_db_id)
+			.order_by(LessonPlanDB.created_at.desc())
+		)
+
+		target_topic = None
+		if plan and plan.topics_json:
+			try:
+				topics = json.loads(plan.topics_json)
+				progress = {}
+				if plan.progress_tracking_json:
+					progress = json.loads(plan.progress_tracking_json)
+				
+				for t in topics:
+					topic_name = t.get("name")
+					p = progress.get(topic_name, 0)
+					if p < 100:
+						target_topic = t
+						break
+			except Exception:
+				pass
+		return target_topic
+
 	def _resolve_target_skill(self, *, contentType: ContentType, planTopics: list[str] | None) -> str:
 		# Minimal mapping to satisfy "listening/speaking dummy" requirement.
 		# If multiple skill keywords are present, randomly choose among them
@@ -532,6 +745,8 @@ class StudentAIContentDeliveryService:
 						script=audio_file.script,
 						level=snapshot.listening_level,
 						num_questions=5,  # Generate 5 questions for content delivery
+						# Same audio + level gives the same prompt; rotate between a few cached sets.
+						cache=LLMCachePolicy(variants=3),
 					)
 					
 					# Build the content payload with audio and questions
@@ -804,7 +1019,7 @@ class StudentAIContentDeliveryService:
 				score_percent = 70.0  # Default pass
 
 			# Increment progress
-			student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == int(studentUserId)))
+			student = student_for_user(self.db, int(studentUserId))
 			plan = self.db.scalar(
 				select(LessonPlanDB)
 				.where(LessonPlanDB.student_id == student.id)
@@ -936,3 +1151,41 @@ class StudentAIContentDeliveryService:
 		
 		return blocks
 
+
+def schedule_content_prefetch(
+	db: Session,
+	settings: Settings,
+	studentUserId: int,
+	*,
+	contentType: ContentType = ContentType.LESSON,
+	planTopics: list[str] | None = None,
+) -> None:
+	"""Queue background generation of the student's next item (best-effort)."""
+	if not settings.content_prefetch_enabled or settings.content_prefetch_max_per_student <= 0:
+		return
+	payload: dict[str, Any] = {"studentUserId": int(studentUserId), "contentType": contentType.value}
+	if planTopics:
+		payload["planTopics"] = list(planTopics)
+	try:
+		JobService(db).enqueue(
+			"content.prefetch",
+			payload,
+			user_id=int(studentUserId),
+			max_attempts=2,
+		)
+	except Exception as e:
+		db.rollback()
+		logger.warning(f"Failed to schedule content prefetch: {e}")
+
+
+@register_job_handler("content.prefetch")
+def _run_prefetch_job(db: Session, payload: dict[str, Any], job: Any) -> dict[str, Any]:
+	from app.config.settings import get_settings
+
+	service = StudentAIContentDeliveryService(db=db, settings=get_settings())
+	item = service.prefetchNextContent(
+		int(payload["studentUserId"]),
+		contentType=ContentType(payload.get("contentType") or ContentType.LESSON.value),
+		planTopics=payload.get("planTopics"),
+	)
+	return {"prefetchedId": int(item.id) if item else None}
@@ -8,11 +8,28 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.config.settings import get_settings
 from app.domain.enums import LanguageLevel
 from app.infrastructure.db.models.content import LessonPlanDB, TopicDB
 from app.infrastructure.db.models.results import TestResultDB
 from app.infrastructure.db.models.user import StudentDB
+from app.application.services.student_ai_content_delivery_service import schedule_content_prefetch
 from app.application.services.teacher_directive_service import TeacherDirectiveService
+from app.infrastructure.db.identity import student_for_user
+
+
+def _extract_topics(text: str | None) -> list[Any]:
+	"""The JSON topic list in an LLM response ([] if there is none)."""
+	raw_text = (text or "").strip()
+	start = raw_text.find("[")
+	end = raw_text.rfind("]")
+	if start == -1 or end <= start:
+		return []
+	try:
+		topics = json.loads(raw_text[start : end + 1])
+	except ValueError:
+		return []
+	return [t for t in topics if isinstance(t, dict)] if isinstance(topics, list) else []
 
 
 class StudentAnalysisService:
@@ -71,6 +88,7 @@ class StudentAnalysisService:
 			existing.topics_json = topics_json
 			self.db.commit()
 			self.db.refresh(existing)
+			schedule_content_prefetch(self.db, get_settings(), studentUserId)
 			return existing
 
 		plan = LessonPlanDB(
@@ -82,6 +100,8 @@ class StudentAnalysisService:
 		self.db.add(plan)
 		self.db.commit()
 		self.db.refresh(plan)
+		# Have the first item of the new plan ready before the student asks for it.
+		schedule_content_prefetch(self.db, get_settings(), studentUserId)
 		return plan
 
 	def identifyStrengthsWeaknesses(self, results: list[TestResultDB]) -> dict[str, Any]:
@@ -209,7 +229,7 @@ class StudentAnalysisService:
 
 		try:
 			from app.config.settings import get_settings
-			from app.infrastructure.external.llm import LLMChatRequest, LLMMessage, get_llm_client
+			from app.infrastructure.external.llm import LLMCachePolicy, LLMChatRequest, LLMMessage, get_llm_client
 
 			settings = get_settings()
 			client = get_llm_client(settings)
@@ -221,18 +241,12 @@ class StudentAnalysisService:
 						LLMMessage(role="user", content=prompt),
 					],
 					temperature=0.7,
+					# Identical profiles produce identical prompts; reuse one of a few sampled plans.
+					cache=LLMCachePolicy(variants=3, accept=lambda text: bool(_extract_topics(text))),
 				)
 			)
 
-			raw_text = (resp.text or "").strip()
-			# Extract JSON
-			start = raw_text.find("[")
-			end = raw_text.rfind("]")
-			if start != -1 and end != -1:
-				json_str = raw_text[start : end + 1]
-				topics = json.loads(json_str)
-			else:
-				topics = [] # Fallback
+			topics = _extract_topics(resp.text)
 
 		except Exception as e:
 			# Fallback to heuristics if LLM fails
@@ -420,7 +434,7 @@ class StudentAnalysisService:
 		return "unknown"
 
 	def _get_student_by_user_id(self, user_id: int) -> StudentDB:
-		student = self.db.scalar(select(StudentDB).where(StudentDB.user_id == user_id))
+		student = student_for_user(self.db, user_id)
 		if not student:
 			# Create student profile lazily for UC7 demo flows
 			student = StudentDB(
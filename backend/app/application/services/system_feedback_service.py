@@ -37,6 +37,9 @@ class SystemFeedbackService:
 	def listFeedback(self):
 		return self.repo.findAll()
 
+	def listFeedbackPage(self, limit: int, cursor: str | None = None):
+		return self.repo.findPage(limit=limit, cursor=cursor)
+
 	def updateFeedbackStatus(self, feedbackId: int, status: str):
 		s = (status or "").strip().lower()
 		if s not in self.VALID_STATUSES:
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +30,45 @@ class Settings(BaseSettings):
 
 	# SQLite database (relative to backend/)
 	database_url: str = Field(default="sqlite:///./app.db")
+	# Migrations normally run via `python -m scripts.migrate`; startup only checks the version.
+	# Enable for single-process dev setups that should migrate on boot instead.
+	db_migrate_on_startup: bool = Field(default=False)
+
+	# SQLite engine profile, applied to every new connection (see infrastructure/db/session.py)
+	sqlite_profile_enabled: bool = Field(default=True)
+	sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = Field(default="WAL")
+	sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(default="NORMAL")
+	sqlite_busy_timeout_ms: int = Field(default=5000)
+	sqlite_cache_size_kib: int = Field(default=64 * 1024)
+	sqlite_mmap_size_bytes: int = Field(default=256 * 1024 * 1024)
+	sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(default="MEMORY")
+	db_pool_size: int = Field(default=10)
+	db_max_overflow: int = Field(default=20)
+	db_pool_timeout_seconds: float = Field(default=30.0)
+
+	# Per-request SQL instrumentation (see infrastructure/db/instrumentation.py); in debug mode
+	# responses also carry a Server-Timing header with the request's query count and DB time
+	sql_instrumentation_enabled: bool = Field(default=True)
+	# A statement shape repeated more often than this within one request is logged as a likely N+1
+	sql_n_plus_one_threshold: int = Field(default=10)
+	sql_slow_query_ms: float = Field(default=100.0)
+	# Fraction of slow queries written to the slow-query log (0..1)
+	sql_slow_query_sample_rate: float = Field(default=1.0)
+	sql_stats_history_size: int = Field(default=200)
+
+	# Workers cache the maintenance-mode flag; how often each checks the shared version for changes
+	maintenance_poll_interval_seconds: float = Field(default=1.0)
+
+	# Admin dashboard statistics: served from cache for this long, then refreshed in the background
+	# (stale-while-revalidate); older than max_stale they are recomputed before answering
+	admin_stats_ttl_seconds: float = Field(default=30.0)
+	admin_stats_max_stale_seconds: float = Field(default=600.0)
+
+	# Per-worker TTL/LRU cache of progress rows and snapshots (invalidated on completions,
+	# test scoring and grading; the TTL bounds how long other workers can lag behind)
+	progress_cache_enabled: bool = Field(default=True)
+	progress_cache_ttl_seconds: float = Field(default=60.0)
+	progress_cache_max_entries: int = Field(default=1024)
 
 	# Security (dev defaults; override with .env in real deployment)
 	secret_key: str = Field(default="dev-secret-change-me")
@@ -42,6 +82,43 @@ class Settings(BaseSettings):
 	google_genai_temperature: float = Field(default=0.1)
 	google_genai_max_output_tokens: int = Field(default=14000)
 
+	# Provider budgets for LLM calls (0 disables a per-minute budget)
+	llm_max_concurrency: int = Field(default=4)
+	llm_requests_per_minute: int = Field(default=60)
+	llm_tokens_per_minute: int = Field(default=250_000)
+	llm_queue_timeout_seconds: float = Field(default=30.0)
+	# Provider request timeout; coalesced callers also stop waiting for the in-flight call after it
+	llm_request_timeout_seconds: float = Field(default=120.0)
+
+	# Coalesce concurrent identical LLM requests into one provider call
+	llm_single_flight_enabled: bool = Field(default=True)
+
+	# LLM response cache (only call sites passing an LLMCachePolicy are cached)
+	llm_cache_enabled: bool = Field(default=True)
+	llm_cache_max_entries: int = Field(default=512)
+	llm_cache_persist: bool = Field(default=True)
+	llm_cache_ttl_seconds: int = Field(default=7 * 24 * 60 * 60)
+
+	# Listening question bank (pre-generated placement questions)
+	listening_bank_refill_enabled: bool = Field(default=True)
+	listening_bank_refill_interval_seconds: int = Field(default=6 * 60 * 60)
+
+	# Next AI content item generated in the background after completion / plan creation
+	content_prefetch_enabled: bool = Field(default=True)
+	content_prefetch_max_per_student: int = Field(default=2)
+	content_prefetch_ttl_hours: int = Field(default=24)
+
+	# Rebuild stored progress summaries left stale by writes that do not refresh them
+	progress_summary_refresh_enabled: bool = Field(default=True)
+	progress_summary_refresh_interval_seconds: int = Field(default=60)
+
+	# Background job runner (slow AI work answered with 202 + job id)
+	job_runner_enabled: bool = Field(default=True)
+	job_workers: int = Field(default=2)
+	job_poll_interval_seconds: float = Field(default=1.0)
+	# Running jobs whose worker has not heartbeated for this long are requeued
+	job_stale_after_seconds: int = Field(default=60)
+
 @lru_cache
 def get_settings() -> Settings:
 	return Settings()
\ No newline at end of file
@@ -5,7 +5,10 @@ from typing import Any
 
 class CachedProgressRepository:
     def getMostRecentProgress(self, studentId: int) -> Any:
-        pass
+        raise NotImplementedError()
 
     def cacheProgress(self, studentId: int, progress: Any) -> None:
-        pass
+        raise NotImplementedError()
+
+    def invalidate(self, studentId: int) -> None:
+        raise NotImplementedError()
@@ -11,5 +11,8 @@ class SystemFeedbackRepository:
     def findAll(self):
         raise NotImplementedError()
 
+    def findPage(self, limit: int, cursor: str | None = None):
+        raise NotImplementedError()
+
     def updateStatus(self, feedbackId: int, status: str):
         raise NotImplementedError()
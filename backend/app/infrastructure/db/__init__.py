@@ -1,11 +1,18 @@
 """Database infrastructure package.
 
 - base: DeclarativeBase and mixins
-- session: engine, SessionLocal, get_db dependency
+- session: engine, SessionLocal, get_db dependency (+ async_engine, AsyncSessionLocal, get_async_db)
 - models: all ORM table definitions
 """
 
 from app.infrastructure.db.base import Base
-from app.infrastructure.db.session import engine, get_db, SessionLocal
+from app.infrastructure.db.session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_async_db,
+    get_db,
+)
 
-__all__ = ["Base", "engine", "get_db", "SessionLocal"]
+__all__ = ["Base", "engine", "get_db", "SessionLocal", "async_engine", "get_async_db", "AsyncSessionLocal"]
@@ -0,0 +1,101 @@
+"""Bulk lookups by id, to replace per-row queries (N+1) in list endpoints.
+
+Collect the foreign keys of a page of rows first, then resolve them with one query:
+
+    names = bulk_values(db, UserDB.id, UserDB.name, {m.sender_id for m in msgs})
+    latest = latest_by(db, TestResultDB, TestResultDB.student_id, TestResultDB.completed_at, student_ids)
+
+Every helper has an `a`-prefixed twin for AsyncSession. Keys are sent in chunks so very
+large id sets stay below SQLite's bound-parameter limit.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, TypeVar
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+M = TypeVar("M")
+
+CHUNK_SIZE = 500
+
+
+def _chunks(keys: Iterable[Any]) -> Iterator[list[Any]]:
+    unique = [k for k in dict.fromkeys(keys) if k is not None]
+    for i in range(0, len(unique), CHUNK_SIZE):
+        yield unique[i : i + CHUNK_SIZE]
+
+
+def _rows_stmt(model: type[M], key_col: Any, keys: list[Any]) -> Select:
+    return select(model).where(key_col.in_(keys))
+
+
+def _values_stmt(key_col: Any, value_col: Any, keys: list[Any]) -> Select:
+    return select(key_col, value_col).where(key_col.in_(keys))
+
+
+def _latest_stmt(model: type[M], group_col: Any, order_col: Any, keys: list[Any]) -> Select:
+    # Newest row per group via ROW_NUMBER(); ties on order_col go to the highest id.
+    rank = (
+        func.row_number()
+        .over(partition_by=group_col, order_by=(order_col.desc(), model.id.desc()))
+        .label("rank")
+    )
+    ranked = select(model.id.label("id"), rank).where(group_col.in_(keys)).subquery()
+    return select(model).join(ranked, ranked.c.id == model.id).where(ranked.c.rank == 1)
+
+
+def bulk_get(db: Session, model: type[M], ids: Iterable[Any], *, key_col: Any = None) -> dict[Any, M]:
+    """Rows of `model` keyed by `key_col` (default: primary key `id`)."""
+    key_col = model.id if key_col is None else key_col
+    out: dict[Any, M] = {}
+    for chunk in _chunks(ids):
+        for row in db.scalars(_rows_stmt(model, key_col, chunk)).all():
+            out[getattr(row, key_col.key)] = row
+    return out
+
+
+def bulk_values(db: Session, key_col: Any, value_col: Any, keys: Iterable[Any]) -> dict[Any, Any]:
+    """{key: value} for a single column, e.g. bulk_values(db, UserDB.id, UserDB.name, user_ids)."""
+    out: dict[Any, Any] = {}
+    for chunk in _chunks(keys):
+        out.update(db.execute(_values_stmt(key_col, value_col, chunk)).all())
+    return out
+
+
+def latest_by(db: Session, model: type[M], group_col: Any, order_col: Any, keys: Iterable[Any]) -> dict[Any, M]:
+    """The newest row (by `order_col`) of `model` for each key of `group_col`."""
+    out: dict[Any, M] = {}
+    for chunk in _chunks(keys):
+        for row in db.scalars(_latest_stmt(model, group_col, order_col, chunk)).all():
+            out[getattr(row, group_col.key)] = row
+    return out
+
+
+async def abulk_get(db: AsyncSession, model: type[M], ids: Iterable[Any], *, key_col: Any = None) -> dict[Any, M]:
+    key_col = model.id if key_col is None else key_col
+    out: dict[Any, M] = {}
+    for chunk in _chunks(ids):
+        for row in (await db.scalars(_rows_stmt(model, key_col, chunk))).all():
+            out[getattr(row, key_col.key)] = row
+    return out
+
+
+async def abulk_values(db: AsyncSession, key_col: Any, value_col: Any, keys: Iterable[Any]) -> dict[Any, Any]:
+    out: dict[Any, Any] = {}
+    for chunk in _chunks(keys):
+        out.update((await db.execute(_values_stmt(key_col, value_col, chunk))).all())
+    return out
+
+
+async def alatest_by(
+    db: AsyncSession, model: type[M], group_col: Any, order_col: Any, keys: Iterable[Any]
+) -> dict[Any, M]:
+    out: dict[Any, M] = {}
+    for chunk in _chunks(keys):
+        for row in (await db.scalars(_latest_stmt(model, group_col, order_col, chunk))).all():
+            out[getattr(row, group_col.key)] = row
+    return out
@@ -0,0 +1,89 @@
+"""Version stamps for per-student derived data (chatbot context, progress summary, etc.).
+
+A SQLAlchemy `after_flush` hook bumps `student_context_versions.version` for every
+student whose test results, learning plan, AI content, feedback, teacher directives,
+progress rows or profile row were inserted/updated/deleted in the flush. The bump runs
+on the flush's connection, so it commits or rolls back together with the change. Caches
+store the version they were built at and compare it with one primary-key lookup.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.content import LessonPlanDB
+from app.infrastructure.db.models.feedback import FeedbackDB
+from app.infrastructure.db.models.progress import ProgressDB, ProgressSnapshotDB
+from app.infrastructure.db.models.results import TestResultDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.models.student_context_version import StudentContextVersionDB
+from app.infrastructure.db.models.teacher_directive import TeacherDirectiveDB
+from app.infrastructure.db.models.user import StudentDB
+
+# Models carrying students.id directly.
+_STUDENT_ID_MODELS = (TestResultDB, LessonPlanDB, StudentAIContentDB, FeedbackDB, ProgressDB, ProgressSnapshotDB)
+
+
+def get_student_context_version(db: Session, student_id: int) -> int:
+    version = db.scalar(
+        select(StudentContextVersionDB.version).where(StudentContextVersionDB.student_id == student_id)
+    )
+    return int(version or 0)
+
+
+def bump_student_context_versions(connection: Any, student_ids: Iterable[int]) -> None:
+    now = datetime.utcnow()
+    table = StudentContextVersionDB.__table__
+    for student_id in sorted(set(student_ids)):
+        if connection.dialect.name == "sqlite":
+            stmt = sqlite_insert(table).values(student_id=student_id, version=1, updated_at=now)
+            connection.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[table.c.student_id],
+                    set_={"version": table.c.version + 1, "updated_at": now},
+                )
+            )
+            continue
+        result = connection.execute(
+            update(table)
+            .where(table.c.student_id == student_id)
+            .values(version=table.c.version + 1, updated_at=now)
+        )
+        if not result.rowcount:
+            connection.execute(insert(table).values(student_id=student_id, version=1, updated_at=now))
+
+
+def _affected_students(session: Session) -> tuple[set[int], set[int]]:
+    student_ids: set[int] = set()
+    student_user_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, _STUDENT_ID_MODELS):
+            if obj.student_id is not None:
+                student_ids.add(int(obj.student_id))
+        elif isinstance(obj, StudentDB):
+            if obj.id is not None:
+                student_ids.add(int(obj.id))
+        elif isinstance(obj, TeacherDirectiveDB):
+            if obj.student_user_id is not None:
+                student_user_ids.add(int(obj.student_user_id))
+    return student_ids, student_user_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_versions_after_flush(session: Session, flush_context: Any) -> None:
+    student_ids, student_user_ids = _affected_students(session)
+    if not student_ids and not student_user_ids:
+        return
+    connection = session.connection()
+    if student_user_ids:
+        rows = connection.execute(select(StudentDB.id).where(StudentDB.user_id.in_(student_user_ids))).scalars()
+        student_ids.update(int(r) for r in rows)
+    if student_ids:
+        bump_student_context_versions(connection, student_ids)
@@ -0,0 +1,226 @@
+"""Daily activity rollup: per student and day, how much they did.
+
+`daily_activity` holds one row per (student, date) with these counters:
+
+- content_completed: StudentAIContentDB rows completed that day (completed_at)
+- tests_completed: TestResultDB rows (completed_at)
+- chat_turns: ChatMessageDB rows the student sent (sender "user"; timestamp)
+- points: RewardDB.points of the StudentRewardDB rows earned that day (earned_at)
+
+An `after_flush` hook turns inserts, deletes and date changes of those rows into deltas and
+applies them on the flush's connection, so the rollup commits or rolls back together with
+the events. Bulk `Query.update()/delete()` and raw SQL bypass the hook;
+`rebuild_daily_activity` (`python -m scripts.backfill_daily_activity`) recomputes the table
+from the event tables. Dashboards read the rollup with `daily_totals`.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.chatbot import ChatMessageDB, ChatSessionDB
+from app.infrastructure.db.models.progress import DailyActivityDB
+from app.infrastructure.db.models.results import TestResultDB
+from app.infrastructure.db.models.rewards import RewardDB, StudentRewardDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+
+
+METRICS = ("content_completed", "tests_completed", "chat_turns", "points")
+
+# model -> (metric, date attribute)
+_SOURCES: dict[type, tuple[str, str]] = {
+    StudentAIContentDB: ("content_completed", "completed_at"),
+    TestResultDB: ("tests_completed", "completed_at"),
+    ChatMessageDB: ("chat_turns", "timestamp"),
+    StudentRewardDB: ("points", "earned_at"),
+}
+
+Deltas = dict[tuple[int, date], dict[str, int]]
+
+
+def _as_date(value: Any) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _before(obj: Any, attr: str) -> Any:
+    """Value of `attr` as loaded from the database (None if it was never loaded)."""
+    hist = inspect(obj).attrs[attr].history
+    values = hist.deleted or hist.unchanged
+    return values[0] if values else None
+
+
+def _date_moves(session: Session) -> list[tuple[Any, date | None, date | None]]:
+    """(row, date it was counted on, date it counts on now) for every event row changed in the flush."""
+    moves = []
+    for obj in session.new:
+        if type(obj) in _SOURCES:
+            moves.append((obj, None, _as_date(getattr(obj, _SOURCES[type(obj)][1]))))
+    for obj in session.deleted:
+        if type(obj) in _SOURCES:
+            moves.append((obj, _as_date(_before(obj, _SOURCES[type(obj)][1])), None))
+    for obj in session.dirty:
+        if type(obj) not in _SOURCES:
+            continue
+        hist = inspect(obj).attrs[_SOURCES[type(obj)][1]].history
+        if not hist.has_changes():
+            continue
+        old = _as_date(hist.deleted[0]) if hist.deleted else None
+        new = _as_date(hist.added[0]) if hist.added else None
+        if old != new:
+            moves.append((obj, old, new))
+    return moves
+
+
+def _reader(old: date | None, new: date | None) -> Any:
+    # A row that stops counting (deleted, or its date cleared) is attributed with its loaded values.
+    return _before if new is None and old is not None else getattr
+
+
+def _collect_deltas(connection: Any, moves: list[tuple[Any, date | None, date | None]]) -> Deltas:
+    session_ids: set[int] = set()
+    reward_ids: set[int] = set()
+    for obj, old, new in moves:
+        read = _reader(old, new)
+        if isinstance(obj, ChatMessageDB) and read(obj, "session_id") is not None:
+            session_ids.add(int(read(obj, "session_id")))
+        elif isinstance(obj, StudentRewardDB) and read(obj, "reward_id") is not None:
+            reward_ids.add(int(read(obj, "reward_id")))
+
+    # One lookup per kind for rows that do not carry students.id / points themselves.
+    session_students: dict[int, int] = {}
+    if session_ids:
+        rows = connection.execute(
+            select(ChatSessionDB.id, ChatSessionDB.student_id).where(ChatSessionDB.id.in_(session_ids))
+        ).all()
+        session_students = {int(sid): int(student_id) for sid, student_id in rows}
+    reward_points: dict[int, int] = {}
+    if reward_ids:
+        rows = connection.execute(select(RewardDB.id, RewardDB.points).where(RewardDB.id.in_(reward_ids))).all()
+        reward_points = {int(rid): int(points or 0) for rid, points in rows}
+
+    deltas: Deltas = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+    for obj, old, new in moves:
+        metric = _SOURCES[type(obj)][0]
+        read = _reader(old, new)
+        amount = 1
+        if isinstance(obj, ChatMessageDB):
+            if read(obj, "sender") != "user":
+                continue
+            student_id = session_students.get(read(obj, "session_id"))
+        else:
+            student_id = read(obj, "student_id")
+        if isinstance(obj, StudentRewardDB):
+            amount = reward_points.get(read(obj, "reward_id"), 0)
+        if student_id is None or not amount:
+            continue
+        if old is not None:
+            deltas[(int(student_id), old)][metric] -= amount
+        if new is not None:
+            deltas[(int(student_id), new)][metric] += amount
+    return deltas
+
+
+def apply_activity_deltas(connection: Any, deltas: Deltas) -> None:
+    table = DailyActivityDB.__table__
+    for (student_id, day), values in sorted(deltas.items()):
+        changed = {metric: amount for metric, amount in values.items() if amount}
+        if not changed:
+            continue
+        if connection.dialect.name == "sqlite":
+            stmt = sqlite_insert(table).values(
+                student_id=student_id, activity_date=day, **{m: changed.get(m, 0) for m in METRICS}
+            )
+            connection.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[table.c.student_id, table.c.activity_date],
+                    set_={m: table.c[m] + stmt.excluded[m] for m in changed},
+                )
+            )
+            continue
+        result = connection.execute(
+            update(table)
+            .where(table.c.student_id == student_id, table.c.activity_date == day)
+            .values({m: table.c[m] + amount for m, amount in changed.items()})
+        )
+        if not result.rowcount:
+            connection.execute(
+                insert(table).values(student_id=student_id, activity_date=day, **{m: changed.get(m, 0) for m in METRICS})
+            )
+
+
+@event.listens_for(Session, "after_flush")
+def _update_daily_activity_after_flush(session: Session, flush_context: Any) -> None:
+    moves = _date_moves(session)
+    if not moves:
+        return
+    connection = session.connection()
+    apply_activity_deltas(connection, _collect_deltas(connection, moves))
+
+
+def rebuild_daily_activity(connection: Any) -> int:
+    """Recompute the whole rollup from the event tables. Returns the number of rows written."""
+    day = func.date
+    sources = {
+        "content_completed": select(
+            StudentAIContentDB.student_id, day(StudentAIContentDB.completed_at), func.count()
+        )
+        .where(StudentAIContentDB.completed_at.is_not(None))
+        .group_by(StudentAIContentDB.student_id, day(StudentAIContentDB.completed_at)),
+        "tests_completed": select(TestResultDB.student_id, day(TestResultDB.completed_at), func.count())
+        .group_by(TestResultDB.student_id, day(TestResultDB.completed_at)),
+        "chat_turns": select(ChatSessionDB.student_id, day(ChatMessageDB.timestamp), func.count())
+        .join(ChatSessionDB, ChatSessionDB.id == ChatMessageDB.session_id)
+        .where(ChatMessageDB.sender == "user")
+        .group_by(ChatSessionDB.student_id, day(ChatMessageDB.timestamp)),
+        "points": select(StudentRewardDB.student_id, day(StudentRewardDB.earned_at), func.sum(RewardDB.points))
+        .join(RewardDB, RewardDB.id == StudentRewardDB.reward_id)
+        .group_by(StudentRewardDB.student_id, day(StudentRewardDB.earned_at)),
+    }
+    totals: Deltas = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+    for metric, stmt in sources.items():
+        for student_id, raw_day, amount in connection.execute(stmt):
+            activity_date = _as_date(raw_day)
+            if student_id is None or activity_date is None or not amount:
+                continue
+            totals[(int(student_id), activity_date)][metric] += int(amount)
+
+    table = DailyActivityDB.__table__
+    connection.execute(delete(table))
+    rows = [
+        {"student_id": student_id, "activity_date": activity_date, **values}
+        for (student_id, activity_date), values in sorted(totals.items())
+    ]
+    if rows:
+        connection.execute(insert(table), rows)
+    return len(rows)
+
+
+def _totals_stmt(since: date | None, student_id: int | None):
+    stmt = select(DailyActivityDB.activity_date, *(func.sum(DailyActivityDB.__table__.c[m]) for m in METRICS))
+    if since is not None:
+        stmt = stmt.where(DailyActivityDB.activity_date >= since)
+    if student_id is not None:
+        stmt = stmt.where(DailyActivityDB.student_id == int(student_id))
+    return stmt.group_by(DailyActivityDB.activity_date).order_by(DailyActivityDB.activity_date)
+
+
+def _totals(rows: Any) -> dict[date, dict[str, int]]:
+    return {_as_date(d): {m: int(v or 0) for m, v in zip(METRICS, values)} for d, *values in rows}
+
+
+def daily_totals(db: Session, *, since: date | None = None, student_id: int | None = None) -> dict[date, dict[str, int]]:
+    """{date: {metric: total}} summed over all students (or one), oldest first. One query."""
+    return _totals(db.execute(_totals_stmt(since, student_id)).all())
+
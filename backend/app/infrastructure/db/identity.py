@@ -0,0 +1,109 @@
+"""Request-scoped identity: the authenticated user and their profile row ids, resolved once.
+
+`get_current_user` loads the user together with its student/teacher/admin rows in one
+query and binds the result to the request's Session (`Session.info`). Route helpers and
+services that need "the StudentDB row of user X" go through `student_for_user` /
+`student_id_for_user` (and the teacher/admin equivalents): when X is the bound user the
+answer comes from the identity (the row itself from the session's identity map), so the
+repeated `select(StudentDB).where(StudentDB.user_id == ...)` lookups disappear. For any
+other user, or a session with no bound identity (background jobs, scripts, tests), they
+fall back to the query, so service signatures and behaviour are unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from app.domain.enums import UserRole
+from app.infrastructure.db.models.user import AdminDB, StudentDB, TeacherDB, UserDB
+
+
+_INFO_KEY = "request_identity"
+
+
+@dataclass(frozen=True)
+class RequestIdentity:
+    userId: int
+    role: UserRole
+    studentId: int | None = None
+    teacherId: int | None = None
+    adminId: int | None = None
+    # Holds the loaded rows in the session (its identity map only keeps weak references).
+    user: UserDB | None = field(default=None, repr=False, compare=False)
+
+
+def load_identity(db: Session, user_id: int) -> RequestIdentity | None:
+    """Identity of `user_id`, None if there is no such user.
+
+    One query; while the identity is referenced the user row and its profile rows stay in the
+    session's identity map, so `db.get(UserDB, user_id)` (and its `.student` etc.) or
+    `student_for_user` do not hit the database again.
+    """
+    user = db.scalar(
+        select(UserDB)
+        .options(joinedload(UserDB.student), joinedload(UserDB.teacher), joinedload(UserDB.admin))
+        .where(UserDB.id == int(user_id))
+    )
+    if user is None:
+        return None
+    return RequestIdentity(
+        userId=int(user.id),
+        role=user.role,
+        studentId=int(user.student.id) if user.student else None,
+        teacherId=int(user.teacher.id) if user.teacher else None,
+        adminId=int(user.admin.id) if user.admin else None,
+        user=user,
+    )
+
+
+def bind_identity(db: Session, identity: RequestIdentity) -> None:
+    db.info[_INFO_KEY] = identity
+
+
+def bound_identity(db: Session, user_id: int | None = None) -> RequestIdentity | None:
+    """The identity bound to `db`, optionally only if it belongs to `user_id`."""
+    identity = db.info.get(_INFO_KEY)
+    if identity is None or (user_id is not None and identity.userId != int(user_id)):
+        return None
+    return identity
+
+
+def student_id_for_user(db: Session, user_id: int) -> int | None:
+    identity = bound_identity(db, user_id)
+    if identity is not None and identity.studentId is not None:
+        return identity.studentId
+    student_id = db.scalar(select(StudentDB.id).where(StudentDB.user_id == int(user_id)))
+    return int(student_id) if student_id is not None else None
+
+
+def student_for_user(db: Session, user_id: int) -> StudentDB | None:
+    identity = bound_identity(db, user_id)
+    if identity is not None and identity.studentId is not None:
+        return db.get(StudentDB, identity.studentId)
+    return db.scalar(select(StudentDB).where(StudentDB.user_id == int(user_id)))
+
+
+def teacher_id_for_user(db: Session, user_id: int) -> int | None:
+    identity = bound_identity(db, user_id)
+    if identity is not None and identity.teacherId is not None:
+        return identity.teacherId
+    teacher_id = db.scalar(select(TeacherDB.id).where(TeacherDB.user_id == int(user_id)))
+    return int(teacher_id) if teacher_id is not None else None
+
+
+def teacher_for_user(db: Session, user_id: int) -> TeacherDB | None:
+    identity = bound_identity(db, user_id)
+    if identity is not None and identity.teacherId is not None:
+        return db.get(TeacherDB, identity.teacherId)
+    return db.scalar(select(TeacherDB).where(TeacherDB.user_id == int(user_id)))
+
+
+def admin_id_for_user(db: Session, user_id: int) -> int | None:
+    identity = bound_identity(db, user_id)
+    if identity is not None and identity.adminId is not None:
+        return identity.adminId
+    admin_id = db.scalar(select(AdminDB.id).where(AdminDB.user_id == int(user_id)))
+    return int(admin_id) if admin_id is not None else None
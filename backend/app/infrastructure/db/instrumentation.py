@@ -0,0 +1,243 @@
+"""Per-request SQL instrumentation.
+
+`instrument_engine` hooks `before/after_cursor_execute` on an engine (the async engine's
+`sync_engine` included) and attributes every statement to the request being served,
+through a context variable set by `SQLInstrumentationMiddleware` (app/api/middleware.py).
+Per request it records the statement count, the total time spent in the database and
+the slowest statements, and counts statement *shapes* (SQL with literals and IN lists
+collapsed): one shape repeated more than `sql_n_plus_one_threshold` times is the
+signature of an N+1 loop and is logged as a warning.
+
+Statements slower than `sql_slow_query_ms` go to the `app.sql.slow` logger, sampled by
+`sql_slow_query_sample_rate`, whether or not they ran inside a request (background jobs
+included). Recent request summaries, N+1 offenders and slow queries are kept in bounded
+in-memory buffers per worker process and served by GET /api/admin/sql-stats.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.settings import Settings, get_settings
+
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+_STARTED_KEY = "sql_instrumentation_started"
+_MAX_SQL_CHARS = 500
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+def statement_shape(sql: str) -> str:
+    """`sql` with literals replaced by ? and IN (?, ?, ...) collapsed, for grouping repeats."""
+    shape = _STRING.sub("?", sql)
+    shape = _NUMBER.sub("?", shape)
+    shape = _IN_LIST.sub("(?)", shape)
+    return _SPACE.sub(" ", shape).strip()[:_MAX_SQL_CHARS]
+
+
+@dataclass
+class RequestSQLStats:
+    """Statements issued while serving one request."""
+
+    method: str
+    path: str
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    statements: int = 0
+    db_time_ms: float = 0.0
+    status_code: int | None = None
+    duration_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, shape: str, elapsed_ms: float, keep: int) -> None:
+        self.statements += 1
+        self.db_time_ms += elapsed_ms
+        self.shapes[shape] += 1
+        if len(self.slowest) < keep or elapsed_ms > self.slowest[-1][0]:
+            self.slowest.append((elapsed_ms, shape))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[keep:]
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {shape: n for shape, n in self.shapes.most_common() if n > threshold}
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_time_ms:.1f};desc="{self.statements} queries"'
+
+    def summary(self, threshold: int) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": self.status_code,
+            "startedAt": self.started_at.isoformat(),
+            "durationMs": round(self.duration_ms, 2),
+            "statements": self.statements,
+            "dbTimeMs": round(self.db_time_ms, 2),
+            "slowest": [{"ms": round(ms, 2), "sql": sql} for ms, sql in self.slowest],
+            "repeated": [{"sql": sql, "count": n} for sql, n in self.repeated(threshold).items()],
+        }
+
+
+_current: ContextVar[RequestSQLStats | None] = ContextVar("sql_request_stats", default=None)
+
+
+class SQLStatsRecorder:
+    """Collects per-request statistics and keeps the most recent ones for the admin endpoint."""
+
+    def __init__(
+        self,
+        *,
+        n_plus_one_threshold: int = 10,
+        slow_query_ms: float = 100.0,
+        slow_query_sample_rate: float = 1.0,
+        history_size: int = 200,
+        slowest_per_request: int = 5,
+    ) -> None:
+        self.n_plus_one_threshold = max(1, int(n_plus_one_threshold))
+        self.slow_query_ms = float(slow_query_ms)
+        self.slow_query_sample_rate = float(slow_query_sample_rate)
+        self.slowest_per_request = max(1, int(slowest_per_request))
+        self._lock = threading.Lock()
+        self._requests: deque[dict[str, Any]] = deque(maxlen=max(1, int(history_size)))
+        self._n_plus_one: deque[dict[str, Any]] = deque(maxlen=max(1, int(history_size)))
+        self._slow_queries: deque[dict[str, Any]] = deque(maxlen=max(1, int(history_size)))
+
+    @classmethod
+    def from_settings(cls, cfg: Settings) -> "SQLStatsRecorder":
+        return cls(
+            n_plus_one_threshold=cfg.sql_n_plus_one_threshold,
+            slow_query_ms=cfg.sql_slow_query_ms,
+            slow_query_sample_rate=cfg.sql_slow_query_sample_rate,
+            history_size=cfg.sql_stats_history_size,
+        )
+
+    # ---- request scope ----
+
+    def start_request(self, method: str, path: str) -> tuple[RequestSQLStats, Token]:
+        stats = RequestSQLStats(method=method, path=path)
+        return stats, _current.set(stats)
+
+    def finish_request(self, stats: RequestSQLStats, token: Token) -> dict[str, Any]:
+        _current.reset(token)
+        summary = stats.summary(self.n_plus_one_threshold)
+        with self._lock:
+            self._requests.append(summary)
+            if summary["repeated"]:
+                self._n_plus_one.append(summary)
+        for item in summary["repeated"]:
+            logger.warning(
+                "Possible N+1 in %s %s: statement repeated %s times: %s",
+                stats.method,
+                stats.path,
+                item["count"],
+                item["sql"],
+            )
+        return summary
+
+    # ---- statement hook ----
+
+    def record_statement(self, sql: str, elapsed_ms: float) -> None:
+        stats = _current.get()
+        shape = statement_shape(sql)
+        if stats is not None:
+            stats.record(shape, elapsed_ms, self.slowest_per_request)
+        if elapsed_ms >= self.slow_query_ms and random.random() < self.slow_query_sample_rate:
+            where = f"{stats.method} {stats.path}" if stats is not None else "(no request)"
+            slow_query_logger.warning("Slow query (%.1f ms) in %s: %s", elapsed_ms, where, shape)
+            with self._lock:
+                self._slow_queries.append(
+                    {"at": datetime.utcnow().isoformat(), "ms": round(elapsed_ms, 2), "request": where, "sql": shape}
+                )
+
+    # ---- reporting ----
+
+    def snapshot(self) -> dict[str, Any]:
+        """Recent requests (newest first), N+1 offenders, slow queries and per-route aggregates."""
+        with self._lock:
+            requests = list(self._requests)
+            n_plus_one = list(self._n_plus_one)
+            slow = list(self._slow_queries)
+
+        routes: dict[tuple[str, str], dict[str, Any]] = {}
+        for r in requests:
+            agg = routes.setdefault(
+                (r["method"], r["path"]),
+                {"method": r["method"], "path": r["path"], "requests": 0, "statements": 0, "maxStatements": 0, "dbTimeMs": 0.0},
+            )
+            agg["requests"] += 1
+            agg["statements"] += r["statements"]
+            agg["maxStatements"] = max(agg["maxStatements"], r["statements"])
+            agg["dbTimeMs"] += r["dbTimeMs"]
+        by_route = [
+            {
+                "method": a["method"],
+                "path": a["path"],
+                "requests": a["requests"],
+                "avgStatements": round(a["statements"] / a["requests"], 2),
+                "maxStatements": a["maxStatements"],
+                "avgDbTimeMs": round(a["dbTimeMs"] / a["requests"], 2),
+            }
+            for a in routes.values()
+        ]
+        by_route.sort(key=lambda a: a["avgDbTimeMs"], reverse=True)
+        return {
+            "nPlusOneThreshold": self.n_plus_one_threshold,
+            "slowQueryMs": self.slow_query_ms,
+            "routes": by_route,
+            "requests": requests[::-1],
+            "nPlusOne": n_plus_one[::-1],
+            "slowQueries": slow[::-1],
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._n_plus_one.clear()
+            self._slow_queries.clear()
+
+
+_recorder = SQLStatsRecorder.from_settings(get_settings())
+
+
+def get_sql_stats() -> SQLStatsRecorder:
+    return _recorder
+
+
+def instrument_engine(target: Engine, recorder: SQLStatsRecorder | None = None) -> None:
+    """Time every statement executed on `target` and report it to `recorder` (default: the shared one)."""
+    recorder = recorder or _recorder
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        started = conn.info.get(_STARTED_KEY)
+        if started:
+            recorder.record_statement(statement, (time.perf_counter() - started.pop()) * 1000)
+
+    @event.listens_for(target, "handle_error")
+    def _error(exception_context):  # noqa: ANN001
+        conn = exception_context.connection
+        started = conn.info.get(_STARTED_KEY) if conn is not None else None
+        if started:
+            started.pop()
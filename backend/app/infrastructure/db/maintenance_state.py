@@ -0,0 +1,141 @@
+"""In-process cache of the maintenance-mode flag.
+
+Every authenticated request checks maintenance mode, so the open MaintenanceLogDB row is
+cached per worker instead of queried per request. Any insert/update/delete of a
+MaintenanceLogDB row bumps the `maintenance` row of `system_state_versions` in the same
+transaction (flush hook below). A worker compares its cached version with that row at most
+once per `maintenance_poll_interval_seconds` (one primary-key lookup) and reloads the state
+only when it changed; AdminService.setMaintenanceMode refreshes the local cache directly.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.config.settings import get_settings
+from app.infrastructure.db.models.system import MaintenanceLogDB, SystemStateVersionDB
+
+
+MAINTENANCE_KEY = "maintenance"
+
+
+def get_system_state_version(db: Session, key: str) -> int:
+    version = db.scalar(select(SystemStateVersionDB.version).where(SystemStateVersionDB.key == key))
+    return int(version or 0)
+
+
+def bump_system_state_version(connection: Any, key: str) -> None:
+    now = datetime.utcnow()
+    table = SystemStateVersionDB.__table__
+    if connection.dialect.name == "sqlite":
+        stmt = sqlite_insert(table).values(key=key, version=1, updated_at=now)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={"version": table.c.version + 1, "updated_at": now},
+            )
+        )
+        return
+    result = connection.execute(
+        update(table).where(table.c.key == key).values(version=table.c.version + 1, updated_at=now)
+    )
+    if not result.rowcount:
+        connection.execute(insert(table).values(key=key, version=1, updated_at=now))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_maintenance_version_after_flush(session: Session, flush_context: Any) -> None:
+    if any(isinstance(obj, MaintenanceLogDB) for obj in (*session.new, *session.dirty, *session.deleted)):
+        bump_system_state_version(session.connection(), MAINTENANCE_KEY)
+
+
+@dataclass(frozen=True)
+class MaintenanceState:
+    enabled: bool
+    reason: str | None = None
+    announcement: str | None = None
+    startedAt: datetime | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "reason": self.reason,
+            "announcement": self.announcement,
+            "startedAt": self.startedAt,
+        }
+
+
+def load_maintenance_state(db: Session) -> MaintenanceState:
+    open_log = db.scalar(
+        select(MaintenanceLogDB)
+        .where(MaintenanceLogDB.end_time.is_(None))
+        .order_by(MaintenanceLogDB.start_time.desc())
+        .limit(1)
+    )
+    if not open_log:
+        return MaintenanceState(enabled=False)
+    return MaintenanceState(
+        enabled=True,
+        reason=open_log.reason,
+        announcement=open_log.announcement,
+        startedAt=open_log.start_time,
+    )
+
+
+@dataclass
+class _Entry:
+    version: int
+    state: MaintenanceState
+    checked_at: float
+
+
+class MaintenanceStateCache:
+    """Maintenance state per database (engine), revalidated against its version at most every `poll_interval` seconds."""
+
+    def __init__(self, *, poll_interval: float = 1.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.poll_interval = float(poll_interval)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[Any, _Entry] = weakref.WeakKeyDictionary()
+
+    def get(self, db: Session) -> MaintenanceState:
+        bind = db.get_bind()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(bind)
+        if entry is not None and now - entry.checked_at < self.poll_interval:
+            return entry.state
+        version = get_system_state_version(db, MAINTENANCE_KEY)
+        if entry is not None and entry.version == version:
+            with self._lock:
+                self._entries[bind] = _Entry(version, entry.state, now)
+            return entry.state
+        return self._store(db, version, now)
+
+    def refresh(self, db: Session) -> MaintenanceState:
+        """Reload from the database now (after a change made through `db`)."""
+        return self._store(db, get_system_state_version(db, MAINTENANCE_KEY), self._clock())
+
+    def _store(self, db: Session, version: int, now: float) -> MaintenanceState:
+        # The version is read before the state: a change in between leaves an older version
+        # with a newer state, which the next poll reloads, never the reverse.
+        state = load_maintenance_state(db)
+        with self._lock:
+            self._entries[db.get_bind()] = _Entry(version, state, now)
+        return state
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+maintenance_state_cache = MaintenanceStateCache(poll_interval=get_settings().maintenance_poll_interval_seconds)
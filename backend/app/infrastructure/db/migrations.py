@@ -0,0 +1,398 @@
+"""Versioned schema migrations.
+
+Migrations are applied by a separate command (`python -m scripts.migrate`), once per
+deployment, instead of by every worker at boot. The applied versions are recorded in
+the `schema_version` table; application startup only compares the highest recorded
+version with LATEST_VERSION (a single query) and refuses to start on a stale schema.
+
+Each migration runs in its own transaction together with its schema_version row.
+SQLite commits some DDL implicitly, so migrations are written to be idempotent: one
+interrupted half-way is simply applied again by the next run. Append new migrations
+to MIGRATIONS with the next version number; never renumber or edit applied ones.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import Base
+import app.infrastructure.db.models  # noqa: F401  (registers all tables)
+from app.infrastructure.db.models.schema_version import SchemaVersionDB
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised at startup when the database has not been migrated to LATEST_VERSION."""
+
+
+# ---- helpers for idempotent migrations ----
+
+
+def add_missing_columns(conn: Connection, table: str, columns: dict[str, str]) -> list[str]:
+    """ALTER TABLE ADD COLUMN for each `name: ddl` not present yet. No-op if the table is missing."""
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return []
+    existing = {c["name"] for c in inspector.get_columns(table)}
+    added = []
+    for name, ddl in columns.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+            added.append(name)
+    return added
+
+
+def create_missing_indexes(conn: Connection) -> list[str]:
+    """Create every index declared on the models that an existing table lacks.
+
+    create_all() only creates indexes together with new tables, so databases created
+    before an index was declared need this.
+    """
+    inspector = inspect(conn)
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                index.create(conn, checkfirst=True)
+                created.append(index.name)
+    return created
+
+
+# ---- migrations ----
+
+# Tables of the schema the versioned migrations started from. Tables added later are
+# created by their own migration, so this list never grows.
+BASELINE_TABLES: tuple[str, ...] = (
+    "admins",
+    "announcements",
+    "assignment_questions",
+    "assignments",
+    "chat_messages",
+    "chat_sessions",
+    "contents",
+    "exercises",
+    "feedback",
+    "lesson_plans",
+    "listening_questions",
+    "listening_tests",
+    "maintenance_logs",
+    "messages",
+    "placement_tests",
+    "progress",
+    "progress_snapshots",
+    "questions",
+    "reading_questions",
+    "reading_tests",
+    "rewards",
+    "speaking_results",
+    "speaking_tests",
+    "student_ai_contents",
+    "student_assignment_answers",
+    "student_assignments",
+    "student_rewards",
+    "students",
+    "system_feedback",
+    "system_performance",
+    "teacher_directives",
+    "teachers",
+    "test_modules",
+    "test_results",
+    "test_sessions",
+    "tests",
+    "topics",
+    "users",
+    "writing_questions",
+    "writing_tests",
+)
+
+
+def _create_tables(conn: Connection) -> None:
+    # Creates only missing tables, so this is also the upgrade path for pre-migration databases.
+    Base.metadata.create_all(conn, tables=[Base.metadata.tables[name] for name in BASELINE_TABLES])
+
+
+def _system_feedback_columns(conn: Connection) -> None:
+    add_missing_columns(
+        conn,
+        "system_feedback",
+        {
+            "category": "VARCHAR(50) NOT NULL DEFAULT 'other'",
+            "status": "VARCHAR(50) NOT NULL DEFAULT 'pending'",
+        },
+    )
+
+
+def _listening_bank_key_column(conn: Connection) -> None:
+    add_missing_columns(conn, "listening_questions", {"bank_key": "VARCHAR(64)"})
+
+
+def _chat_summary_columns(conn: Connection) -> None:
+    add_missing_columns(
+        conn,
+        "chat_sessions",
+        {"summary": "TEXT", "summary_through_message_id": "INTEGER"},
+    )
+
+
+def _maintenance_announcement_column(conn: Connection) -> None:
+    add_missing_columns(conn, "maintenance_logs", {"announcement": "TEXT"})
+
+
+def _hot_query_indexes(conn: Connection) -> None:
+    create_missing_indexes(conn)
+
+
+def _seed_achievements(conn: Connection) -> None:
+    from app.application.services.achievement_service import AchievementService
+
+    # The session joins the migration's transaction; its commit does not end it.
+    with Session(bind=conn) as db:
+        AchievementService(db).initialize_achievements()
+
+
+def _legacy_module_payload(raw: str | None) -> dict[str, Any]:
+    # test_modules.questions_json held {"question_ids": [...], "submissions": [...], "speaking_audio": [...]}
+    # (or, in the oldest rows, just the list of question ids).
+    if not raw:
+        return {}
+    try:
+        obj = json.loads(raw)
+    except Exception:
+        return {}
+    return obj if isinstance(obj, dict) else {"question_ids": obj}
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _placement_submission_tables(conn: Connection) -> None:
+    """Move placement module questions, submissions and speaking analyses out of questions_json."""
+    from app.infrastructure.db.models.tests import (
+        SpeakingAnalysisDB,
+        TestModuleDB,
+        TestModuleQuestionDB,
+        TestModuleSubmissionDB,
+    )
+
+    questions = TestModuleQuestionDB.__table__
+    submissions = TestModuleSubmissionDB.__table__
+    analyses = SpeakingAnalysisDB.__table__
+    Base.metadata.create_all(conn, tables=[questions, submissions, analyses])
+
+    # Modules already present in a table were backfilled by an interrupted earlier run.
+    done = {t.name: set(conn.scalars(select(t.c.module_id).distinct())) for t in (questions, submissions, analyses)}
+    now = datetime.utcnow()
+    modules = conn.execute(
+        select(TestModuleDB.id, TestModuleDB.questions_json).where(TestModuleDB.questions_json.is_not(None))
+    ).all()
+    for module_id, raw in modules:
+        payload = _legacy_module_payload(raw)
+
+        if module_id not in done[questions.name]:
+            rows = []
+            for qid in payload.get("question_ids") or []:
+                try:
+                    rows.append({"module_id": module_id, "position": len(rows), "question_id": int(qid)})
+                except (TypeError, ValueError):
+                    continue
+            if rows:
+                conn.execute(questions.insert(), rows)
+
+        if module_id not in done[submissions.name]:
+            by_question: dict[str, dict[str, Any]] = {}
+            for sub in payload.get("submissions") or []:
+                if isinstance(sub, dict) and str(sub.get("questionId") or ""):
+                    qid = str(sub["questionId"])
+                    by_question[qid] = {
+                        "module_id": module_id,
+                        "question_id": qid,
+                        "answer": str(sub.get("answer") or "").strip(),
+                        "is_correct": None,
+                        "submitted_at": now,
+                    }
+            if by_question:
+                conn.execute(submissions.insert(), list(by_question.values()))
+
+        if module_id not in done[analyses.name]:
+            # Upload order is preserved through the ids; the last upload was the module's CEFR level.
+            by_question = {}
+            for item in payload.get("speaking_audio") or []:
+                if not isinstance(item, dict) or not str(item.get("questionId") or ""):
+                    continue
+                qid = str(item["questionId"])
+                by_question.pop(qid, None)
+                by_question[qid] = {
+                    "module_id": module_id,
+                    "question_id": qid,
+                    "received_bytes": int(item.get("receivedBytes") or 0),
+                    "content_type": item.get("contentType"),
+                    "transcript": item.get("transcript"),
+                    "pronunciation_score": _float(item.get("pronunciationScore")),
+                    "fluency_score": _float(item.get("fluencyScore")),
+                    "grammar_score": _float(item.get("grammarScore")),
+                    "vocabulary_score": _float(item.get("vocabularyScore")),
+                    "overall_score": _float(item.get("overallScore")),
+                    "cefr_level": item.get("cefrLevel"),
+                    "strength_tags_json": json.dumps(item.get("strengthTags") or []),
+                    "weakness_tags_json": json.dumps(item.get("weaknessTags") or []),
+                    "analyzed_at": now,
+                }
+            if by_question:
+                conn.execute(analyses.insert(), list(by_question.values()))
+
+
+def _system_state_versions_table(conn: Connection) -> None:
+    from app.infrastructure.db.models.system import SystemStateVersionDB
+
+    Base.metadata.create_all(conn, tables=[SystemStateVersionDB.__table__])
+
+
+def _daily_activity_table(conn: Connection) -> None:
+    from app.infrastructure.db.daily_activity import rebuild_daily_activity
+    from app.infrastructure.db.models.progress import DailyActivityDB
+
+    Base.metadata.create_all(conn, tables=[DailyActivityDB.__table__])
+    rebuild_daily_activity(conn)
+
+
+def _student_last_active_date(conn: Connection) -> None:
+    from app.infrastructure.db.models.progress import DailyActivityDB
+    from app.infrastructure.db.streaks import streak_ending_at
+
+    add_missing_columns(conn, "students", {"last_active_date": "DATE"})
+    active_days: dict[int, set] = {}
+    rows = conn.execute(
+        select(DailyActivityDB.student_id, DailyActivityDB.activity_date).where(DailyActivityDB.content_completed > 0)
+    )
+    for student_id, day in rows:
+        active_days.setdefault(int(student_id), set()).add(day)
+    students = Base.metadata.tables["students"]
+    conn.execute(students.update().values(daily_streak=0, last_active_date=None))
+    for student_id, days in active_days.items():
+        last, streak = streak_ending_at(days)
+        conn.execute(
+            students.update().where(students.c.id == student_id).values(daily_streak=streak, last_active_date=last)
+        )
+
+
+def _student_progress_summary_table(conn: Connection) -> None:
+    from app.infrastructure.db.models.progress import StudentProgressSummaryDB
+
+    # Rows are built on demand (first read or next progress event).
+    Base.metadata.create_all(conn, tables=[StudentProgressSummaryDB.__table__])
+
+
+def _background_work_tables(conn: Connection) -> None:
+    from app.infrastructure.db.models.job import JobDB
+    from app.infrastructure.db.models.llm_cache import LLMResponseCacheDB
+    from app.infrastructure.db.models.prefetched_content import PrefetchedContentDB
+    from app.infrastructure.db.models.student_context_version import StudentContextVersionDB
+
+    # Databases migrated before Migration 1 was frozen already have these tables.
+    Base.metadata.create_all(
+        conn,
+        tables=[
+            JobDB.__table__,
+            LLMResponseCacheDB.__table__,
+            PrefetchedContentDB.__table__,
+            StudentContextVersionDB.__table__,
+        ],
+    )
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "create tables", _create_tables),
+    Migration(2, "system_feedback category and status", _system_feedback_columns),
+    Migration(3, "listening_questions bank_key", _listening_bank_key_column),
+    Migration(4, "chat_sessions rolling summary", _chat_summary_columns),
+    Migration(5, "maintenance_logs announcement", _maintenance_announcement_column),
+    Migration(6, "composite indexes for hot queries", _hot_query_indexes),
+    Migration(7, "seed achievements", _seed_achievements),
+    Migration(8, "normalised placement submissions", _placement_submission_tables),
+    Migration(9, "system_state_versions", _system_state_versions_table),
+    Migration(10, "daily_activity rollup", _daily_activity_table),
+    Migration(11, "students last_active_date", _student_last_active_date),
+    Migration(12, "student_progress_summary", _student_progress_summary_table),
+    Migration(13, "jobs, llm_response_cache, prefetched_contents, student_context_versions", _background_work_tables),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn: Connection) -> int:
+    """Highest applied migration version, 0 for a database that was never migrated."""
+    try:
+        return int(conn.scalar(select(func.max(SchemaVersionDB.version))) or 0)
+    except (OperationalError, ProgrammingError):
+        # No schema_version table yet.
+        conn.rollback()
+        return 0
+
+
+def run_migrations(engine: Engine, *, target: int | None = None) -> list[Migration]:
+    """Apply pending migrations up to `target` (default: all). Returns the ones applied."""
+    target = LATEST_VERSION if target is None else int(target)
+    with engine.begin() as conn:
+        SchemaVersionDB.__table__.create(conn, checkfirst=True)
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version > target:
+            break
+        with engine.begin() as conn:
+            # Re-read inside the transaction so a concurrent runner cannot apply it twice.
+            done = conn.scalar(
+                select(SchemaVersionDB.version).where(SchemaVersionDB.version == migration.version)
+            )
+            if done is not None:
+                continue
+            logger.info("Applying migration %s: %s", migration.version, migration.name)
+            migration.upgrade(conn)
+            conn.execute(
+                SchemaVersionDB.__table__.insert().values(version=migration.version, name=migration.name)
+            )
+        applied.append(migration)
+    return applied
+
+
+def check_schema_version(engine: Engine) -> int:
+    """Startup check: one query. Raises SchemaVersionError if migrations are pending."""
+    with engine.connect() as conn:
+        version = current_version(conn)
+    if version < LATEST_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version}, this code needs {LATEST_VERSION}. "
+            "Run `python -m scripts.migrate` before starting the app."
+        )
+    if version > LATEST_VERSION:
+        logger.warning(
+            "Database schema version %s is newer than this code (%s); was a newer release migrated?",
+            version,
+            LATEST_VERSION,
+        )
+    return version
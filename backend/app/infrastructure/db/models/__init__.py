@@ -8,6 +8,9 @@ from app.infrastructure.db.models.content import ContentDB, TopicDB, LessonPlanD
 from app.infrastructure.db.models.tests import (
     QuestionDB,
     TestModuleDB,
+    TestModuleQuestionDB,
+    TestModuleSubmissionDB,
+    SpeakingAnalysisDB,
     TestDB,
     PlacementTestDB,
     SpeakingTestDB,
@@ -16,21 +19,31 @@ from app.infrastructure.db.models.tests import (
     WritingTestDB,
 )
 from app.infrastructure.db.models.results import TestResultDB, SpeakingResultDB
-from app.infrastructure.db.models.progress import ProgressDB, ProgressSnapshotDB
-from app.infrastructure.db.models.assignments import AssignmentDB, StudentAssignmentDB
-from app.infrastructure.db.models.assignment_questions import (
+from app.infrastructure.db.models.progress import (
+    DailyActivityDB,
+    ProgressDB,
+    ProgressSnapshotDB,
+    StudentProgressSummaryDB,
+)
+from app.infrastructure.db.models.assignments import (
+    AssignmentDB,
+    StudentAssignmentDB,
     AssignmentQuestionDB,
-    QuestionOptionDB,
-    StudentAnswerDB,
+    StudentAssignmentAnswerDB,
 )
 from app.infrastructure.db.models.rewards import RewardDB, StudentRewardDB
 from app.infrastructure.db.models.messaging import MessageDB, AnnouncementDB
 from app.infrastructure.db.models.feedback import FeedbackDB
 from app.infrastructure.db.models.chatbot import ChatSessionDB, ChatMessageDB
-from app.infrastructure.db.models.system import SystemPerformanceDB, MaintenanceLogDB
+from app.infrastructure.db.models.system import SystemPerformanceDB, MaintenanceLogDB, SystemStateVersionDB
 from app.infrastructure.db.models.system_feedback import SystemFeedbackDB
 from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.models.prefetched_content import PrefetchedContentDB
 from app.infrastructure.db.models.teacher_directive import TeacherDirectiveDB
+from app.infrastructure.db.models.llm_cache import LLMResponseCacheDB
+from app.infrastructure.db.models.student_context_version import StudentContextVersionDB
+from app.infrastructure.db.models.job import JobDB
+from app.infrastructure.db.models.schema_version import SchemaVersionDB
 
 __all__ = [
     # User hierarchy
@@ -46,6 +59,9 @@ __all__ = [
     # Tests
     "QuestionDB",
     "TestModuleDB",
+    "TestModuleQuestionDB",
+    "TestModuleSubmissionDB",
+    "SpeakingAnalysisDB",
     "TestDB",
     "PlacementTestDB",
     "SpeakingTestDB",
@@ -58,12 +74,13 @@ __all__ = [
     # Progress
     "ProgressDB",
     "ProgressSnapshotDB",
+    "DailyActivityDB",
+    "StudentProgressSummaryDB",
     # Assignments
     "AssignmentDB",
     "StudentAssignmentDB",
     "AssignmentQuestionDB",
-    "QuestionOptionDB",
-    "StudentAnswerDB",
+    "StudentAssignmentAnswerDB",
     # Rewards
     "RewardDB",
     "StudentRewardDB",
@@ -76,10 +93,27 @@ __all__ = [
     "ChatSessionDB",
     "ChatMessageDB",
     "StudentAIContentDB",
+    "PrefetchedContentDB",
     # System
     "SystemPerformanceDB",
     "MaintenanceLogDB",
+    "SystemStateVersionDB",
     "SystemFeedbackDB",
     # Teacher Directives
     "TeacherDirectiveDB",
+    # LLM
+    "LLMResponseCacheDB",
+    # Cache versioning
+    "StudentContextVersionDB",
+    # Background jobs
+    "JobDB",
+    # Migrations
+    "SchemaVersionDB",
 ]
+
+# Registers the flush hook that bumps StudentContextVersionDB.
+import app.infrastructure.db.context_versions  # noqa: E402,F401
+# Registers the flush hook that bumps the maintenance SystemStateVersionDB row.
+import app.infrastructure.db.maintenance_state  # noqa: E402,F401
+# Registers the flush hook that maintains the daily_activity rollup.
+import app.infrastructure.db.daily_activity  # noqa: E402,F401
@@ -6,7 +6,7 @@ Maps to domain/models/chatbot.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -16,10 +16,14 @@ class ChatSessionDB(Base, IdMixin):
     """Chatbot conversation session for a student."""
 
     __tablename__ = "chat_sessions"
+    __table_args__ = (Index("ix_chat_sessions_student_open", "student_id", "ended_at", "started_at"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Rolling summary of older turns; covers messages with id <= summary_through_message_id.
+    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summary_through_message_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     messages: Mapped[list["ChatMessageDB"]] = relationship(back_populates="session")
 
@@ -28,10 +32,12 @@ class ChatMessageDB(Base, IdMixin):
     """Single message inside a chat session."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (Index("ix_chat_messages_session_timestamp", "session_id", "timestamp"),)
 
     session_id: Mapped[int] = mapped_column(ForeignKey("chat_sessions.id"), nullable=False)
     sender: Mapped[str] = mapped_column(String(50), nullable=False)  # "user" or "bot"
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # active_history: the daily_activity flush hook needs the previous value on change.
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, active_history=True)
 
     session: Mapped["ChatSessionDB"] = relationship(back_populates="messages")
@@ -6,7 +6,7 @@ Maps to domain/models/content.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.domain.enums import ContentType, LanguageLevel
@@ -41,6 +41,7 @@ class LessonPlanDB(Base, IdMixin, TimestampMixin):
     """Personalized lesson plan for a student."""
 
     __tablename__ = "lesson_plans"
+    __table_args__ = (Index("ix_lesson_plans_student_created", "student_id", "created_at"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     recommended_level: Mapped[LanguageLevel] = mapped_column(Enum(LanguageLevel), nullable=False)
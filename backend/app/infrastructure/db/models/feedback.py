@@ -6,7 +6,7 @@ Maps to domain/models/feedback.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -16,6 +16,7 @@ class FeedbackDB(Base, IdMixin):
     """AI-generated feedback linked to test result."""
 
     __tablename__ = "feedback"
+    __table_args__ = (Index("ix_feedback_student_generated", "student_id", "generated_at"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     test_result_id: Mapped[int] = mapped_column(ForeignKey("test_results.id"), nullable=False)
@@ -0,0 +1,38 @@
+"""ORM model for persisted background jobs (slow AI work run off the request path)."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base, IdMixin, TimestampMixin
+
+
+class JobDB(Base, IdMixin, TimestampMixin):
+    """One unit of background work.
+
+    status: queued -> running -> succeeded | failed. A failed attempt with retries left goes
+    back to queued with `run_after` pushed out (exponential backoff).
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_status_run_after", "status", "run_after"),)
+
+    job_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    user_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True, index=True)
+
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    # Raw input that does not belong in JSON (e.g. uploaded audio); kept so a job survives restarts.
+    payload_blob: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    result_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
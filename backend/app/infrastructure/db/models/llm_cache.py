@@ -0,0 +1,22 @@
+"""ORM model for persisted LLM responses (content-addressed cache)."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base, IdMixin
+
+
+class LLMResponseCacheDB(Base, IdMixin):
+    """One cached response variant for a canonical LLM request hash."""
+
+    __tablename__ = "llm_response_cache"
+    __table_args__ = (UniqueConstraint("cache_key", "variant", name="uq_llm_response_cache_key_variant"),)
+
+    cache_key: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    variant: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    response_text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -6,7 +6,7 @@ Maps to domain/models/messaging.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -16,6 +16,10 @@ class MessageDB(Base, IdMixin):
     """Direct message between users."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_recipient_sent", "recipient_id", "sent_at"),
+        Index("ix_messages_sender_sent", "sender_id", "sent_at"),
+    )
 
     sender_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     recipient_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
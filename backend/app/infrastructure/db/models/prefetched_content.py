@@ -0,0 +1,35 @@
+"""ORM model for AI content generated ahead of time for a student.
+
+A prefetched item is ready but unseen: it only becomes a StudentAIContentDB row (and a
+ContentDB) when the student asks for the next item and the inputs it was generated from
+still match (see StudentAIContentDeliveryService).
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.enums import ContentType, LanguageLevel
+from app.infrastructure.db.base import Base, IdMixin
+
+
+class PrefetchedContentDB(Base, IdMixin):
+    __tablename__ = "prefetched_contents"
+
+    student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False, index=True)
+    content_type: Mapped[ContentType] = mapped_column(Enum(ContentType), nullable=False)
+    # sha256 of the normalized plan topics the item was generated for.
+    plan_topics_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    # sha256 of levels, strengths, weaknesses, teacher directives and target topic at generation time.
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    level: Mapped[LanguageLevel] = mapped_column(Enum(LanguageLevel), nullable=False)
+    rationale: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    prompt_context_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -6,7 +6,7 @@ Maps to domain/models/progress.py.
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -28,7 +28,42 @@ class ProgressSnapshotDB(Base, IdMixin):
     """Daily snapshot for historical tracking."""
 
     __tablename__ = "progress_snapshots"
+    __table_args__ = (Index("ix_progress_snapshots_student_date", "student_id", "snapshot_date"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     snapshot_date: Mapped[date] = mapped_column(Date, nullable=False)
     progress_data_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class DailyActivityDB(Base):
+    """Per-student, per-day activity counters.
+
+    Maintained in the same transaction as the underlying events (see
+    app/infrastructure/db/daily_activity.py); rebuilt from the raw tables by
+    `python -m scripts.backfill_daily_activity`.
+    """
+
+    __tablename__ = "daily_activity"
+    __table_args__ = (Index("ix_daily_activity_date", "activity_date"),)
+
+    student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), primary_key=True)
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    content_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tests_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    chat_turns: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class StudentProgressSummaryDB(Base):
+    """Pre-computed GET /progress response of a student.
+
+    Valid while `context_version` equals the student's StudentContextVersionDB.version; see
+    app/application/services/progress_summary_service.py.
+    """
+
+    __tablename__ = "student_progress_summary"
+
+    student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), primary_key=True)
+    context_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -6,7 +6,7 @@ Maps to domain/models/results.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, LargeBinary, Text
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, LargeBinary, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.domain.enums import LanguageLevel
@@ -17,6 +17,7 @@ class TestResultDB(Base, IdMixin):
     """Result of a completed test."""
 
     __tablename__ = "test_results"
+    __table_args__ = (Index("ix_test_results_student_completed", "student_id", "completed_at"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     test_id: Mapped[int] = mapped_column(ForeignKey("tests.id"), nullable=False)
@@ -26,7 +27,8 @@ class TestResultDB(Base, IdMixin):
     writing_level: Mapped[Optional[LanguageLevel]] = mapped_column(Enum(LanguageLevel), nullable=True)
     listening_level: Mapped[Optional[LanguageLevel]] = mapped_column(Enum(LanguageLevel), nullable=True)
     speaking_level: Mapped[Optional[LanguageLevel]] = mapped_column(Enum(LanguageLevel), nullable=True)
-    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # active_history: the daily_activity flush hook needs the previous value on change.
+    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, active_history=True)
     strengths_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     weaknesses_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
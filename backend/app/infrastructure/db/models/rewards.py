@@ -5,7 +5,7 @@ Maps to domain/models/rewards.py.
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -26,7 +26,9 @@ class StudentRewardDB(Base, IdMixin):
     """Many-to-many: student earns reward."""
 
     __tablename__ = "student_rewards"
+    __table_args__ = (Index("ix_student_rewards_student_reward", "student_id", "reward_id"),)
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), nullable=False)
     reward_id: Mapped[int] = mapped_column(ForeignKey("rewards.id"), nullable=False)
-    earned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # active_history: the daily_activity flush hook needs the previous value on change.
+    earned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, active_history=True)
@@ -0,0 +1,22 @@
+"""ORM model for the applied schema migrations.
+
+One row per migration applied by app/infrastructure/db/migrations.py; the highest
+version is the schema version of the database.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base
+
+
+class SchemaVersionDB(Base):
+    """A migration that has been applied to this database."""
+
+    __tablename__ = "schema_version"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
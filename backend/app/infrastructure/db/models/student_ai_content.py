@@ -29,7 +29,8 @@ class StudentAIContentDB(Base, IdMixin, TimestampMixin):
 
     # Active until completed.
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # active_history: the daily_activity flush hook needs the previous value on change.
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, active_history=True)
 
     # Feedback on student's answers
     feedback_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -0,0 +1,22 @@
+"""ORM model for per-student context version stamps.
+
+Bumped in the same transaction as any write that changes what the chatbot (and other
+per-student caches) know about a student; see app/infrastructure/db/context_versions.py.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.base import Base
+
+
+class StudentContextVersionDB(Base):
+    """Monotonic version of a student's derived context."""
+
+    __tablename__ = "student_context_versions"
+
+    student_id: Mapped[int] = mapped_column(ForeignKey("students.id"), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
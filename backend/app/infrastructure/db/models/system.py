@@ -1,4 +1,4 @@
-"""ORM models for System performance and maintenance logs.
+"""ORM models for System performance, maintenance logs and system-wide state versions.
 
 Maps to domain/models/system.py.
 """
@@ -6,7 +6,7 @@ Maps to domain/models/system.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.db.base import Base, IdMixin
@@ -27,9 +27,24 @@ class MaintenanceLogDB(Base, IdMixin):
     """Log entry when admin triggers maintenance mode."""
 
     __tablename__ = "maintenance_logs"
+    __table_args__ = (Index("ix_maintenance_logs_end_start", "end_time", "start_time"),)
 
     admin_id: Mapped[int] = mapped_column(ForeignKey("admins.id"), nullable=False)
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     announcement: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class SystemStateVersionDB(Base):
+    """Monotonic version of a piece of system-wide state that workers cache in memory.
+
+    Bumped in the same transaction as the change (see app/infrastructure/db/maintenance_state.py),
+    so a worker can tell whether its copy is current with one primary-key lookup.
+    """
+
+    __tablename__ = "system_state_versions"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
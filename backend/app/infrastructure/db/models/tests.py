@@ -6,7 +6,7 @@ Maps to domain/models/tests.py.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.domain.enums import LanguageLevel
@@ -30,10 +30,63 @@ class TestModuleDB(Base, IdMixin):
     __tablename__ = "test_modules"
 
     module_type: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., "reading"
+    # Legacy: question ids, submissions and speaking analyses as one JSON blob. Superseded by
+    # the tables below (backfilled by migration 8); no longer written.
     questions_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # ids or inline
     score: Mapped[int] = mapped_column(Integer, default=0)
 
 
+class TestModuleQuestionDB(Base, IdMixin):
+    """Question assigned to a placement module, in display order.
+
+    `question_id` points into the pool table for the module type (reading_questions,
+    writing_questions, listening_questions or questions), so it has no foreign key.
+    """
+
+    __tablename__ = "test_module_questions"
+    __table_args__ = (UniqueConstraint("module_id", "position", name="uq_test_module_questions_module_position"),)
+
+    module_id: Mapped[int] = mapped_column(ForeignKey("test_modules.id"), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    question_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class TestModuleSubmissionDB(Base, IdMixin):
+    """A student's answer to one question of a placement module (one row per question)."""
+
+    __tablename__ = "test_module_submissions"
+    __table_args__ = (UniqueConstraint("module_id", "question_id", name="uq_test_module_submissions_module_question"),)
+
+    module_id: Mapped[int] = mapped_column(ForeignKey("test_modules.id"), nullable=False)
+    question_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    answer: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # None for open-ended modules (writing/speaking) that are not auto-graded.
+    is_correct: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    submitted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class SpeakingAnalysisDB(Base, IdMixin):
+    """AI analysis of one uploaded speaking answer (latest upload per question wins)."""
+
+    __tablename__ = "speaking_analyses"
+    __table_args__ = (UniqueConstraint("module_id", "question_id", name="uq_speaking_analyses_module_question"),)
+
+    module_id: Mapped[int] = mapped_column(ForeignKey("test_modules.id"), nullable=False)
+    question_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    received_bytes: Mapped[int] = mapped_column(Integer, default=0)
+    content_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    pronunciation_score: Mapped[float] = mapped_column(Float, default=0.0)
+    fluency_score: Mapped[float] = mapped_column(Float, default=0.0)
+    grammar_score: Mapped[float] = mapped_column(Float, default=0.0)
+    vocabulary_score: Mapped[float] = mapped_column(Float, default=0.0)
+    overall_score: Mapped[float] = mapped_column(Float, default=0.0)
+    cefr_level: Mapped[Optional[str]] = mapped_column(String(2), nullable=True)
+    strength_tags_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    weakness_tags_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    analyzed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
 class TestDB(Base, IdMixin, TimestampMixin):
     """Generic test base table (uses single-table inheritance style via 'test_type')."""
 
@@ -121,6 +174,8 @@ class ListeningQuestionDB(Base, IdMixin):
     options_json: Mapped[str] = mapped_column(Text, nullable=False)
     correct_answer: Mapped[str] = mapped_column(String(255), nullable=False)
     difficulty: Mapped[LanguageLevel] = mapped_column(Enum(LanguageLevel), nullable=False)
+    # sha256(level + transcript) for pre-generated question sets; NULL for legacy/fallback rows.
+    bank_key: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
 
 
 class WritingQuestionDB(Base, IdMixin):
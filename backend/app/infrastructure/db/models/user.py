@@ -3,10 +3,10 @@
 Maps to domain/models/user_hierarchy.py.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Date, DateTime, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.enums import LanguageLevel, UserRole
@@ -38,7 +38,9 @@ class StudentDB(Base, IdMixin):
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), unique=True, nullable=False)
     level: Mapped[Optional[LanguageLevel]] = mapped_column(Enum(LanguageLevel), nullable=True)
+    # Streak as of last_active_date; read it through app/infrastructure/db/streaks.current_streak.
     daily_streak: Mapped[int] = mapped_column(Integer, default=0)
+    last_active_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     total_points: Mapped[int] = mapped_column(Integer, default=0)
     enrollment_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
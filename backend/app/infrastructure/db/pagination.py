@@ -0,0 +1,104 @@
+"""Keyset (cursor) pagination.
+
+List endpoints return their rows newest first, ordered by `(sort column, id)`, one page
+at a time. A page ends with an opaque cursor encoding the last row's key; the next page
+continues strictly after that key, so every page costs the same indexed range scan no
+matter how deep the client has scrolled (unlike OFFSET), and rows inserted meanwhile do
+not shift later pages.
+
+    stmt = keyset(select(MessageDB).where(...), MessageDB.sent_at, MessageDB.id, cursor=cursor, limit=limit)
+    page = build_page(db.scalars(stmt).all(), limit=limit, key=lambda m: (m.sent_at, m.id))
+
+Cursors are tied to the ordering of the endpoint that issued them; a malformed one raises
+ValueError (mapped to 400 by the routes).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from sqlalchemy import Select, and_, or_
+
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        key = ["dt", sort_value.isoformat(), int(row_id)]
+    elif sort_value is None:
+        key = ["null", None, int(row_id)]
+    else:
+        key = ["v", sort_value, int(row_id)]
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[Any, int]:
+    """Return (sort value, id) from a cursor produced by encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        kind, value, row_id = json.loads(raw)
+        if kind == "dt":
+            value = datetime.fromisoformat(value)
+        elif kind not in ("v", "null"):
+            raise ValueError(kind)
+        return value, int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor") from None
+
+
+def keyset(
+    stmt: Select,
+    sort_col: Any,
+    id_col: Any,
+    *,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> Select:
+    """Order `stmt` by (sort_col, id_col) and select the page after `cursor`.
+
+    Fetches one row more than `limit` so build_page can tell whether another page exists.
+    Pass `sort_col=None` to page by id alone. NULL sort values sort lowest, as in SQLite.
+    """
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        after_id = id_col < last_id if descending else id_col > last_id
+        if sort_col is None:
+            stmt = stmt.where(after_id)
+        elif sort_value is None:
+            tie = and_(sort_col.is_(None), after_id)
+            stmt = stmt.where(tie if descending else or_(tie, sort_col.is_not(None)))
+        elif descending:
+            stmt = stmt.where(
+                or_(sort_col < sort_value, and_(sort_col == sort_value, after_id), sort_col.is_(None))
+            )
+        else:
+            stmt = stmt.where(or_(sort_col > sort_value, and_(sort_col == sort_value, after_id)))
+
+    columns = [id_col] if sort_col is None else [sort_col, id_col]
+    stmt = stmt.order_by(*(c.desc() if descending else c.asc() for c in columns))
+    return stmt.limit(int(limit) + 1)
+
+
+def build_page(rows: Sequence[T], *, limit: int, key: Callable[[T], tuple[Any, int]]) -> Page[T]:
+    """Trim the look-ahead row fetched by keyset() and derive the next cursor."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return Page(items=items, next_cursor=None)
+    sort_value, row_id = key(items[-1])
+    return Page(items=items, next_cursor=encode_cursor(sort_value, row_id))
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 """Database session factory and engine configuration for SQLite."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.config.settings import get_settings
+from app.config.settings import Settings, get_settings
+from app.infrastructure.db.instrumentation import instrument_engine
 
 settings = get_settings()
 
@@ -22,14 +26,112 @@ if SQLALCHEMY_DATABASE_URL.startswith("sqlite:///./"):
 	db_file = backend_dir / SQLALCHEMY_DATABASE_URL.removeprefix("sqlite:///./")
 	SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_file}"
 
-engine = create_engine(
-	SQLALCHEMY_DATABASE_URL,
-	connect_args={"check_same_thread": False},  # required for SQLite
-	echo=settings.debug,  # log SQL when debug=True
-)
+# Pragmas reported at startup (and by scripts/bench_sqlite_writes.py).
+REPORTED_PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
+
+
+def sqlite_pragmas(cfg: Settings) -> list[tuple[str, Any]]:
+	"""Per-connection PRAGMAs of the configured SQLite profile, in the order they are applied."""
+	return [
+		("journal_mode", cfg.sqlite_journal_mode),
+		("synchronous", cfg.sqlite_synchronous),
+		("busy_timeout", int(cfg.sqlite_busy_timeout_ms)),
+		# Negative cache_size is in KiB rather than pages.
+		("cache_size", -abs(int(cfg.sqlite_cache_size_kib))),
+		("mmap_size", int(cfg.sqlite_mmap_size_bytes)),
+		("temp_store", cfg.sqlite_temp_store),
+	]
+
+
+def apply_sqlite_profile(target: Engine, cfg: Settings) -> None:
+	"""Run the profile PRAGMAs on every new DBAPI connection of `target`."""
+	pragmas = sqlite_pragmas(cfg)
+
+	@event.listens_for(target, "connect")
+	def _set_sqlite_pragmas(dbapi_connection, connection_record):  # noqa: ANN001
+		cursor = dbapi_connection.cursor()
+		try:
+			for name, value in pragmas:
+				cursor.execute(f"PRAGMA {name}={value}")
+		finally:
+			cursor.close()
+
+
+def sqlite_pragma_report(target: Engine) -> dict[str, Any]:
+	"""Effective PRAGMA values as seen by a pooled connection."""
+	if target.dialect.name != "sqlite":
+		return {}
+	report: dict[str, Any] = {}
+	with target.connect() as conn:
+		for name in REPORTED_PRAGMAS:
+			report[name] = conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+	return report
+
+
+def _sqlite_engine_kwargs(url: str, cfg: Settings) -> dict[str, Any]:
+	kwargs: dict[str, Any] = {
+		"connect_args": {
+			"check_same_thread": False,  # required for SQLite
+			# Driver-level lock wait; busy_timeout below covers the same case inside SQLite.
+			"timeout": max(0.0, cfg.sqlite_busy_timeout_ms / 1000),
+		},
+		"echo": cfg.debug,  # log SQL when debug=True
+	}
+	in_memory = url.split("///")[-1] in ("", ":memory:") or "mode=memory" in url
+	if not in_memory:
+		kwargs.update(
+			pool_size=cfg.db_pool_size,
+			max_overflow=cfg.db_max_overflow,
+			pool_timeout=cfg.db_pool_timeout_seconds,
+		)
+	return kwargs
+
+
+def create_db_engine(url: str, cfg: Settings, *, profile: bool | None = None) -> Engine:
+	"""Engine for `url`; SQLite files get the pragma profile and a sized connection pool."""
+	if not url.startswith("sqlite"):
+		target = create_engine(url, echo=cfg.debug, pool_pre_ping=True)
+	else:
+		target = create_engine(url, **_sqlite_engine_kwargs(url, cfg))
+		if cfg.sqlite_profile_enabled if profile is None else profile:
+			apply_sqlite_profile(target, cfg)
+	if cfg.sql_instrumentation_enabled:
+		instrument_engine(target)
+	return target
+
+
+def async_database_url(url: str) -> str:
+	"""The async driver URL for `url` (sqlite:/// -> sqlite+aiosqlite:///)."""
+	if url.startswith("sqlite:"):
+		return "sqlite+aiosqlite:" + url.removeprefix("sqlite:")
+	return url
+
+
+def create_async_db_engine(url: str, cfg: Settings) -> AsyncEngine:
+	"""AsyncEngine over the same database, with the same SQLite profile as the sync engine."""
+	url = async_database_url(url)
+	if not url.startswith("sqlite"):
+		target = create_async_engine(url, echo=cfg.debug, pool_pre_ping=True)
+	else:
+		target = create_async_engine(url, **_sqlite_engine_kwargs(url, cfg))
+		if cfg.sqlite_profile_enabled:
+			apply_sqlite_profile(target.sync_engine, cfg)
+	if cfg.sql_instrumentation_enabled:
+		instrument_engine(target.sync_engine)
+	return target
+
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL, settings)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async access path for read-heavy routes. Both engines point at the same database, so
+# sync and async sessions coexist while services migrate. expire_on_commit=False keeps
+# loaded rows usable after commit without an implicit (unawaitable) refresh.
+async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL, settings)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
 	"""FastAPI dependency that yields a DB session and closes it after use."""
@@ -38,3 +140,9 @@ def get_db() -> Generator[Session, None, None]:
 		yield db
 	finally:
 		db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+	"""FastAPI dependency that yields an AsyncSession and closes it after use."""
+	async with AsyncSessionLocal() as db:
+		yield db
@@ -0,0 +1,54 @@
+"""Daily streak of a student: consecutive days with completed content.
+
+The streak is stored on the student row (`daily_streak`, counted up to `last_active_date`)
+and advanced in O(1) by `record_activity` when content is completed. Reads go through
+`current_streak`, which applies the day rollover lazily: a streak whose last active day is
+before yesterday has lapsed and reads as 0 without anything being written.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from app.infrastructure.db.models.user import StudentDB
+
+
+def _today() -> date:
+    # UTC, like the completed_at timestamps the streak is derived from.
+    return datetime.utcnow().date()
+
+
+def record_activity(student: StudentDB, day: date | None = None) -> int:
+    """Count `day` (default: today) as active for `student`. Returns the updated streak."""
+    day = day or _today()
+    last = student.last_active_date
+    if last is not None and day <= last:
+        # Already counted (or an older day arriving late): the streak ending at `last` stands.
+        return int(student.daily_streak or 0)
+    if last is not None and day - last == timedelta(days=1):
+        student.daily_streak = int(student.daily_streak or 0) + 1
+    else:
+        student.daily_streak = 1
+    student.last_active_date = day
+    return int(student.daily_streak)
+
+
+def current_streak(student: StudentDB | None, today: date | None = None) -> int:
+    """The streak as of `today`: still alive if the student was active today or yesterday."""
+    if student is None or student.last_active_date is None:
+        return 0
+    today = today or _today()
+    if today - student.last_active_date > timedelta(days=1):
+        return 0
+    return int(student.daily_streak or 0)
+
+
+def streak_ending_at(active_days: set[date]) -> tuple[date | None, int]:
+    """(last active day, consecutive days ending there) for a set of active days; used to backfill."""
+    if not active_days:
+        return None, 0
+    last = max(active_days)
+    streak = 1
+    while last - timedelta(days=streak) in active_days:
+        streak += 1
+    return last, streak
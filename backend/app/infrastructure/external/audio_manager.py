@@ -93,6 +93,10 @@ class AudioFileManager:
         self._audio_files = audio_files
         return audio_files
     
+    def get_all(self) -> list[AudioFile]:
+        """Get all audio files that have both a transcript and an mp3."""
+        return list(self._load_audio_files())
+    
     def get_by_level(self, level: LanguageLevel) -> list[AudioFile]:
         """Get all audio files for a specific CEFR level.
         
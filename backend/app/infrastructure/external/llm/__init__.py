@@ -4,14 +4,29 @@ This package provides a small interface + factory so application code can call a
 without depending on a specific vendor SDK.
 """
 
+from .caching import CachingLLMClient, cache_key_for
 from .client import LLMClient
-from .factory import get_llm_client
-from .types import LLMChatRequest, LLMChatResponse, LLMMessage
+from .factory import create_llm_client, create_provider_client, get_llm_client
+from .registry import LLMClientRegistry, get_llm_registry
+from .scheduler import LLMQueueTimeoutError, RateLimitedLLMClient
+from .singleflight import SingleFlightLLMClient
+from .types import LLMCachePolicy, LLMChatRequest, LLMChatResponse, LLMLane, LLMMessage
 
 __all__ = [
+    "CachingLLMClient",
+    "LLMCachePolicy",
     "LLMClient",
     "LLMChatRequest",
     "LLMChatResponse",
     "LLMMessage",
+    "LLMClientRegistry",
+    "LLMLane",
+    "LLMQueueTimeoutError",
+    "RateLimitedLLMClient",
+    "SingleFlightLLMClient",
+    "cache_key_for",
+    "create_llm_client",
+    "create_provider_client",
     "get_llm_client",
+    "get_llm_registry",
 ]
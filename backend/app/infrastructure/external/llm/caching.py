@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, Protocol
+
+from .client import LLMClient
+from .types import LLMCachePolicy, LLMChatRequest, LLMChatResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseStore(Protocol):
+    """Optional persistent tier (see SqlAlchemyLLMCacheRepository)."""
+
+    def get_variants(self, cache_key: str) -> list[str]:
+        ...
+
+    def put(self, cache_key: str, variant: int, text: str, ttl_seconds: int | None) -> None:
+        ...
+
+
+def cache_key_for(request: LLMChatRequest, namespace: str = "") -> str:
+    """Canonical hash of everything that affects the model output."""
+    payload = {
+        "ns": namespace,
+        "model": request.model,
+        "temperature": request.temperature,
+        "max_output_tokens": request.max_output_tokens,
+        "messages": [[m.role, m.content] for m in request.messages],
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CachingLLMClient:
+    """LLMClient decorator with a bounded in-memory LRU and an optional persistent store.
+
+    Requests are only cached when they carry an enabled `LLMCachePolicy` (or when a
+    `default_policy` is configured), so conversational call sites stay uncached.
+    """
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        *,
+        max_entries: int = 512,
+        store: LLMResponseStore | None = None,
+        default_ttl_seconds: int | None = None,
+        default_policy: LLMCachePolicy | None = None,
+        namespace: str = "",
+    ) -> None:
+        self.inner = inner
+        self.max_entries = max(1, int(max_entries))
+        self.store = store
+        self.default_ttl_seconds = default_ttl_seconds
+        self.default_policy = default_policy
+        self.namespace = namespace
+        self._memory: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._rejected = 0
+
+    def generate(self, request: LLMChatRequest) -> LLMChatResponse:
+        policy = self._policy_for(request)
+        if policy is None:
+            self._count("bypassed")
+            return self.inner.generate(request)
+
+        key = cache_key_for(request, self.namespace)
+        cached = self._lookup(key, policy, self._load_from_store(key))
+        if cached is not None:
+            return cached
+
+        response = self.inner.generate(request)
+        slot = self._remember(key, response.text, policy)
+        if slot is not None:
+            self._persist(key, slot, response.text, policy)
+        return response
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        policy = self._policy_for(request)
+        if policy is None:
+            self._count("bypassed")
+            return await self.inner.agenerate(request)
+
+        key = cache_key_for(request, self.namespace)
+        stored = None
+        if self._memory_variants(key) is None and self.store is not None:
+            stored = await asyncio.to_thread(self._load_from_store, key)
+        cached = self._lookup(key, policy, stored)
+        if cached is not None:
+            return cached
+
+        response = await self.inner.agenerate(request)
+        slot = self._remember(key, response.text, policy)
+        if slot is not None:
+            await asyncio.to_thread(self._persist, key, slot, response.text, policy)
+        return response
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        policy = self._policy_for(request)
+        if policy is None:
+            self._count("bypassed")
+            yield from self.inner.generate_stream(request)
+            return
+
+        key = cache_key_for(request, self.namespace)
+        cached = self._lookup(key, policy, self._load_from_store(key))
+        if cached is not None:
+            yield cached.text
+            return
+
+        parts: list[str] = []
+        for chunk in self.inner.generate_stream(request):
+            parts.append(chunk)
+            yield chunk
+        # Only reached when the stream completed; abandoned streams are not cached.
+        text = "".join(parts)
+        slot = self._remember(key, text, policy)
+        if slot is not None:
+            self._persist(key, slot, text, policy)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "store_hits": self._store_hits,
+                "misses": self._misses,
+                "bypassed": self._bypassed,
+                "rejected": self._rejected,
+                "hit_ratio": (self._hits / lookups) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def _policy_for(self, request: LLMChatRequest) -> LLMCachePolicy | None:
+        policy = request.cache if request.cache is not None else self.default_policy
+        if policy is None or not policy.enabled:
+            return None
+        return policy
+
+    def _memory_variants(self, key: str) -> list[str] | None:
+        with self._lock:
+            variants = self._memory.get(key)
+            if variants is not None:
+                self._memory.move_to_end(key)
+            return variants
+
+    def _load_from_store(self, key: str) -> list[str] | None:
+        if self.store is None or self._memory_variants(key) is not None:
+            return None
+        try:
+            return self.store.get_variants(key)
+        except Exception:
+            # The persistent tier is best-effort; never fail an LLM call because of it.
+            return None
+
+    def _lookup(self, key: str, policy: LLMCachePolicy, stored: list[str] | None) -> LLMChatResponse | None:
+        wanted = max(1, int(policy.variants))
+        with self._lock:
+            variants = self._memory.get(key)
+            from_store = False
+            if variants is None and stored:
+                variants = list(stored)
+                self._put_memory(key, variants)
+                from_store = True
+            if variants is not None and len(variants) >= wanted:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                if from_store:
+                    self._store_hits += 1
+                text = variants[0] if wanted == 1 else random.choice(variants[:wanted])
+                return LLMChatResponse(text=text, raw=None)
+            self._misses += 1
+            return None
+
+    def _remember(self, key: str, text: str, policy: LLMCachePolicy) -> int | None:
+        """Add a new variant; returns its slot index, or None if nothing was cached."""
+        if not (text or "").strip():
+            return None
+        if policy.accept is not None:
+            try:
+                accepted = bool(policy.accept(text))
+            except Exception:
+                accepted = False
+            if not accepted:
+                self._count("rejected")
+                return None
+        with self._lock:
+            variants = self._memory.get(key)
+            if variants is None:
+                variants = []
+                self._put_memory(key, variants)
+            if text in variants:
+                return None
+            variants.append(text)
+            self._memory.move_to_end(key)
+            return len(variants) - 1
+
+    def _put_memory(self, key: str, variants: list[str]) -> None:
+        self._memory[key] = variants
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _persist(self, key: str, slot: int, text: str, policy: LLMCachePolicy) -> None:
+        if self.store is None:
+            return
+        ttl = policy.ttl_seconds if policy.ttl_seconds is not None else self.default_ttl_seconds
+        try:
+            self.store.put(key, slot, text, ttl)
+        except Exception as e:
+            # Still cached in memory; the persistent tier is best-effort.
+            logger.warning("Failed to persist LLM cache entry %s: %s", key[:12], e)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, f"_{name}", getattr(self, f"_{name}") + 1)
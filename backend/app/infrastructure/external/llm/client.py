@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterator, Protocol
 
 from .types import LLMChatRequest, LLMChatResponse
 
@@ -8,3 +8,11 @@ from .types import LLMChatRequest, LLMChatResponse
 class LLMClient(Protocol):
     def generate(self, request: LLMChatRequest) -> LLMChatResponse:
         ...
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        """Non-blocking variant of `generate` for async routes."""
+        ...
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        """Yield response text chunks as the provider produces them."""
+        ...
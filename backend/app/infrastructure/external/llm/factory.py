@@ -2,13 +2,69 @@ from __future__ import annotations
 
 from typing import Any
 
+from .caching import CachingLLMClient
 from .client import LLMClient
 from .google_genai import GoogleGenAIClient
 from .mock import MockLLMClient
+from .scheduler import RateLimitedLLMClient
+from .singleflight import SingleFlightLLMClient
+from .registry import get_llm_registry
 
 
 def get_llm_client(settings: Any) -> LLMClient:
-    """Create an LLM client based on application settings.
+    """Return the shared LLM client for these settings (see LLMClientRegistry)."""
+    return get_llm_registry().get(settings)
+
+
+def create_llm_client(settings: Any) -> LLMClient:
+    """Create a new LLM client, wrapped in single-flight and the response cache when enabled.
+
+    Extra settings fields:
+    - llm_max_concurrency / llm_requests_per_minute / llm_tokens_per_minute / llm_queue_timeout_seconds
+    - llm_request_timeout_seconds
+    - llm_single_flight_enabled
+    - llm_cache_enabled / llm_cache_max_entries / llm_cache_persist / llm_cache_ttl_seconds
+    """
+    client = create_provider_client(settings)
+    # Innermost, so only real provider calls consume the budget.
+    client = RateLimitedLLMClient(
+        client,
+        max_concurrency=int(getattr(settings, "llm_max_concurrency", 4)),
+        requests_per_minute=int(getattr(settings, "llm_requests_per_minute", 0)),
+        tokens_per_minute=int(getattr(settings, "llm_tokens_per_minute", 0)),
+        queue_timeout_seconds=float(getattr(settings, "llm_queue_timeout_seconds", 30.0)),
+        default_max_output_tokens=int(getattr(settings, "google_genai_max_output_tokens", 1024)),
+    )
+    if bool(getattr(settings, "llm_single_flight_enabled", False)):
+        # Inside the cache, so concurrent misses for the same key become one provider call.
+        # A follower waits at most as long as the leader may take (queue wait + request).
+        client = SingleFlightLLMClient(
+            client,
+            wait_timeout_seconds=float(getattr(settings, "llm_queue_timeout_seconds", 30.0))
+            + float(getattr(settings, "llm_request_timeout_seconds", 120.0)),
+        )
+    if not bool(getattr(settings, "llm_cache_enabled", False)):
+        return client
+
+    store = None
+    if bool(getattr(settings, "llm_cache_persist", False)):
+        from app.infrastructure.db.session import SessionLocal
+        from app.infrastructure.repositories.sqlalchemy_llm_cache_repository import SqlAlchemyLLMCacheRepository
+
+        store = SqlAlchemyLLMCacheRepository(SessionLocal)
+
+    provider = str(getattr(settings, "ai_provider", "mock") or "mock").strip().lower()
+    return CachingLLMClient(
+        client,
+        max_entries=int(getattr(settings, "llm_cache_max_entries", 512)),
+        store=store,
+        default_ttl_seconds=getattr(settings, "llm_cache_ttl_seconds", None),
+        namespace=f"{provider}:{getattr(settings, 'google_genai_model', '')}",
+    )
+
+
+def create_provider_client(settings: Any) -> LLMClient:
+    """Create the raw provider client based on application settings.
 
     Expected settings fields (pydantic Settings):
     - ai_provider: str
@@ -25,11 +81,13 @@ def get_llm_client(settings: Any) -> LLMClient:
         model = getattr(settings, "google_genai_model", "gemini-2.0-flash")
         temperature = getattr(settings, "google_genai_temperature", 0.2)
         max_tokens = getattr(settings, "google_genai_max_output_tokens", 512)
+        timeout = getattr(settings, "llm_request_timeout_seconds", None)
         return GoogleGenAIClient(
             api_key=str(api_key or ""),
             default_model=str(model),
             default_temperature=float(temperature),
             default_max_output_tokens=int(max_tokens),
+            request_timeout_seconds=float(timeout) if timeout else None,
         )
 
     return MockLLMClient()
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+from typing import Any, Iterator
 
 from .types import LLMChatRequest, LLMChatResponse
 
 
+logger = logging.getLogger(__name__)
+
+
 class GoogleGenAIClient:
     def __init__(
         self,
@@ -13,6 +17,7 @@ class GoogleGenAIClient:
         default_model: str = "gemini-2.0-flash",
         default_temperature: float = 0.2,
         default_max_output_tokens: int = 512,
+        request_timeout_seconds: float | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY is required for AI_PROVIDER=google")
@@ -21,12 +26,46 @@ class GoogleGenAIClient:
         from google import genai  # type: ignore
 
         self._genai = genai
-        self._client = genai.Client(api_key=api_key)
+        http_options = None
+        if request_timeout_seconds:
+            http_options = genai.types.HttpOptions(timeout=int(request_timeout_seconds * 1000))  # milliseconds
+        self._client = genai.Client(api_key=api_key, http_options=http_options)
         self._default_model = default_model
         self._default_temperature = default_temperature
         self._default_max_output_tokens = default_max_output_tokens
 
     def generate(self, request: LLMChatRequest) -> LLMChatResponse:
+        model, prompt, config = self._build_call(request)
+        response: Any = self._client.models.generate_content(model=model, contents=prompt, config=config)
+
+        text = _extract_text(response)
+        logger.debug("GoogleGenAIClient.generate response text: %s", text)
+        return LLMChatResponse(text=text, raw=response)
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        model, prompt, config = self._build_call(request)
+        # `aio` shares this client's credentials; its HTTP pool lives as long as the client.
+        response: Any = await self._client.aio.models.generate_content(model=model, contents=prompt, config=config)
+
+        text = _extract_text(response)
+        logger.debug("GoogleGenAIClient.agenerate response text: %s", text)
+        return LLMChatResponse(text=text, raw=response)
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        model, prompt, config = self._build_call(request)
+        for chunk in self._client.models.generate_content_stream(model=model, contents=prompt, config=config):
+            text = getattr(chunk, "text", None)
+            if isinstance(text, str) and text:
+                yield text
+
+    def close(self) -> None:
+        self._client.close()
+
+    async def aclose(self) -> None:
+        await self._client.aio.aclose()
+        self._client.close()
+
+    def _build_call(self, request: LLMChatRequest) -> tuple[str, str, Any]:
         model = request.model or self._default_model
         temperature = request.temperature if request.temperature is not None else self._default_temperature
         max_output_tokens = (
@@ -39,9 +78,7 @@ class GoogleGenAIClient:
         ).strip()
         prompt = dialogue_text if not system_text else f"SYSTEM: {system_text}\n\n{dialogue_text}"
 
-        print("GoogleGenAIClient.generate prompt:", prompt)
-
-        response: Any
+        logger.debug("GoogleGenAIClient prompt: %s", prompt)
 
         from google.genai import types as genai_types  # type: ignore
         thinkingConfig = genai_types.ThinkingConfig(include_thoughts=False, thinking_level=genai_types.ThinkingLevel.MINIMAL)
@@ -51,11 +88,7 @@ class GoogleGenAIClient:
             response_mime_type="application/json",
             thinking_config=thinkingConfig,
         )
-        response = self._client.models.generate_content(model=model, contents=prompt, config=config)
-
-        text = _extract_text(response)
-        print("GoogleGenAIClient.generate response text:", text)
-        return LLMChatResponse(text=text, raw=response)
+        return model, prompt, config
 
 
 def _extract_text(response: Any) -> str:
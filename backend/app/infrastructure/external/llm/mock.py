@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+from typing import Iterator
+
 from .types import LLMChatRequest, LLMChatResponse
 
 
@@ -18,3 +21,11 @@ class MockLLMClient:
             f"Prompt:\n{prompt}"
         )
         return LLMChatResponse(text=text, raw=None)
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        return self.generate(request)
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        # Word-sized chunks (whitespace kept) so joining them gives back the exact text.
+        for chunk in re.findall(r"\S+\s*|\s+", self.generate(request).text):
+            yield chunk
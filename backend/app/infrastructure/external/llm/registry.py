@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from .client import LLMClient
+
+
+def _config_key(settings: Any) -> tuple[Any, ...]:
+    return (
+        str(getattr(settings, "ai_provider", "mock") or "mock").strip().lower(),
+        getattr(settings, "google_api_key", None),
+        getattr(settings, "google_genai_model", None),
+        getattr(settings, "google_genai_temperature", None),
+        getattr(settings, "google_genai_max_output_tokens", None),
+    )
+
+
+class LLMClientRegistry:
+    """Process-wide pool of provider clients, one per distinct provider configuration.
+
+    Provider clients own HTTP connection pools, so services share them instead of
+    building a new SDK client per request. Opened in the app lifespan and closed on shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[Any, ...], LLMClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, settings: Any) -> LLMClient:
+        key = _config_key(settings)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                from .factory import create_llm_client
+
+                client = create_llm_client(settings)
+                self._clients[key] = client
+            return client
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Metrics of every wrapper layer (cache, single-flight, ...) of each pooled client."""
+        with self._lock:
+            clients = list(self._clients.items())
+        out: dict[str, dict[str, Any]] = {}
+        for key, client in clients:
+            layers: dict[str, Any] = {}
+            layer: Any = client
+            while layer is not None:
+                stats = getattr(layer, "stats", None)
+                if callable(stats):
+                    layers[type(layer).__name__] = stats()
+                layer = getattr(layer, "inner", None)
+            out[f"{key[0]}:{key[2]}"] = layers
+        return out
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            aclose = getattr(client, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+_registry = LLMClientRegistry()
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    return _registry
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Iterator
+
+from .client import LLMClient
+from .types import LLMChatRequest, LLMChatResponse, LLMLane
+
+
+# Lower value = served first.
+LANE_PRIORITY: dict[str, int] = {"chat": 0, "placement": 1, "background": 2}
+DEFAULT_LANE: LLMLane = "background"
+
+
+class LLMQueueTimeoutError(TimeoutError):
+    """Raised when a request waited longer than the queue timeout for a provider slot."""
+
+
+def estimate_tokens(request: LLMChatRequest, default_max_output_tokens: int) -> tuple[int, int]:
+    """Rough (prompt, max output) token estimate: ~4 characters per token."""
+    prompt_chars = sum(len(m.content) for m in request.messages)
+    max_output = request.max_output_tokens if request.max_output_tokens is not None else default_max_output_tokens
+    return max(1, prompt_chars // 4), max(0, int(max_output))
+
+
+class _TokenBucket:
+    """Continuous-refill bucket sized for one minute of budget. per_minute <= 0 disables it."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(max(0, per_minute))
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def refill(self, now: float) -> None:
+        if not self.enabled:
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until(self, amount: float) -> float:
+        if not self.enabled:
+            return 0.0
+        amount = min(amount, self.capacity)
+        missing = amount - self.tokens
+        return 0.0 if missing <= 0 else missing / self.rate
+
+    def take(self, amount: float) -> None:
+        if self.enabled:
+            self.tokens -= min(amount, self.capacity)
+
+    def give_back(self, amount: float) -> None:
+        if self.enabled and amount > 0:
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _Ticket:
+    __slots__ = ("lane", "prompt_tokens", "max_output_tokens", "enqueued_at")
+
+    def __init__(self, lane: str, prompt_tokens: int, max_output_tokens: int) -> None:
+        self.lane = lane
+        self.prompt_tokens = prompt_tokens
+        self.max_output_tokens = max_output_tokens
+        self.enqueued_at = time.monotonic()
+
+    @property
+    def tokens(self) -> int:
+        return self.prompt_tokens + self.max_output_tokens
+
+
+class RateLimitedLLMClient:
+    """LLMClient decorator enforcing provider budgets with priority lanes.
+
+    - at most `max_concurrency` calls run at once
+    - `requests_per_minute` / `tokens_per_minute` token buckets (0 disables a budget)
+    - waiting calls are admitted strictly by lane (chat > placement > background), FIFO within a lane
+    - a call that cannot be admitted within `queue_timeout_seconds` raises LLMQueueTimeoutError
+
+    Token cost is estimated up front (prompt + max output) and the unused output part is
+    refunded once the response arrives.
+    """
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        *,
+        max_concurrency: int = 4,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        queue_timeout_seconds: float = 30.0,
+        default_max_output_tokens: int = 1024,
+    ) -> None:
+        self.inner = inner
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.queue_timeout_seconds = float(queue_timeout_seconds)
+        self.default_max_output_tokens = int(default_max_output_tokens)
+        self._requests = _TokenBucket(requests_per_minute)
+        self._tokens = _TokenBucket(tokens_per_minute)
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int, _Ticket]] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._metrics: dict[str, dict[str, float]] = {
+            lane: {"admitted": 0, "timeouts": 0, "wait_total": 0.0, "wait_max": 0.0} for lane in LANE_PRIORITY
+        }
+
+    def generate(self, request: LLMChatRequest) -> LLMChatResponse:
+        ticket = self._admit(request)
+        try:
+            response = self.inner.generate(request)
+        except BaseException:
+            self._release(ticket, None)
+            raise
+        self._release(ticket, response.text)
+        return response
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        ticket = self._admit(request)
+        parts: list[str] = []
+        try:
+            for chunk in self.inner.generate_stream(request):
+                parts.append(chunk)
+                yield chunk
+        finally:
+            # The slot is held until the stream is exhausted or closed by the consumer.
+            self._release(ticket, "".join(parts))
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        ticket, entry = self._enqueue(request)
+        deadline = ticket.enqueued_at + self.queue_timeout_seconds
+        try:
+            while True:
+                with self._cond:
+                    delay = self._try_admit(entry)
+                    if delay is None:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._abandon(entry)
+                        raise LLMQueueTimeoutError(f"LLM queue wait exceeded {self.queue_timeout_seconds:.1f}s")
+                # Poll without holding a thread: releases only notify the Condition.
+                await asyncio.sleep(min(remaining, delay if delay > 0 else 0.05, 0.25))
+        except asyncio.CancelledError:
+            with self._cond:
+                self._abandon(entry)
+            raise
+        try:
+            response = await self.inner.agenerate(request)
+        except BaseException:
+            self._release(ticket, None)
+            raise
+        self._release(ticket, response.text)
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            depth = {lane: 0 for lane in LANE_PRIORITY}
+            for _, _, ticket in self._queue:
+                depth[ticket.lane] += 1
+            lanes = {}
+            for lane, m in self._metrics.items():
+                admitted = int(m["admitted"])
+                lanes[lane] = {
+                    "queued": depth[lane],
+                    "admitted": admitted,
+                    "timeouts": int(m["timeouts"]),
+                    "avg_wait_ms": round(1000 * m["wait_total"] / admitted, 1) if admitted else 0.0,
+                    "max_wait_ms": round(1000 * m["wait_max"], 1),
+                }
+            return {
+                "running": self._running,
+                "max_concurrency": self.max_concurrency,
+                "queue_depth": len(self._queue),
+                "lanes": lanes,
+            }
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def _admit(self, request: LLMChatRequest) -> _Ticket:
+        """Block until the request may call the provider (or raise LLMQueueTimeoutError)."""
+        ticket, entry = self._enqueue(request)
+        deadline = ticket.enqueued_at + self.queue_timeout_seconds
+        with self._cond:
+            while True:
+                delay = self._try_admit(entry)
+                if delay is None:
+                    return ticket
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._abandon(entry)
+                    raise LLMQueueTimeoutError(f"LLM queue wait exceeded {self.queue_timeout_seconds:.1f}s")
+                self._cond.wait(min(remaining, delay) if delay > 0 else remaining)
+
+    def _enqueue(self, request: LLMChatRequest) -> tuple[_Ticket, tuple[int, int, _Ticket]]:
+        lane = request.lane if request.lane in LANE_PRIORITY else DEFAULT_LANE
+        prompt_tokens, max_output = estimate_tokens(request, self.default_max_output_tokens)
+        ticket = _Ticket(lane, prompt_tokens, max_output)
+        entry = (LANE_PRIORITY[lane], next(self._seq), ticket)
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+        return ticket, entry
+
+    def _try_admit(self, entry: tuple[int, int, _Ticket]) -> float | None:
+        """Admit `entry` if it is at the head and budgets allow. Returns None when admitted,
+        otherwise how long to wait before re-checking (0 = wait for a notification)."""
+        if self._queue[0] is not entry or self._running >= self.max_concurrency:
+            return 0.0
+        ticket = entry[2]
+        now = time.monotonic()
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        delay = max(self._requests.seconds_until(1), self._tokens.seconds_until(ticket.tokens))
+        if delay > 0:
+            return delay
+        self._requests.take(1)
+        self._tokens.take(ticket.tokens)
+        heapq.heappop(self._queue)
+        self._running += 1
+        waited = now - ticket.enqueued_at
+        m = self._metrics[ticket.lane]
+        m["admitted"] += 1
+        m["wait_total"] += waited
+        m["wait_max"] = max(m["wait_max"], waited)
+        # The next waiter may now be at the head.
+        self._cond.notify_all()
+        return None
+
+    def _abandon(self, entry: tuple[int, int, _Ticket]) -> None:
+        try:
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+        except ValueError:
+            return
+        self._metrics[entry[2].lane]["timeouts"] += 1
+        self._cond.notify_all()
+
+    def _release(self, ticket: _Ticket, response_text: str | None) -> None:
+        with self._cond:
+            self._running -= 1
+            if response_text is not None:
+                used_output = len(response_text) // 4
+                self._tokens.give_back(ticket.max_output_tokens - min(used_output, ticket.max_output_tokens))
+            self._cond.notify_all()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Iterator
+
+from .caching import cache_key_for
+from .client import LLMClient
+from .types import LLMChatRequest, LLMChatResponse
+
+
+class _Call:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: LLMChatResponse | None = None
+        self.error: BaseException | None = None
+
+
+class _LeaderCancelled(Exception):
+    """Set on the shared future when the leading task is cancelled; followers retry on their own."""
+
+
+class SingleFlightLLMClient:
+    """LLMClient decorator that coalesces concurrent identical requests.
+
+    While a request is in flight, other callers with the same request key wait for it
+    and share its LLMChatResponse (or its exception) instead of calling the provider again.
+    Threads and asyncio tasks are tracked separately; async calls coalesce per event loop.
+    A follower that waited `wait_timeout_seconds` for a leader (e.g. one stuck in the
+    provider) stops waiting and calls the provider itself; so does every follower when
+    the leading task is cancelled.
+    """
+
+    def __init__(self, inner: LLMClient, *, wait_timeout_seconds: float | None = None) -> None:
+        self.inner = inner
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[tuple[int, str], asyncio.Future[LLMChatResponse]] = {}
+        self._leaders = 0
+        self._collapsed = 0
+        self._wait_timeouts = 0
+
+    def generate(self, request: LLMChatRequest) -> LLMChatResponse:
+        key = cache_key_for(request)
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._collapsed += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+                leader = True
+
+        if not leader:
+            if not call.done.wait(self.wait_timeout_seconds):
+                self._count_wait_timeout()
+                return self.inner.generate(request)
+            if call.error is not None:
+                raise call.error
+            assert call.response is not None
+            return call.response
+
+        try:
+            call.response = self.inner.generate(request)
+            return call.response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def agenerate(self, request: LLMChatRequest) -> LLMChatResponse:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), cache_key_for(request))
+        with self._lock:
+            future = self._async_calls.get(key)
+            if future is not None:
+                self._collapsed += 1
+                leader = False
+            else:
+                future = loop.create_future()
+                self._async_calls[key] = future
+                self._leaders += 1
+                leader = True
+
+        if not leader:
+            # shield: a cancelled (or timed out) follower must not cancel the shared call
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), self.wait_timeout_seconds)
+            except asyncio.TimeoutError:
+                self._count_wait_timeout()
+                return await self.inner.agenerate(request)
+            except _LeaderCancelled:
+                return await self.inner.agenerate(request)
+
+        try:
+            response = await self.inner.agenerate(request)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            # Wake the followers without cancelling them: the leader's caller went away, theirs didn't.
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody waited on isn't logged as "never retrieved".
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                self._async_calls.pop(key, None)
+
+    def generate_stream(self, request: LLMChatRequest) -> Iterator[str]:
+        # Streams are consumed incrementally by one caller; they are not coalesced.
+        yield from self.inner.generate_stream(request)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "leaders": self._leaders,
+                "collapsed": self._collapsed,
+                "wait_timeouts": self._wait_timeouts,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
+
+    def _count_wait_timeout(self) -> None:
+        with self._lock:
+            self._wait_timeouts += 1
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
 
 
 LLMRole = Literal["system", "user", "assistant"]
+# Scheduler priority lanes, highest first (see RateLimitedLLMClient).
+LLMLane = Literal["chat", "placement", "background"]
 
 
 @dataclass(frozen=True)
@@ -13,12 +15,31 @@ class LLMMessage:
     content: str
 
 
+@dataclass(frozen=True)
+class LLMCachePolicy:
+    """Per-call-site caching opt-in, honoured by CachingLLMClient.
+
+    `variants` > 1 lets sampled (temperature > 0) call sites collect up to N distinct
+    responses and then reuse a random one of them. `accept` lets the call site reject
+    responses its parser cannot use, so they are not cached and replayed.
+    """
+
+    enabled: bool = True
+    variants: int = 1
+    ttl_seconds: int | None = None
+    accept: Callable[[str], bool] | None = field(default=None, compare=False)
+
+
 @dataclass(frozen=True)
 class LLMChatRequest:
     messages: list[LLMMessage]
     model: str | None = None
     temperature: float | None = None
     max_output_tokens: int | None = None
+    # Not part of the cache key. None means "use the client's default" (uncached).
+    cache: LLMCachePolicy | None = None
+    # Not part of the cache key. None means "background".
+    lane: LLMLane | None = None
 
 
 @dataclass(frozen=True)
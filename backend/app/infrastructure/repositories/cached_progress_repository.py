@@ -0,0 +1,181 @@
+"""Per-worker TTL/LRU cache in front of SqlAlchemyProgressRepository.
+
+Progress rows and recent snapshots are read by the progress pages and exports, but change
+only when content is completed, a test is scored or an assignment is graded. Those paths
+call `invalidate_progress_cache` right after committing (so must any new writer of progress
+rows); the TTL bounds how long another worker's copy can lag behind. Because of that lag,
+nothing stored under a context version (the summary row, the chatbot context) is built from it.
+Entries are per database (engine) and per student, least recently used first out. With
+`progress_cache_enabled=false` reads go straight to the database.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import Settings, get_settings
+from app.domain.repositories.cached_progress_repository import CachedProgressRepository
+from app.infrastructure.repositories.sqlalchemy_progress_repository import (
+	ProgressRow,
+	ProgressSnapshotRow,
+	SqlAlchemyProgressRepository,
+)
+
+
+_MISSING = object()
+
+
+@dataclass
+class _StudentEntry:
+	expires_at: float
+	values: dict[Any, Any] = field(default_factory=dict)
+
+
+class ProgressCache:
+	def __init__(
+		self,
+		*,
+		enabled: bool = True,
+		ttl_seconds: float = 60.0,
+		max_entries: int = 1024,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		self.enabled = bool(enabled)
+		self.ttl_seconds = float(ttl_seconds)
+		self.max_entries = max(1, int(max_entries))
+		self._clock = clock
+		self._lock = threading.Lock()
+		self._entries: weakref.WeakKeyDictionary[Any, OrderedDict[int, _StudentEntry]] = weakref.WeakKeyDictionary()
+		# Bumped by invalidate(); a read started before an invalidation does not store its result.
+		self._generations: weakref.WeakKeyDictionary[Any, dict[int, int]] = weakref.WeakKeyDictionary()
+		self._hits = 0
+		self._misses = 0
+		self._expired = 0
+		self._evicted = 0
+		self._invalidated = 0
+
+	@classmethod
+	def from_settings(cls, settings: Settings) -> "ProgressCache":
+		return cls(
+			enabled=settings.progress_cache_enabled,
+			ttl_seconds=settings.progress_cache_ttl_seconds,
+			max_entries=settings.progress_cache_max_entries,
+		)
+
+	def generation(self, bind: Any, student_id: int) -> int:
+		with self._lock:
+			return self._generations.get(bind, {}).get(int(student_id), 0)
+
+	def get(self, bind: Any, student_id: int, key: Any) -> Any:
+		"""The cached value, or `_MISSING`."""
+		now = self._clock()
+		with self._lock:
+			students = self._entries.get(bind)
+			entry = students.get(int(student_id)) if students is not None else None
+			if entry is not None and entry.expires_at <= now:
+				del students[int(student_id)]
+				self._expired += 1
+				entry = None
+			if entry is None or key not in entry.values:
+				self._misses += 1
+				return _MISSING
+			students.move_to_end(int(student_id))
+			self._hits += 1
+			return entry.values[key]
+
+	def put(self, bind: Any, student_id: int, key: Any, value: Any, *, generation: int | None = None) -> None:
+		now = self._clock()
+		with self._lock:
+			if generation is not None and self._generations.get(bind, {}).get(int(student_id), 0) != generation:
+				return
+			students = self._entries.setdefault(bind, OrderedDict())
+			entry = students.get(int(student_id))
+			if entry is None or entry.expires_at <= now:
+				entry = students[int(student_id)] = _StudentEntry(expires_at=now + self.ttl_seconds)
+			entry.values[key] = value
+			students.move_to_end(int(student_id))
+			while len(students) > self.max_entries:
+				students.popitem(last=False)
+				self._evicted += 1
+
+	def invalidate(self, bind: Any, student_id: int) -> None:
+		with self._lock:
+			generations = self._generations.setdefault(bind, {})
+			generations[int(student_id)] = generations.get(int(student_id), 0) + 1
+			students = self._entries.get(bind)
+			if students is not None and students.pop(int(student_id), None) is not None:
+				self._invalidated += 1
+
+	def stats(self) -> dict[str, Any]:
+		with self._lock:
+			lookups = self._hits + self._misses
+			return {
+				"enabled": self.enabled,
+				"hits": self._hits,
+				"misses": self._misses,
+				"hit_ratio": (self._hits / lookups) if lookups else 0.0,
+				"expired": self._expired,
+				"evicted": self._evicted,
+				"invalidated": self._invalidated,
+				"entries": sum(len(students) for students in self._entries.values()),
+			}
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self._generations.clear()
+			self._hits = self._misses = self._expired = self._evicted = self._invalidated = 0
+
+
+progress_cache = ProgressCache.from_settings(get_settings())
+
+
+class CachedSqlAlchemyProgressRepository(CachedProgressRepository):
+	"""SqlAlchemyProgressRepository reads through `progress_cache` (same methods and results)."""
+
+	def __init__(self, db: Session, cache: ProgressCache | None = None):
+		self.db = db
+		self.inner = SqlAlchemyProgressRepository(db)
+		self.cache = progress_cache if cache is None else cache
+
+	def fetch_progress(self, student_id: int) -> ProgressRow | None:
+		return self._read(student_id, "progress", lambda: self.inner.fetch_progress(student_id))
+
+	def fetch_snapshots(self, student_id: int, days: int = 30) -> list[ProgressSnapshotRow]:
+		rows = self._read(student_id, ("snapshots", int(days)), lambda: tuple(self.inner.fetch_snapshots(student_id, days)))
+		return list(rows)
+
+	def getMostRecentProgress(self, studentId: int) -> ProgressRow | None:
+		return self.fetch_progress(studentId)
+
+	def cacheProgress(self, studentId: int, progress: ProgressRow | None) -> None:
+		"""Write-through: store the row just written for `studentId`."""
+		if self.cache.enabled:
+			self.cache.put(self.db.get_bind(), studentId, "progress", progress)
+
+	def invalidate(self, studentId: int) -> None:
+		self.cache.invalidate(self.db.get_bind(), studentId)
+
+	def _read(self, student_id: int, key: Any, load: Callable[[], Any]) -> Any:
+		if not self.cache.enabled:
+			return load()
+		bind = self.db.get_bind()
+		value = self.cache.get(bind, student_id, key)
+		if value is not _MISSING:
+			return value
+		generation = self.cache.generation(bind, student_id)
+		value = load()
+		self.cache.put(bind, student_id, key, value, generation=generation)
+		return value
+
+
+def invalidate_progress_cache(db: Session, student_id: int) -> None:
+	"""Drop the cached progress of `student_id`; call after committing a change to it."""
+	progress_cache.invalidate(db.get_bind(), student_id)
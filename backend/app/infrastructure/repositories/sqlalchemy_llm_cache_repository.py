@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.llm_cache import LLMResponseCacheDB
+
+
+class SqlAlchemyLLMCacheRepository:
+	"""Persistent tier of the LLM response cache.
+
+	Opens a short-lived session per call because the LLM client is process-wide and
+	is not tied to any request's session.
+	"""
+
+	def __init__(self, session_factory: Callable[[], Session]):
+		self.session_factory = session_factory
+
+	def get_variants(self, cache_key: str) -> list[str]:
+		now = datetime.utcnow()
+		with self.session_factory() as db:
+			rows = db.scalars(
+				select(LLMResponseCacheDB.response_text)
+				.where(
+					LLMResponseCacheDB.cache_key == cache_key,
+					or_(LLMResponseCacheDB.expires_at.is_(None), LLMResponseCacheDB.expires_at > now),
+				)
+				.order_by(LLMResponseCacheDB.variant)
+			).all()
+		return [str(r) for r in rows]
+
+	def put(self, cache_key: str, variant: int, text: str, ttl_seconds: int | None) -> None:
+		expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds) if ttl_seconds else None
+		with self.session_factory() as db:
+			# Replace an expired row for the same slot; a live one stays (IntegrityError below).
+			db.execute(
+				delete(LLMResponseCacheDB).where(
+					LLMResponseCacheDB.cache_key == cache_key,
+					LLMResponseCacheDB.variant == variant,
+					LLMResponseCacheDB.expires_at.is_not(None),
+					LLMResponseCacheDB.expires_at <= datetime.utcnow(),
+				)
+			)
+			db.add(
+				LLMResponseCacheDB(
+					cache_key=cache_key,
+					variant=variant,
+					response_text=text,
+					expires_at=expires_at,
+				)
+			)
+			try:
+				db.commit()
+			except IntegrityError:
+				# Another worker filled the slot first; either value is fine.
+				db.rollback()
+
+	def purge_expired(self) -> int:
+		with self.session_factory() as db:
+			result = db.execute(
+				delete(LLMResponseCacheDB).where(
+					LLMResponseCacheDB.expires_at.is_not(None),
+					LLMResponseCacheDB.expires_at <= datetime.utcnow(),
+				)
+			)
+			db.commit()
+			return int(result.rowcount or 0)
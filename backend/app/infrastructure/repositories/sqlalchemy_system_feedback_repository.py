@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.domain.models.system_feedback import SystemFeedback
 from app.domain.repositories.system_feedback_repository import SystemFeedbackRepository
 from app.infrastructure.db.models.system_feedback import SystemFeedbackDB
+from app.infrastructure.db.pagination import Page, build_page, keyset
 
 
 class SqlAlchemySystemFeedbackRepository(SystemFeedbackRepository):
@@ -44,20 +45,24 @@ class SqlAlchemySystemFeedbackRepository(SystemFeedbackRepository):
 
 	def findAll(self) -> list[SystemFeedback]:
 		models = list(self.db.scalars(select(SystemFeedbackDB).order_by(SystemFeedbackDB.created_at.desc())).all())
-		out: list[SystemFeedback] = []
-		for m in models:
-			out.append(
-				SystemFeedback(
-					feedbackId=int(m.id),
-					userId=int(m.user_id),
-					category=str(getattr(m, "category", "other") or "other"),
-					title=str(getattr(m, "subject", "") or ""),
-					description=str(m.description or ""),
-					status=str(getattr(m, "status", "pending") or "pending"),
-					createdAt=m.created_at,
-				)
-			)
-		return out
+		return [self._to_domain(m) for m in models]
+
+	def findPage(self, limit: int, cursor: str | None = None) -> Page[SystemFeedback]:
+		stmt = keyset(select(SystemFeedbackDB), SystemFeedbackDB.created_at, SystemFeedbackDB.id, cursor=cursor, limit=limit)
+		page = build_page(self.db.scalars(stmt).all(), limit=limit, key=lambda m: (m.created_at, m.id))
+		return Page(items=[self._to_domain(m) for m in page.items], next_cursor=page.next_cursor)
+
+	@staticmethod
+	def _to_domain(m: SystemFeedbackDB) -> SystemFeedback:
+		return SystemFeedback(
+			feedbackId=int(m.id),
+			userId=int(m.user_id),
+			category=str(getattr(m, "category", "other") or "other"),
+			title=str(getattr(m, "subject", "") or ""),
+			description=str(m.description or ""),
+			status=str(getattr(m, "status", "pending") or "pending"),
+			createdAt=m.created_at,
+		)
 
 	def updateStatus(self, feedbackId: int, status: str) -> SystemFeedback:
 		model = self.db.get(SystemFeedbackDB, int(feedbackId))
@@ -6,60 +6,85 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from sqlalchemy import text
-
+from app.api.deps.etag import ETAG_HEADER
+from app.api.deps.pagination import NEXT_CURSOR_HEADER
+from app.api.middleware import SQLInstrumentationMiddleware
 from app.api.router import api_router
 from app.config.settings import get_settings
+from app.infrastructure.db.instrumentation import get_sql_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup / shutdown events."""
+    from app.infrastructure.db import async_engine, engine
+    from app.infrastructure.db.migrations import check_schema_version, run_migrations
+    from app.infrastructure.db.session import SessionLocal, sqlite_pragma_report
+    from app.application.services.listening_question_bank_service import ListeningQuestionBankRefillJob
+    from app.application.services.job_service import JobRunner
+    from app.application.services.progress_summary_service import ProgressSummaryRefreshJob
+    from app.infrastructure.external.llm import get_llm_registry
 
+    settings = get_settings()
 
-def _ensure_sqlite_system_feedback_schema(engine) -> None:
-    """Best-effort SQLite schema patching for dev.
+    # Schema changes (tables, columns, indexes, seed data) are applied by `python -m scripts.migrate`;
+    # workers only verify the version, so concurrent boots never race on DDL.
+    if settings.db_migrate_on_startup:
+        for migration in run_migrations(engine):
+            logging.getLogger("uvicorn.error").info(f"Applied migration {migration.version}: {migration.name}")
+    schema_version = check_schema_version(engine)
+    logging.getLogger("uvicorn.error").info(f"Database schema version {schema_version}")
 
-    This project uses `Base.metadata.create_all()` which does not alter existing tables.
-    If a developer already has an older `app.db`, new columns won't exist and writes can fail.
-    """
+    # Report the effective connection profile (WAL, busy timeout, cache sizes, ...)
     try:
-        if engine.dialect.name != "sqlite":
-            return
-        with engine.connect() as conn:
-            cols = conn.execute(text("PRAGMA table_info(system_feedback)")).fetchall()
-            if not cols:
-                return
-            col_names = {str(r[1]) for r in cols}
-            if "category" not in col_names:
-                conn.execute(text("ALTER TABLE system_feedback ADD COLUMN category VARCHAR(50) NOT NULL DEFAULT 'other'"))
-            if "status" not in col_names:
-                conn.execute(text("ALTER TABLE system_feedback ADD COLUMN status VARCHAR(50) NOT NULL DEFAULT 'pending'"))
-            conn.commit()
+        pragmas = sqlite_pragma_report(engine)
+        if pragmas:
+            logging.getLogger("uvicorn.error").info(
+                "SQLite profile: %s", ", ".join(f"{k}={v}" for k, v in pragmas.items())
+            )
     except Exception as e:
-        # Do not block app startup in dev; log and continue.
-        logging.getLogger("uvicorn.error").warning(f"System feedback schema check failed: {e}")
-
+        logging.getLogger("uvicorn.error").warning(f"SQLite pragma report failed: {e}")
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Startup / shutdown events."""
-    # Import models so Base.metadata is populated, then create tables
-    from app.infrastructure.db import Base, engine
-    import app.infrastructure.db.models  # noqa: F401  (registers all tables)
-    from app.infrastructure.db.session import SessionLocal
-    from app.application.services.achievement_service import AchievementService
-
-    Base.metadata.create_all(bind=engine)
-    _ensure_sqlite_system_feedback_schema(engine)
-    
-    # Initialize achievements
+    # Open the shared LLM provider client once; services reuse its connection pool
+    llm_registry = get_llm_registry()
     try:
-        db = SessionLocal()
-        achievement_service = AchievementService(db)
-        achievement_service.initialize_achievements()
-        logging.getLogger("uvicorn.error").info("Achievements initialized successfully")
-        db.close()
+        llm_registry.get(settings)
     except Exception as e:
-        logging.getLogger("uvicorn.error").error(f"Failed to initialize achievements: {e}")
-    
+        logging.getLogger("uvicorn.error").error(f"Failed to initialize LLM client: {e}")
+
+    # Keep the listening question bank topped up off the request path (runs as one job across workers)
+    refill_job = None
+    if settings.listening_bank_refill_enabled:
+        refill_job = ListeningQuestionBankRefillJob(SessionLocal, settings.listening_bank_refill_interval_seconds)
+        refill_job.start()
+
+    # Rebuild progress summaries off the request path (GET /progress never writes)
+    summary_job = None
+    if settings.progress_summary_refresh_enabled:
+        summary_job = ProgressSummaryRefreshJob(SessionLocal, settings.progress_summary_refresh_interval_seconds)
+        summary_job.start()
+
+    # Drain the persistent jobs table (also resumes jobs interrupted by a restart)
+    job_runner = None
+    if settings.job_runner_enabled:
+        job_runner = JobRunner(
+            SessionLocal,
+            workers=settings.job_workers,
+            poll_interval_seconds=settings.job_poll_interval_seconds,
+            stale_after_seconds=settings.job_stale_after_seconds,
+        )
+        job_runner.start()
+
     yield
-    # (Optional) cleanup on shutdown
+
+    if job_runner is not None:
+        job_runner.stop()
+    if summary_job is not None:
+        summary_job.stop()
+    if refill_job is not None:
+        refill_job.stop()
+    await llm_registry.aclose()
+    await async_engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -82,6 +107,9 @@ def create_app() -> FastAPI:
     static_dir = Path(__file__).resolve().parent / "app" / "static"
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+    if settings.sql_instrumentation_enabled:
+        app.add_middleware(SQLInstrumentationMiddleware, recorder=get_sql_stats(), server_timing=settings.debug)
+
     if settings.cors_origins:
         app.add_middleware(
             CORSMiddleware,
@@ -89,6 +117,8 @@ def create_app() -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            # Let browsers read the pagination cursor, 202 job locations, ETags and debug timings.
+            expose_headers=[NEXT_CURSOR_HEADER, "Location", ETAG_HEADER, "Server-Timing"],
         )
 
     app.include_router(api_router, prefix=settings.api_prefix)
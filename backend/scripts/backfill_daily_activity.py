@@ -0,0 +1,25 @@
+"""Rebuild the daily_activity rollup from the event tables.
+
+The rollup is maintained on every write; run this after bulk imports or raw-SQL fixes
+that bypassed the ORM, or to verify it:
+
+    python -m scripts.backfill_daily_activity
+"""
+
+import argparse
+
+from app.infrastructure.db.daily_activity import rebuild_daily_activity
+from app.infrastructure.db.session import engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    with engine.begin() as conn:
+        written = rebuild_daily_activity(conn)
+    print(f"✓ daily_activity rebuilt: {written} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Script to build / top up the listening question bank.
+
+Generates validated question sets for every audio file in app/static/audio that is
+not yet in the bank. Safe to re-run; existing sets are skipped.
+Run from the backend directory with: python scripts/build_listening_bank.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db import Base, engine
+import app.infrastructure.db.models  # noqa: F401  (registers all tables)
+from app.infrastructure.db.session import SessionLocal
+from app.application.services.listening_question_bank_service import ListeningQuestionBankService
+from main import _ensure_sqlite_listening_bank_schema
+
+
+def main():
+    """Top up the listening question bank."""
+    Base.metadata.create_all(bind=engine)
+    _ensure_sqlite_listening_bank_schema(engine)
+
+    db: Session = SessionLocal()
+    try:
+        print("Building listening question bank...")
+        service = ListeningQuestionBankService(db)
+        report = service.refill()
+        print(
+            f"✅ scanned={report.scanned} generated={report.generated} "
+            f"already_banked={report.already_banked} failed={report.failed}"
+        )
+        for level, count in sorted(service.set_counts_by_level().items(), key=lambda kv: kv[0].value):
+            print(f"   {level.value}: {count} set(s)")
+
+    except Exception as e:
+        print(f"❌ Error building listening question bank: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Apply pending schema migrations.
+
+Run this once per deployment, before starting (or restarting) the app workers:
+
+    python -m scripts.migrate            # migrate to the latest version
+    python -m scripts.migrate --status   # print the current and latest version
+"""
+
+import argparse
+
+from app.infrastructure.db.migrations import LATEST_VERSION, MIGRATIONS, current_version, run_migrations
+from app.infrastructure.db.session import engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--status", action="store_true", help="only report the schema version")
+    parser.add_argument("--target", type=int, default=None, help="stop after this version")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        version = current_version(conn)
+    print(f"Schema version: {version} (latest: {LATEST_VERSION})")
+    if args.status:
+        for m in MIGRATIONS:
+            print(f"  [{'x' if m.version <= version else ' '}] {m.version:>3}  {m.name}")
+        return
+
+    applied = run_migrations(engine, target=args.target)
+    for m in applied:
+        print(f"✓ {m.version}: {m.name}")
+    if not applied:
+        print("✓ Nothing to migrate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Shared fixtures: an isolated SQLite database per test (in-memory, or a file for API tests)."""
+
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config.settings import Settings
+from app.domain.enums import UserRole
+from app.infrastructure.db.base import Base
+import app.infrastructure.db.models  # noqa: F401  (registers all tables)
+from app.infrastructure.db.models.user import StudentDB, TeacherDB, UserDB
+from app.infrastructure.db.session import create_async_db_engine, create_db_engine, get_async_db, get_db
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def api(tmp_path):
+    """TestClient over a file database shared by a sync and an async engine."""
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    cfg = Settings()
+    engine = create_db_engine(url, cfg)
+    async_engine = create_async_db_engine(url, cfg)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def _db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def _async_db():
+        async with async_factory() as db:
+            yield db
+
+    from app.api.deps.auth import get_current_user
+    from main import app
+
+    current = {}
+    app.dependency_overrides[get_db] = _db
+    app.dependency_overrides[get_async_db] = _async_db
+    app.dependency_overrides[get_current_user] = lambda: current["user"]
+    db = factory()
+    try:
+        yield SimpleNamespace(
+            client=TestClient(app),
+            db=db,
+            current=current,
+            engines=(engine, async_engine.sync_engine),
+        )
+    finally:
+        db.close()
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+@contextmanager
+def count_statements(*engines):
+    """Count SQL statements executed on `engines` inside the block: `with count_statements(e) as n: ...; n["n"]`."""
+    counter = {"n": 0}
+
+    def _inc(*args, **kwargs):
+        counter["n"] += 1
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _inc)
+    try:
+        yield counter
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _inc)
+
+
+def login(api, user):
+    """Make `user` the authenticated user of the `api` client."""
+    api.current["user"] = SimpleNamespace(userId=int(user.id), role=user.role)
+
+
+def make_user(db, *, role=UserRole.STUDENT, name="Test User", email=None):
+    user = UserDB(
+        name=name,
+        email=email or f"{name.lower().replace(' ', '.')}.{datetime.utcnow().timestamp()}@example.com",
+        password="hashed",
+        role=role,
+        is_verified=True,
+    )
+    db.add(user)
+    db.flush()
+    if role == UserRole.STUDENT:
+        db.add(StudentDB(user_id=user.id, enrollment_date=datetime.utcnow()))
+    elif role == UserRole.TEACHER:
+        db.add(TeacherDB(user_id=user.id))
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def make_student(db, name="Test Student"):
+    """Create a student user; returns the StudentDB row."""
+    user = make_user(db, role=UserRole.STUDENT, name=name)
+    return user.student
@@ -0,0 +1,90 @@
+"""Registry of hot queries and helpers to inspect their SQLite query plans.
+
+Every query here runs on a request hot path (chatbot turns, content delivery, the
+teacher roster, plan generation, auth). Each one must be answered from an index;
+test_query_plans.py runs EXPLAIN QUERY PLAN over the registry and fails on
+any full table scan. When adding a per-student "latest row" query elsewhere, add
+its shape here along with the index that serves it.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Callable
+
+from sqlalchemy import Select, or_, select
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.db.models.chatbot import ChatMessageDB, ChatSessionDB
+from app.infrastructure.db.models.content import LessonPlanDB
+from app.infrastructure.db.models.feedback import FeedbackDB
+from app.infrastructure.db.models.messaging import MessageDB
+from app.infrastructure.db.models.progress import ProgressSnapshotDB
+from app.infrastructure.db.models.results import TestResultDB
+from app.infrastructure.db.models.rewards import StudentRewardDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.models.system import MaintenanceLogDB
+from app.infrastructure.db.models.teacher_directive import TeacherDirectiveDB
+from app.infrastructure.db.models.tests import SpeakingAnalysisDB, TestModuleQuestionDB, TestModuleSubmissionDB
+
+
+_ID = 1
+
+HOT_QUERIES: dict[str, Callable[[], Select]] = {
+    "latest_test_result": lambda: select(TestResultDB)
+    .where(TestResultDB.student_id == _ID)
+    .order_by(TestResultDB.completed_at.desc())
+    .limit(1),
+    "latest_lesson_plan": lambda: select(LessonPlanDB)
+    .where(LessonPlanDB.student_id == _ID)
+    .order_by(LessonPlanDB.created_at.desc())
+    .limit(1),
+    "user_messages": lambda: select(MessageDB)
+    .where(or_(MessageDB.recipient_id == _ID, MessageDB.sender_id == _ID))
+    .order_by(MessageDB.sent_at.desc()),
+    "open_chat_session": lambda: select(ChatSessionDB)
+    .where(ChatSessionDB.student_id == _ID, ChatSessionDB.ended_at.is_(None))
+    .order_by(ChatSessionDB.started_at.desc())
+    .limit(1),
+    "chat_session_history": lambda: select(ChatMessageDB)
+    .where(ChatMessageDB.session_id == _ID)
+    .order_by(ChatMessageDB.timestamp.asc()),
+    "student_reward_earned": lambda: select(StudentRewardDB.id).where(
+        StudentRewardDB.student_id == _ID, StudentRewardDB.reward_id == _ID
+    ),
+    "open_maintenance_log": lambda: select(MaintenanceLogDB)
+    .where(MaintenanceLogDB.end_time.is_(None))
+    .order_by(MaintenanceLogDB.start_time.desc())
+    .limit(1),
+    "progress_snapshots": lambda: select(ProgressSnapshotDB)
+    .where(ProgressSnapshotDB.student_id == _ID, ProgressSnapshotDB.snapshot_date >= date(2024, 1, 1))
+    .order_by(ProgressSnapshotDB.snapshot_date.asc()),
+    "recent_feedback": lambda: select(FeedbackDB)
+    .where(FeedbackDB.student_id == _ID)
+    .order_by(FeedbackDB.generated_at.desc())
+    .limit(5),
+    "active_ai_content": lambda: select(StudentAIContentDB)
+    .where(StudentAIContentDB.student_id == _ID, StudentAIContentDB.is_active.is_(True)),
+    "active_directives": lambda: select(TeacherDirectiveDB)
+    .where(TeacherDirectiveDB.student_user_id == _ID, TeacherDirectiveDB.is_active.is_(True)),
+    "placement_module_questions": lambda: select(TestModuleQuestionDB.question_id)
+    .where(TestModuleQuestionDB.module_id == _ID)
+    .order_by(TestModuleQuestionDB.position),
+    "placement_module_submissions": lambda: select(TestModuleSubmissionDB)
+    .where(TestModuleSubmissionDB.module_id == _ID),
+    "latest_speaking_analysis": lambda: select(SpeakingAnalysisDB.cefr_level)
+    .where(SpeakingAnalysisDB.module_id == _ID)
+    .order_by(SpeakingAnalysisDB.analyzed_at.desc(), SpeakingAnalysisDB.id.desc())
+    .limit(1),
+}
+
+
+def explain_query_plan(conn: Connection, stmt: Select) -> list[str]:
+    """Return the `detail` column of EXPLAIN QUERY PLAN for a statement (SQLite only)."""
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def full_scans(plan: list[str]) -> list[str]:
+    """Plan steps that read a whole table (or a whole index) instead of searching it."""
+    return [step for step in plan if step.startswith("SCAN ")]
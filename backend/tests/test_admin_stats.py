@@ -0,0 +1,80 @@
+"""Admin dashboard statistics: fixed query count and a stale-while-revalidate cache."""
+
+import threading
+from datetime import datetime, timedelta
+
+from app.application.services import admin_service
+from app.application.services.admin_service import AdminService
+from app.domain.enums import UserRole
+from app.infrastructure.db.models import results as result_models
+from tests.conftest import count_statements, make_user
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _add_results(db, student, days_ago):
+    for d in days_ago:
+        db.add(
+            result_models.TestResultDB(
+                student_id=student.student.id, test_id=1, completed_at=datetime.utcnow() - timedelta(days=d)
+            )
+        )
+    db.commit()
+
+
+def test_stats_use_a_fixed_number_of_queries(engine, db):
+    student = make_user(db, role=UserRole.STUDENT, name="Student")
+    _add_results(db, student, [0, 1])
+    AdminService(db).computeSystemStats()  # warms the maintenance flag cache
+    with count_statements(engine) as n:
+        small = AdminService(db).computeSystemStats()
+
+    for i in range(5):
+        make_user(db, role=UserRole.STUDENT, name=f"S{i}")
+    _add_results(db, student, [0, 0, 3, 10])
+    with count_statements(engine) as m:
+        large = AdminService(db).computeSystemStats()
+
+    assert n["n"] == m["n"]
+    assert large["totalStudents"] == 6 and large["learningActivity"]["testsCompleted"] == 6
+    history = {h["date"]: h for h in large["usageHistory"]}
+    today = datetime.utcnow().date()
+    assert len(history) == 7
+    assert history[today.strftime("%Y-%m-%d")]["activity"] == 3
+    assert history[today.strftime("%Y-%m-%d")]["users"] == 6
+    assert history[(today - timedelta(days=3)).strftime("%Y-%m-%d")]["activity"] == 1
+    assert large["databaseStats"]["tableCounts"]["test_results"] == 6
+
+
+def test_stats_cache_serves_stale_and_refreshes_in_background(engine, db, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(admin_service, "_stats_cache", admin_service._SystemStatsCache(clock=clock))
+    settings = admin_service.get_settings()
+    monkeypatch.setattr(settings, "admin_stats_ttl_seconds", 30.0)
+    monkeypatch.setattr(settings, "admin_stats_max_stale_seconds", 600.0)
+
+    make_user(db, role=UserRole.STUDENT, name="First")
+    assert AdminService(db).getSystemStats()["totalUsers"] == 1
+    make_user(db, role=UserRole.STUDENT, name="Second")
+
+    clock.now = 10.0
+    with count_statements(engine) as n:
+        assert AdminService(db).getSystemStats()["totalUsers"] == 1
+    assert n["n"] == 0  # fresh cache hit (maintenance flag is cached too)
+
+    clock.now = 40.0
+    assert AdminService(db).getSystemStats()["totalUsers"] == 1  # stale, refresh started
+    for t in threading.enumerate():
+        if t.name == "admin-stats-refresh":
+            t.join(timeout=5)
+    assert AdminService(db).getSystemStats()["totalUsers"] == 2
+
+    clock.now = 1000.0  # past max_stale: recomputed before answering
+    make_user(db, role=UserRole.STUDENT, name="Third")
+    assert AdminService(db).getSystemStats()["totalUsers"] == 3
@@ -0,0 +1,66 @@
+"""Async read paths (AsyncSession) served next to the sync session."""
+
+import json
+from datetime import datetime, timedelta
+
+from app.domain.enums import ContentType, LanguageLevel, UserRole
+from app.infrastructure.db.models.chatbot import ChatMessageDB, ChatSessionDB
+from app.infrastructure.db.models.content import ContentDB
+from app.infrastructure.db.models.messaging import AnnouncementDB, MessageDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.streaks import record_activity
+from tests.conftest import login, make_user
+
+
+def test_async_read_routes(api):
+    db = api.db
+    student = make_user(db, role=UserRole.STUDENT, name="Stu Dent")
+    teacher = make_user(db, role=UserRole.TEACHER, name="Tea Cher")
+    now = datetime.utcnow()
+
+    db.add(MessageDB(sender_id=teacher.id, recipient_id=student.id, subject="Hi", body="Hello", sent_at=now))
+    db.add(
+        AnnouncementDB(
+            teacher_id=teacher.teacher.id,
+            title="Exam",
+            content="Friday",
+            recipient_group_json=json.dumps({"targetAudience": "all", "recipients": None}),
+            created_at=now,
+        )
+    )
+    content = ContentDB(
+        title="Lesson", body="{}", content_type=ContentType.LESSON, level=LanguageLevel.A2,
+        created_by=student.id, is_draft=False,
+    )
+    db.add(content)
+    db.flush()
+    db.add(
+        StudentAIContentDB(
+            student_id=student.student.id, content_id=content.id, is_active=False,
+            completed_at=now - timedelta(days=1),
+        )
+    )
+    record_activity(student.student, (now - timedelta(days=1)).date())
+    chat = ChatSessionDB(student_id=student.student.id, started_at=now)
+    db.add(chat)
+    db.flush()
+    db.add(ChatMessageDB(session_id=chat.id, sender="user", content="hey", timestamp=now))
+    db.commit()
+    login(api, student)
+
+    inbox = api.client.get("/api/messaging").json()
+    assert [(m["senderName"], m["receiverName"]) for m in inbox] == [("Tea Cher", "Stu Dent")]
+
+    anns = api.client.get("/api/announcements").json()
+    assert [(a["title"], a["authorName"]) for a in anns] == [("Exam", "Tea Cher")]
+
+    history = api.client.get("/api/content-delivery/history").json()["history"]
+    assert [(h["title"], h["contentType"]) for h in history] == [("Lesson", "LESSON")]
+
+    chat_history = api.client.get("/api/chatbot/history").json()
+    assert [m["content"] for m in chat_history] == ["hey"]
+
+    progress = api.client.get("/api/progress/me").json()
+    assert progress["completedContentCount"] == 1
+    assert progress["dailyStreak"] == 1
+    assert progress["contentTypeProgress"] == [{"contentType": "LESSON", "completedCount": 1}]
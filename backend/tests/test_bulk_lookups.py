@@ -0,0 +1,90 @@
+"""List endpoints resolve related rows in bulk: the statement count does not grow with the rows."""
+
+from datetime import datetime, timedelta
+
+from app.domain.enums import ContentType, LanguageLevel, UserRole
+from app.infrastructure.db.bulk import bulk_values, latest_by
+from app.infrastructure.db.models import results as result_models
+from app.infrastructure.db.models.assignments import AssignmentDB, StudentAssignmentDB
+from app.infrastructure.db.models.content import ContentDB
+from app.infrastructure.db.models.messaging import MessageDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from app.infrastructure.db.models.user import StudentDB, UserDB
+from tests.conftest import count_statements, login, make_user
+
+
+def test_latest_by_picks_newest_row_per_key(db):
+    students = [make_user(db, name=f"S{i}").student for i in range(3)]
+    start = datetime(2025, 1, 1)
+    for i, level in enumerate((LanguageLevel.A1, LanguageLevel.B2)):
+        db.add(
+            result_models.TestResultDB(
+                student_id=students[0].id, test_id=1, level=level, completed_at=start + timedelta(days=i)
+            )
+        )
+    db.add(result_models.TestResultDB(student_id=students[1].id, test_id=1, level=LanguageLevel.C1, completed_at=start))
+    db.commit()
+
+    TestResultDB = result_models.TestResultDB
+    latest = latest_by(db, TestResultDB, TestResultDB.student_id, TestResultDB.completed_at, [s.id for s in students])
+    assert {k: r.level for k, r in latest.items()} == {students[0].id: LanguageLevel.B2, students[1].id: LanguageLevel.C1}
+    assert bulk_values(db, UserDB.id, UserDB.name, []) == {}
+
+
+def _add_rows(db, student, teacher, n):
+    now = datetime.utcnow()
+    for _ in range(n):
+        # A fresh teacher and student per row, so every row has its own related records.
+        other_teacher = make_user(db, role=UserRole.TEACHER, name="Teacher")
+        peer = make_user(db, role=UserRole.STUDENT, name="Peer")
+        db.add(MessageDB(sender_id=other_teacher.id, recipient_id=student.id, body="hi", sent_at=now))
+        assignment = AssignmentDB(
+            teacher_id=other_teacher.teacher.id, title="A", due_date=now, assignment_type="TEXT"
+        )
+        content = ContentDB(
+            title="C", body="-", content_type=ContentType.LESSON, level=LanguageLevel.A1, created_by=teacher.id
+        )
+        db.add_all([assignment, content])
+        db.flush()
+        db.add(StudentAssignmentDB(assignment_id=assignment.id, student_id=student.student.id))
+        db.add(
+            StudentAIContentDB(
+                student_id=student.student.id, content_id=content.id, is_active=False, completed_at=now
+            )
+        )
+        db.add(result_models.TestResultDB(student_id=peer.student.id, test_id=1, completed_at=now))
+    # One student user without a StudentDB row, created by the roster on first read.
+    db.add(UserDB(name="Bare", email=f"bare.{n}@example.com", password="x", role=UserRole.STUDENT))
+    db.commit()
+
+
+def _statement_counts(api, student, teacher):
+    calls = [
+        (student, "/api/messaging"),
+        (student, "/api/assignments/student/my-assignments"),
+        (student, "/api/content-delivery/history"),
+        (teacher, "/api/users/teacher/students"),
+    ]
+    counts = {}
+    for user, url in calls:
+        login(api, user)
+        with count_statements(*api.engines) as n:
+            resp = api.client.get(url)
+        assert resp.status_code == 200, (url, resp.text)
+        counts[url] = n["n"]
+    return counts
+
+
+def test_list_endpoints_use_constant_statement_count(api):
+    db = api.db
+    student = make_user(db, role=UserRole.STUDENT, name="Student")
+    teacher = make_user(db, role=UserRole.TEACHER, name="Main Teacher")
+
+    _add_rows(db, student, teacher, 2)
+    small = _statement_counts(api, student, teacher)
+    _add_rows(db, student, teacher, 6)
+    large = _statement_counts(api, student, teacher)
+
+    assert large == small
+    # The roster created the missing StudentDB rows.
+    assert db.query(StudentDB).count() == db.query(UserDB).filter(UserDB.role == UserRole.STUDENT).count()
@@ -0,0 +1,109 @@
+"""Tests for the version-stamped chatbot student context cache."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.application.services import chatbot_context_service
+from app.application.services.chatbot_context_service import ChatbotContextService
+from app.domain.enums import LanguageLevel, UserRole
+from app.infrastructure.db.context_versions import get_student_context_version
+from app.infrastructure.db.models import results as result_models
+from app.infrastructure.db.models.teacher_directive import TeacherDirectiveDB
+
+from tests.conftest import make_student, make_user
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    chatbot_context_service._context_cache.clear()
+
+
+def _count_statements(engine):
+    counter = {"n": 0}
+
+    def _inc(*args, **kwargs):
+        counter["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", _inc)
+    return counter
+
+
+def test_context_is_built_once_per_version(engine, db):
+    student = make_student(db)
+    service = ChatbotContextService(db)
+    first = service.get_student_context(student.id)
+
+    counter = _count_statements(engine)
+    for _ in range(20):
+        assert service.get_student_context(student.id) is first
+    # One version lookup per message instead of the full context build.
+    assert counter["n"] == 20
+
+
+def test_context_is_rebuilt_when_the_day_rolls_over(db, monkeypatch):
+    student = make_student(db)
+    student.daily_streak = 3
+    student.last_active_date = datetime.utcnow().date()
+    db.commit()
+    service = ChatbotContextService(db)
+    assert "Daily Streak: 3 days" in service.get_student_context(student.id).prompt_text
+
+    later = datetime.utcnow() + timedelta(days=2)
+
+    class _Later(datetime):
+        @classmethod
+        def utcnow(cls):
+            return later
+
+    monkeypatch.setattr(chatbot_context_service, "datetime", _Later)
+    assert "Daily Streak: 0 days" in service.get_student_context(student.id).prompt_text
+
+
+def test_writes_bump_version_and_rebuild_context(db):
+    student = make_student(db)
+    service = ChatbotContextService(db)
+    before = service.get_student_context(student.id)
+    assert "Reading: Not assessed" in before.prompt_text
+
+    db.add(
+        result_models.TestResultDB(
+            student_id=student.id,
+            test_id=1,
+            score=9,
+            level=LanguageLevel.B1,
+            reading_level=LanguageLevel.B1,
+            completed_at=datetime.utcnow(),
+        )
+    )
+    db.commit()
+
+    after = service.get_student_context(student.id)
+    assert after.version > before.version
+    assert "Reading: B1" in after.prompt_text
+
+
+def test_teacher_directive_bumps_student_version(db):
+    student = make_student(db)
+    teacher = make_user(db, role=UserRole.TEACHER, name="Teacher")
+    version = get_student_context_version(db, student.id)
+
+    db.add(
+        TeacherDirectiveDB(
+            teacher_user_id=teacher.id,
+            student_user_id=student.user_id,
+            instructions="Focus on past tense",
+        )
+    )
+    db.commit()
+    assert get_student_context_version(db, student.id) == version + 1
+
+
+def test_rolled_back_write_does_not_bump_version(db):
+    student = make_student(db)
+    version = get_student_context_version(db, student.id)
+    student.total_points = 50
+    db.flush()
+    db.rollback()
+    assert get_student_context_version(db, student.id) == version
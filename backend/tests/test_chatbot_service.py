@@ -0,0 +1,100 @@
+"""Tests for chatbot reply streaming and prompt history."""
+
+import json
+
+from app.application.services.chatbot_service import ChatbotService, _MessageFieldStreamer
+from app.infrastructure.external.llm import LLMChatRequest, LLMChatResponse, LLMMessage
+from app.infrastructure.external.llm.mock import MockLLMClient
+
+from tests.conftest import make_student
+
+
+def _stream(text, step):
+    streamer = _MessageFieldStreamer()
+    return "".join(streamer.feed(text[i : i + step]) for i in range(0, len(text), step))
+
+
+def test_structured_reply_streams_only_the_message_field():
+    payload = {
+        "action": "update_learning_plan",
+        "plan_updates": {"focus_areas": ["speaking"]},
+        "message": 'Great idea! "Speaking" is next.\nLet\'s go – ünite 1',
+    }
+    text = json.dumps(payload)
+    for step in (1, 2, 5, len(text)):
+        assert _stream(text, step) == payload["message"]
+
+
+def test_plain_reply_streams_unchanged():
+    assert _stream("Hello there, how are you?", 3) == "Hello there, how are you?"
+
+
+def test_mock_generate_stream_joins_to_generate():
+    client = MockLLMClient()
+    request = LLMChatRequest(messages=[LLMMessage(role="user", content="hi there")])
+    chunks = list(client.generate_stream(request))
+    assert len(chunks) > 1
+    assert "".join(chunks) == client.generate(request).text
+
+
+class _StreamingLLM:
+    def __init__(self, text):
+        self.text = text
+
+    def generate_stream(self, request):
+        for i in range(0, len(self.text), 4):
+            yield self.text[i : i + 4]
+
+
+def _stream_reply(db, text):
+    service = ChatbotService(db, llm_client=_StreamingLLM(text))
+    session = service.createSession(make_student(db).id)
+    events = list(service.processMessageStream(session.id, "hi"))
+    return "".join(e.text for e in events if e.type == "delta"), events[-1].text
+
+
+def test_streamed_reply_is_never_sent_twice(db):
+    # Leading whitespace is streamed but stripped from the final reply.
+    assert _stream_reply(db, "\n  Hello there") == ("\n  Hello there", "Hello there")
+    # Truncated JSON: the final reply is the raw text, which the streamed part does not prefix.
+    assert _stream_reply(db, '{"message": "Hi the') == ("Hi the", '{"message": "Hi the')
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.requests = []
+
+    def generate(self, request):
+        self.requests.append(request)
+        if request.lane == "background":
+            return LLMChatResponse(text=json.dumps({"summary": f"summary #{len(self.requests)}"}))
+        return LLMChatResponse(text="ok")
+
+
+def test_prompt_size_stays_flat_as_the_session_grows(db):
+    llm = _RecordingLLM()
+    service = ChatbotService(db, llm_client=llm)
+    student = make_student(db)
+    session = service.createSession(student.id)
+
+    sizes = []
+    for i in range(60):
+        text = f"question {i}"
+        service.saveMessage(session.id, sender="user", content=text)
+        reply = service.processMessage(session.id, text)
+        service.saveMessage(session.id, sender="bot", content=reply)
+        service.refreshSummary(session.id)  # what scheduleSummaryRefresh runs in the background
+        chat_requests = [r for r in llm.requests if r.lane == "chat"]
+        sizes.append(len(chat_requests[-1].messages))
+
+    db.refresh(session)
+    assert session.summary and session.summary.startswith("summary #")
+    # system prompt + summary + the last HISTORY_WINDOW turns + the current message
+    assert max(sizes) == 2 + ChatbotService.HISTORY_WINDOW + 1
+    assert sizes[-1] == sizes[-21]
+
+    last = [r for r in llm.requests if r.lane == "chat"][-1]
+    assert last.messages[1].role == "system"
+    assert "summary #" in last.messages[1].content
+    # The current message is sent exactly once.
+    assert [m.content for m in last.messages].count("question 59") == 1
@@ -0,0 +1,145 @@
+"""Tests for prefetching the next AI content item."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+from app.application.services.student_ai_content_delivery_service import StudentAIContentDeliveryService
+from app.config.settings import get_settings
+from app.domain.enums import ContentType, LanguageLevel
+from app.infrastructure.db.models import results as result_models
+from app.infrastructure.db.models.job import JobDB
+from app.infrastructure.db.models.prefetched_content import PrefetchedContentDB
+from tests.conftest import make_student
+
+
+def _add_result(db, student, *, weaknesses, strengths, minutes_ago=0):
+    db.add(
+        result_models.TestResultDB(
+            student_id=student.id,
+            test_id=1,
+            score=50,
+            level=LanguageLevel.B1,
+            completed_at=datetime.utcnow() - timedelta(minutes=minutes_ago),
+            weaknesses_json=json.dumps(weaknesses),
+            strengths_json=json.dumps(strengths),
+        )
+    )
+    db.commit()
+
+
+def _service(db):
+    service = StudentAIContentDeliveryService(db=db, settings=get_settings())
+    calls = []
+
+    def fake_generate_one(**kwargs):
+        calls.append(kwargs)
+        n = len(calls)
+        ctx = {"n": n, "planTopics": kwargs["planTopics"] or []}
+        return f"Lesson {n}", json.dumps({"formatVersion": 1, "blocks": []}), f"why {n}", ctx
+
+    service._generate_one = fake_generate_one
+    return service, calls
+
+
+def test_prefetched_item_is_served_without_generation(db):
+    student = make_student(db)
+    _add_result(db, student, weaknesses=["articles"], strengths=["vocabulary"])
+    service, calls = _service(db)
+
+    assert service.prefetchNextContent(student.user_id) is not None
+    # One ready item per (content type, topics) is enough.
+    assert service.prefetchNextContent(student.user_id) is None
+    assert len(calls) == 1
+
+    content, rationale = service.prepareContentForStudent(
+        student.user_id, contentType=ContentType.LESSON, planTopics=["articles", "vocabulary"]
+    )
+    assert content.title == "Lesson 1"
+    assert rationale == "why 1"
+    assert len(calls) == 1
+    assert db.scalars(select(PrefetchedContentDB)).first() is None
+
+
+def test_prefetched_item_expires_when_weaknesses_change(db):
+    student = make_student(db)
+    _add_result(db, student, weaknesses=["articles"], strengths=["vocabulary"], minutes_ago=5)
+    service, calls = _service(db)
+    service.prefetchNextContent(student.user_id)
+
+    _add_result(db, student, weaknesses=["tenses"], strengths=["vocabulary"])
+    content, _ = service.prepareContentForStudent(
+        student.user_id, contentType=ContentType.LESSON, planTopics=["articles", "vocabulary"]
+    )
+    assert content.title == "Lesson 2"
+    assert db.scalars(select(PrefetchedContentDB)).first() is None
+
+
+def test_concurrent_requests_promote_a_prefetched_item_once(session_factory, db):
+    student = make_student(db)
+    _add_result(db, student, weaknesses=["articles"], strengths=["vocabulary"])
+    service, _ = _service(db)
+    service.prefetchNextContent(student.user_id)
+    snapshot = service._snapshot_student(student.id, fallback_level=None)
+    promote = dict(
+        student_user_id=student.user_id, student_db_id=student.id, snapshot=snapshot,
+        contentType=ContentType.LESSON, planTopics=["articles", "vocabulary"],
+    )
+
+    # A second request that read the same ready item before the first one claimed it.
+    other_db = session_factory()
+    other, _ = _service(other_db)
+    fingerprint = other._prefetch_fingerprint(student.user_id, snapshot, other._resolve_target_topic(student.id))
+    rows = other._valid_prefetched(student.id, fingerprint)
+    other._valid_prefetched = lambda *args: rows
+
+    assert service._promote_prefetched(**promote) is not None
+    assert other._promote_prefetched(**promote) is None
+    other_db.close()
+
+
+def test_completion_schedules_a_prefetch_job(db):
+    student = make_student(db)
+    service, _ = _service(db)
+    content, _ = service.prepareContentForStudent(student.user_id, contentType=ContentType.LESSON)
+
+    service.completeContent(studentUserId=student.user_id, contentId=content.id, result={"speakingFeedback": {"ok": 1}})
+
+    job = db.scalars(select(JobDB).where(JobDB.job_type == "content.prefetch")).one()
+    assert json.loads(job.payload_json) == {"studentUserId": student.user_id, "contentType": "LESSON"}
+
+
+def test_prefetch_follows_the_topics_the_client_sent(db):
+    student = make_student(db)
+    _add_result(db, student, weaknesses=["articles"], strengths=["vocabulary"])
+    service, calls = _service(db)
+    topics = ["Phrasal verbs", "travel"]
+    content, _ = service.prepareContentForStudent(student.user_id, contentType=ContentType.LESSON, planTopics=topics)
+    service.completeContent(studentUserId=student.user_id, contentId=content.id, result={"speakingFeedback": {"ok": 1}})
+
+    job = db.scalars(select(JobDB).where(JobDB.job_type == "content.prefetch")).one()
+    payload = json.loads(job.payload_json)
+    assert payload["planTopics"] == topics
+    # What the content.prefetch job runs.
+    assert service.prefetchNextContent(student.user_id, planTopics=payload["planTopics"]) is not None
+
+    content, _ = service.prepareContentForStudent(student.user_id, contentType=ContentType.LESSON, planTopics=topics)
+    assert content.title == "Lesson 2"
+    assert len(calls) == 2
+    assert db.scalars(select(PrefetchedContentDB)).first() is None
+
+
+def test_retried_completion_job_returns_the_stored_outcome(db):
+    from app.api.routes.content_delivery import _run_complete_content_job
+
+    student = make_student(db)
+    service, _ = _service(db)
+    content, _ = service.prepareContentForStudent(student.user_id, contentType=ContentType.LESSON)
+    payload = {"userId": student.user_id, "contentId": content.id, "result": {"speakingFeedback": {"ok": 1}}}
+
+    first = _run_complete_content_job(db, payload, job=None)
+    again = _run_complete_content_job(db, payload, job=None)
+
+    assert again["feedback"] == first["feedback"] == {"speakingFeedback": {"ok": 1}}
+    assert db.scalar(select(func.count()).select_from(JobDB).where(JobDB.job_type == "content.prefetch")) == 1
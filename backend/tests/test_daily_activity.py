@@ -0,0 +1,97 @@
+"""daily_activity rollup: maintained by the flush hook, identical to a rebuild."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.domain.enums import ContentType, LanguageLevel, UserRole
+from app.infrastructure.db.daily_activity import daily_totals, rebuild_daily_activity
+from app.infrastructure.db.models import chatbot as chat_models
+from app.infrastructure.db.models import content as content_models
+from app.infrastructure.db.models import progress as progress_models
+from app.infrastructure.db.models import results as result_models
+from app.infrastructure.db.models import rewards as reward_models
+from app.infrastructure.db.models import student_ai_content as ai_models
+from tests.conftest import make_user
+
+
+def _rows(db):
+    table = progress_models.DailyActivityDB.__table__
+    return sorted(tuple(r) for r in db.execute(select(table)).all())
+
+
+def test_rollup_tracks_writes_and_matches_rebuild(engine, db):
+    student_id = make_user(db, role=UserRole.STUDENT, name="Student").student.id
+    now = datetime.utcnow()
+    yesterday = now - timedelta(days=1)
+
+    content = content_models.ContentDB(
+        title="c", body="b", content_type=ContentType.LESSON, level=LanguageLevel.A1, created_by=1
+    )
+    reward = reward_models.RewardDB(name="First Step", points=10)
+    chat = chat_models.ChatSessionDB(student_id=student_id, started_at=now)
+    db.add_all([content, reward, chat])
+    db.flush()
+    pending = ai_models.StudentAIContentDB(student_id=student_id, content_id=content.id)
+    db.add_all([
+        pending,
+        ai_models.StudentAIContentDB(student_id=student_id, content_id=content.id, is_active=False, completed_at=yesterday),
+        result_models.TestResultDB(student_id=student_id, test_id=1, completed_at=now),
+        result_models.TestResultDB(student_id=student_id, test_id=1, completed_at=yesterday),
+        chat_models.ChatMessageDB(session_id=chat.id, sender="user", content="hi", timestamp=now),
+        chat_models.ChatMessageDB(session_id=chat.id, sender="bot", content="hello", timestamp=now),
+        reward_models.StudentRewardDB(student_id=student_id, reward_id=reward.id, earned_at=now),
+    ])
+    db.commit()
+
+    pending.is_active = False
+    pending.completed_at = now
+    db.commit()
+    dropped = db.scalar(select(result_models.TestResultDB).where(result_models.TestResultDB.completed_at == yesterday))
+    db.delete(dropped)
+    db.commit()
+
+    totals = daily_totals(db, student_id=student_id)
+    assert totals[now.date()] == {"content_completed": 1, "tests_completed": 1, "chat_turns": 1, "points": 10}
+    assert totals[yesterday.date()] == {"content_completed": 1, "tests_completed": 0, "chat_turns": 0, "points": 0}
+
+    incremental = _rows(db)
+    with engine.begin() as conn:
+        rebuild_daily_activity(conn)
+    assert [r for r in _rows(db) if any(r[2:])] == [r for r in incremental if any(r[2:])]
+
+
+def test_rolled_back_events_leave_no_activity(db):
+    student_id = make_user(db, role=UserRole.STUDENT, name="Student").student.id
+    db.add(result_models.TestResultDB(student_id=student_id, test_id=1, completed_at=datetime.utcnow()))
+    db.flush()
+    assert daily_totals(db, student_id=student_id)
+    db.rollback()
+    assert daily_totals(db, student_id=student_id) == {}
+
+
+def test_moving_a_committed_event_to_another_day(db):
+    student_id = make_user(db, role=UserRole.STUDENT, name="Student").student.id
+    now = datetime.utcnow()
+    earlier = now - timedelta(days=3)
+    reward = reward_models.RewardDB(name="First Step", points=10)
+    chat = chat_models.ChatSessionDB(student_id=student_id, started_at=now)
+    db.add_all([reward, chat])
+    db.flush()
+    rows = [
+        result_models.TestResultDB(student_id=student_id, test_id=1, completed_at=now),
+        chat_models.ChatMessageDB(session_id=chat.id, sender="user", content="hi", timestamp=now),
+        reward_models.StudentRewardDB(student_id=student_id, reward_id=reward.id, earned_at=now),
+    ]
+    db.add_all(rows)
+    db.commit()
+
+    # The rows expired on commit: the old dates are only known if they are loaded on change.
+    rows[0].completed_at = earlier
+    rows[1].timestamp = earlier
+    rows[2].earned_at = earlier
+    db.commit()
+
+    totals = daily_totals(db, student_id=student_id)
+    assert totals[now.date()] == {"content_completed": 0, "tests_completed": 0, "chat_turns": 0, "points": 0}
+    assert totals[earlier.date()] == {"content_completed": 0, "tests_completed": 1, "chat_turns": 1, "points": 10}
@@ -0,0 +1,101 @@
+"""Tests for the persistent background job runner."""
+
+from datetime import datetime, timedelta
+
+from app.application.services.job_service import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobRunner,
+    JobService,
+    register_job_handler,
+)
+from app.infrastructure.db.models.job import JobDB
+
+_calls = {"flaky": 0}
+
+
+@register_job_handler("test.echo")
+def _echo(db, payload, job):
+    return {"echo": payload["value"], "blob": len(job.payload_blob or b"")}
+
+
+@register_job_handler("test.flaky")
+def _flaky(db, payload, job):
+    _calls["flaky"] += 1
+    raise RuntimeError("provider timeout")
+
+
+@register_job_handler("test.invalid")
+def _invalid(db, payload, job):
+    raise ValueError("Test already completed")
+
+
+def test_job_runs_and_stores_result(session_factory, db):
+    job = JobService(db).enqueue("test.echo", {"value": 7}, blob=b"abc")
+    runner = JobRunner(session_factory)
+
+    assert runner.run_once() is not None
+    assert runner.run_once() is None
+
+    db.expire_all()
+    view = JobService.to_view(db.get(JobDB, job.id))
+    assert view.status == JOB_SUCCEEDED
+    assert view.result == {"echo": 7, "blob": 3}
+    assert view.attempts == 1
+    assert db.get(JobDB, job.id).payload_blob is None
+
+
+def test_transient_errors_back_off_then_fail(session_factory, db):
+    job = JobService(db).enqueue("test.flaky", {}, max_attempts=2)
+    runner = JobRunner(session_factory)
+
+    runner.run_once()
+    db.expire_all()
+    row = db.get(JobDB, job.id)
+    assert row.status == JOB_QUEUED
+    assert row.attempts == 1
+    assert row.run_after > datetime.utcnow()
+    # Not due yet: the backoff keeps it out of the next poll.
+    assert runner.run_once() is None
+
+    row.run_after = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    runner.run_once()
+    db.expire_all()
+    row = db.get(JobDB, job.id)
+    assert row.status == JOB_FAILED
+    assert row.attempts == 2
+    assert "provider timeout" in row.error
+
+
+def test_permanent_errors_are_not_retried(session_factory, db):
+    job = JobService(db).enqueue("test.invalid", {}, max_attempts=5)
+    JobRunner(session_factory).run_once()
+    db.expire_all()
+    row = db.get(JobDB, job.id)
+    assert row.status == JOB_FAILED
+    assert row.attempts == 1
+
+
+def test_interrupted_jobs_are_requeued(session_factory, db):
+    job = JobService(db).enqueue("test.echo", {"value": 1})
+    # Simulate a worker that claimed the job and then died with the process.
+    dead = JobService(session_factory())
+    assert dead.claim_next("dead-worker").status == JOB_RUNNING
+    row = db.get(JobDB, job.id)
+    db.refresh(row)
+    row.heartbeat_at = datetime.utcnow() - timedelta(minutes=5)
+    db.commit()
+
+    runner = JobRunner(session_factory, stale_after_seconds=60)
+    runner.maintain()
+    db.expire_all()
+    assert db.get(JobDB, job.id).status == JOB_QUEUED
+
+    db.get(JobDB, job.id).run_after = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    runner.run_once()
+    db.expire_all()
+    assert db.get(JobDB, job.id).status == JOB_SUCCEEDED
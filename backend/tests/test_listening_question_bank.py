@@ -0,0 +1,118 @@
+"""Tests for the pre-generated listening question bank."""
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.base import Base
+import app.infrastructure.db.models  # noqa: F401  (registers all tables)
+from app.infrastructure.db.models.job import JobDB
+from app.infrastructure.db.models.tests import ListeningQuestionDB
+from app.infrastructure.external.audio_manager import AudioFileManager
+from app.application.services import listening_question_bank_service
+from app.application.services.job_service import JOB_SUCCEEDED, JobRunner
+from app.application.services.listening_question_bank_service import (
+    QUESTIONS_PER_SET,
+    ListeningQuestionBankRefillJob,
+    ListeningQuestionBankService,
+    bank_key_for,
+)
+
+
+class _FakeGenerator:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_validated_questions(self, script, level, num_questions=3):
+        self.calls += 1
+        return [
+            {
+                "question": f"Question {i} ({level.value})",
+                "options": ["a", "b", "c", "d"],
+                "correct_answer": "a",
+            }
+            for i in range(num_questions)
+        ]
+
+
+def _session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_refill_is_idempotent_and_sampling_uses_bank():
+    db = _session()
+    audio_manager = AudioFileManager()
+    generator = _FakeGenerator()
+    service = ListeningQuestionBankService(db, audio_manager=audio_manager, question_generator=generator)
+
+    report = service.refill()
+    assert report.generated == len(audio_manager.get_all())
+    assert generator.calls == report.generated
+
+    again = service.refill()
+    assert again.generated == 0
+    assert again.already_banked == report.generated
+    assert generator.calls == report.generated
+
+    questions = service.sample_placement_set()
+    assert questions
+    for q in questions:
+        assert q.bank_key == bank_key_for(q.transcript, q.difficulty)
+    assert generator.calls == report.generated
+
+
+def test_rejected_sets_are_not_stored():
+    class _BadGenerator(_FakeGenerator):
+        def generate_validated_questions(self, script, level, num_questions=3):
+            qs = super().generate_validated_questions(script, level, num_questions)
+            return qs[: QUESTIONS_PER_SET - 1]
+
+    db = _session()
+    service = ListeningQuestionBankService(db, question_generator=_BadGenerator())
+    report = service.refill()
+
+    assert report.generated == 0
+    assert report.failed == report.scanned
+    assert db.scalars(select(ListeningQuestionDB).where(ListeningQuestionDB.bank_key.is_not(None))).first() is None
+
+
+def test_placement_fallback_takes_one_set_per_level(monkeypatch):
+    from app.application.services.placement_test_service import PlacementTestService
+    from app.domain.enums import LanguageLevel
+
+    db = _session()
+    for level in LanguageLevel:
+        for i in range(QUESTIONS_PER_SET * 3):
+            db.add(
+                ListeningQuestionDB(
+                    audio_url="/a.wav", transcript="t", question_text=f"q{i}", options_json="[]",
+                    correct_answer="a", difficulty=level, bank_key=f"{level.value}-{i // QUESTIONS_PER_SET}",
+                )
+            )
+    db.commit()
+    monkeypatch.setattr(ListeningQuestionBankService, "sample_placement_set", lambda self: [])
+
+    questions = PlacementTestService(db)._generate_listening_questions_for_placement()
+
+    levels = [q.difficulty for q in questions]
+    assert set(levels) == {LanguageLevel.A1, LanguageLevel.A2, LanguageLevel.B1, LanguageLevel.B2}
+    assert all(levels.count(level) == QUESTIONS_PER_SET for level in set(levels))
+
+
+def test_workers_share_one_refill_job(monkeypatch, session_factory, db):
+    generator = _FakeGenerator()
+    monkeypatch.setattr(listening_question_bank_service, "ListeningQuestionGeneratorService", lambda: generator)
+    workers = [ListeningQuestionBankRefillJob(session_factory, interval_seconds=60) for _ in range(3)]
+
+    job_ids = [w.run_once() for w in workers]
+    assert job_ids[0] is not None and job_ids[1:] == [None, None]
+
+    assert JobRunner(session_factory).run_once() is not None
+    assert db.get(JobDB, job_ids[0]).status == JOB_SUCCEEDED
+    assert generator.calls == len(AudioFileManager().get_all())
+
+    # The next interval schedules again and finds everything banked.
+    assert workers[1].run_once() is not None
+    JobRunner(session_factory).run_once()
+    assert generator.calls == len(AudioFileManager().get_all())
@@ -0,0 +1,279 @@
+"""Tests for the LLM client abstraction (registry, async interface)."""
+
+import asyncio
+
+from app.config.settings import Settings
+from app.infrastructure.external.llm import (
+    CachingLLMClient,
+    LLMCachePolicy,
+    LLMChatRequest,
+    LLMChatResponse,
+    LLMClientRegistry,
+    SingleFlightLLMClient,
+    LLMMessage,
+    LLMQueueTimeoutError,
+    RateLimitedLLMClient,
+    cache_key_for,
+    get_llm_client,
+)
+
+
+def _request(text="hello"):
+    return LLMChatRequest(messages=[LLMMessage(role="user", content=text)])
+
+
+def test_get_llm_client_returns_shared_instance():
+    settings = Settings(ai_provider="mock")
+    assert get_llm_client(settings) is get_llm_client(settings)
+
+
+def test_registry_keys_clients_by_provider_config():
+    registry = LLMClientRegistry()
+    a = registry.get(Settings(ai_provider="mock", google_genai_model="m1"))
+    b = registry.get(Settings(ai_provider="mock", google_genai_model="m2"))
+    assert a is not b
+    assert registry.get(Settings(ai_provider="mock", google_genai_model="m1")) is a
+
+
+def test_agenerate_matches_generate():
+    client = get_llm_client(Settings(ai_provider="mock"))
+    sync_resp = client.generate(_request())
+    async_resp = asyncio.run(client.agenerate(_request()))
+    assert async_resp.text == sync_resp.text
+
+
+class _CountingClient:
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, request):
+        self.calls += 1
+        return LLMChatResponse(text=f"response-{self.calls}")
+
+    async def agenerate(self, request):
+        return self.generate(request)
+
+
+def test_cache_is_opt_in_per_request():
+    inner = _CountingClient()
+    client = CachingLLMClient(inner)
+
+    client.generate(_request())
+    client.generate(_request())
+    assert inner.calls == 2
+    assert client.stats()["bypassed"] == 2
+
+    cached = LLMChatRequest(messages=[LLMMessage(role="user", content="hello")], cache=LLMCachePolicy())
+    first = client.generate(cached)
+    second = asyncio.run(client.agenerate(cached))
+    assert inner.calls == 3
+    assert first.text == second.text
+    assert client.stats()["hits"] == 1
+
+
+def test_cache_key_ignores_policy_but_not_parameters():
+    base = LLMChatRequest(messages=[LLMMessage(role="user", content="x")], temperature=0.2)
+    same = LLMChatRequest(messages=[LLMMessage(role="user", content="x")], temperature=0.2, cache=LLMCachePolicy())
+    other = LLMChatRequest(messages=[LLMMessage(role="user", content="x")], temperature=0.7)
+    assert cache_key_for(base) == cache_key_for(same)
+    assert cache_key_for(base) != cache_key_for(other)
+
+
+def test_cache_collects_variants_then_reuses_them():
+    inner = _CountingClient()
+    client = CachingLLMClient(inner)
+    request = LLMChatRequest(messages=[LLMMessage(role="user", content="plan")], cache=LLMCachePolicy(variants=3))
+
+    texts = {client.generate(request).text for _ in range(10)}
+    assert inner.calls == 3
+    assert texts == {"response-1", "response-2", "response-3"}
+
+
+def test_cache_skips_responses_the_caller_rejects():
+    inner = _CountingClient()
+    client = CachingLLMClient(inner)
+    policy = LLMCachePolicy(accept=lambda text: text != "response-1")
+    request = LLMChatRequest(messages=[LLMMessage(role="user", content="json")], cache=policy)
+
+    assert client.generate(request).text == "response-1"
+    assert client.generate(request).text == "response-2"
+    assert client.generate(request).text == "response-2"
+    assert inner.calls == 2
+    assert client.stats()["rejected"] == 1
+
+
+def test_cache_lru_is_bounded():
+    inner = _CountingClient()
+    client = CachingLLMClient(inner, max_entries=2)
+    policy = LLMCachePolicy()
+    for text in ("a", "b", "c", "a"):
+        client.generate(LLMChatRequest(messages=[LLMMessage(role="user", content=text)], cache=policy))
+    assert inner.calls == 4
+    assert client.stats()["memory_entries"] == 2
+
+
+def test_cache_reads_through_persistent_store():
+    class _DictStore:
+        def __init__(self):
+            self.rows = {}
+
+        def get_variants(self, cache_key):
+            return [t for (_, t) in sorted(self.rows.get(cache_key, {}).items())]
+
+        def put(self, cache_key, variant, text, ttl_seconds):
+            self.rows.setdefault(cache_key, {})[variant] = text
+
+    store = _DictStore()
+    request = LLMChatRequest(messages=[LLMMessage(role="user", content="hello")], cache=LLMCachePolicy())
+    CachingLLMClient(_CountingClient(), store=store).generate(request)
+
+    inner = _CountingClient()
+    fresh = CachingLLMClient(inner, store=store)
+    assert fresh.generate(request).text == "response-1"
+    assert inner.calls == 0
+    assert fresh.stats()["store_hits"] == 1
+
+
+def test_single_flight_collapses_concurrent_threads():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+
+    class _SlowClient(_CountingClient):
+        def generate(self, request):
+            release.wait(5)
+            return super().generate(request)
+
+    inner = _SlowClient()
+    client = SingleFlightLLMClient(inner)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(client.generate, _request()) for _ in range(5)]
+        deadline = time.time() + 5
+        while client.stats()["collapsed"] < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        release.set()
+        texts = {f.result().text for f in futures}
+
+    assert inner.calls == 1
+    assert texts == {"response-1"}
+    assert client.stats()["collapsed"] == 4
+
+
+def test_single_flight_collapses_concurrent_tasks_and_shares_errors():
+    class _AsyncClient(_CountingClient):
+        async def agenerate(self, request):
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            if request.messages[0].content == "boom":
+                raise RuntimeError("provider down")
+            return LLMChatResponse(text=f"response-{self.calls}")
+
+    async def run():
+        inner = _AsyncClient()
+        client = SingleFlightLLMClient(inner)
+        ok = await asyncio.gather(*(client.agenerate(_request()) for _ in range(3)))
+        failed = await asyncio.gather(*(client.agenerate(_request("boom")) for _ in range(3)), return_exceptions=True)
+        return inner, client, ok, failed
+
+    inner, client, ok, failed = asyncio.run(run())
+    assert inner.calls == 2
+    assert {r.text for r in ok} == {"response-1"}
+    assert all(isinstance(e, RuntimeError) for e in failed)
+    assert client.stats()["collapsed"] == 4
+
+
+def test_single_flight_follower_stops_waiting_for_a_stuck_leader():
+    class _StuckOnceClient(_CountingClient):
+        async def agenerate(self, request):
+            self.calls += 1
+            if self.calls == 1:
+                await asyncio.sleep(5)
+            return LLMChatResponse(text=f"response-{self.calls}")
+
+    async def run():
+        inner = _StuckOnceClient()
+        client = SingleFlightLLMClient(inner, wait_timeout_seconds=0.05)
+        leader = asyncio.ensure_future(client.agenerate(_request()))
+        await asyncio.sleep(0)
+        follower = await client.agenerate(_request())
+        leader.cancel()
+        return client, follower
+
+    client, follower = asyncio.run(run())
+    assert follower.text == "response-2"
+    assert client.stats()["wait_timeouts"] == 1
+
+
+def test_single_flight_followers_survive_a_cancelled_leader():
+    class _SlowClient(_CountingClient):
+        async def agenerate(self, request):
+            self.calls += 1
+            await asyncio.sleep(0.2)
+            return LLMChatResponse(text=f"response-{self.calls}")
+
+    async def run():
+        inner = _SlowClient()
+        client = SingleFlightLLMClient(inner)
+        leader = asyncio.ensure_future(client.agenerate(_request()))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(client.agenerate(_request()))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        return inner, await follower
+
+    inner, follower = asyncio.run(run())
+    assert follower.text == "response-2"
+    assert inner.calls == 2
+
+
+def test_rate_limiter_serves_higher_priority_lanes_first():
+    import threading
+    import time
+
+    order = []
+    gate = threading.Event()
+
+    class _RecordingClient(_CountingClient):
+        def generate(self, request):
+            if request.messages[0].content == "blocker":
+                gate.wait(5)
+            order.append(request.lane)
+            return super().generate(request)
+
+    client = RateLimitedLLMClient(_RecordingClient(), max_concurrency=1)
+    blocker = threading.Thread(target=client.generate, args=(LLMChatRequest(messages=[LLMMessage(role="user", content="blocker")], lane="chat"),))
+    blocker.start()
+    while client.stats()["running"] < 1:
+        time.sleep(0.01)
+
+    threads = []
+    for lane in ("background", "placement", "chat"):
+        t = threading.Thread(target=client.generate, args=(LLMChatRequest(messages=[LLMMessage(role="user", content=lane)], lane=lane),))
+        t.start()
+        threads.append(t)
+    while client.stats()["queue_depth"] < 3:
+        time.sleep(0.01)
+    gate.set()
+    for t in [blocker, *threads]:
+        t.join(5)
+
+    assert order == ["chat", "chat", "placement", "background"]
+    stats = client.stats()
+    assert stats["lanes"]["background"]["admitted"] == 1
+    assert stats["lanes"]["background"]["max_wait_ms"] > 0
+
+
+def test_rate_limiter_times_out_when_budget_is_exhausted():
+    import pytest
+
+    client = RateLimitedLLMClient(_CountingClient(), requests_per_minute=1, queue_timeout_seconds=0.1)
+    client.generate(_request())
+    with pytest.raises(LLMQueueTimeoutError):
+        client.generate(_request())
+    with pytest.raises(LLMQueueTimeoutError):
+        asyncio.run(client.agenerate(_request()))
+    stats = client.stats()
+    assert stats["lanes"]["background"]["timeouts"] == 2
+    assert stats["queue_depth"] == 0
@@ -0,0 +1,77 @@
+"""The maintenance flag is cached per worker and revalidated through a version row."""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps.auth import _check_maintenance_mode
+from app.application.services.admin_service import AdminService
+from app.domain.enums import UserRole
+from app.infrastructure.db.maintenance_state import MaintenanceStateCache, get_system_state_version, MAINTENANCE_KEY
+from app.infrastructure.db.models.system import MaintenanceLogDB
+from app.infrastructure.db.models.user import AdminDB
+from tests.conftest import count_statements, make_user
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _admin(db):
+    user = make_user(db, role=UserRole.ADMIN, name="Admin")
+    db.add(AdminDB(user_id=user.id))
+    db.commit()
+    return user
+
+
+def test_cache_polls_version_at_most_once_per_interval(engine, session_factory):
+    clock = _Clock()
+    cache = MaintenanceStateCache(poll_interval=1.0, clock=clock)
+    db = session_factory()
+    admin = _admin(db)
+    assert cache.get(db).enabled is False
+
+    # Another worker (session) opens maintenance: the log insert bumps the version row.
+    other = session_factory()
+    other.add(MaintenanceLogDB(admin_id=1, start_time=datetime.utcnow(), reason="upgrade"))
+    other.commit()
+    assert get_system_state_version(other, MAINTENANCE_KEY) == 1
+
+    with count_statements(engine) as n:
+        assert cache.get(db).enabled is False  # within the poll interval: no query, old state
+    assert n["n"] == 0
+
+    clock.now = 1.5
+    with count_statements(engine) as n:
+        state = cache.get(db)
+    assert state.enabled and state.reason == "upgrade"
+    assert n["n"] == 2  # version check + reload
+
+    clock.now = 3.0
+    with count_statements(engine) as n:
+        cache.get(db)
+    assert n["n"] == 1  # unchanged version: no reload
+
+    AdminService(db).setMaintenanceMode(enabled=False, adminUserId=int(admin.id))
+    assert get_system_state_version(db, MAINTENANCE_KEY) == 2
+
+
+def test_set_maintenance_updates_this_workers_cache_directly(db):
+    admin = _admin(db)
+    student = make_user(db, role=UserRole.STUDENT, name="Student")
+    _check_maintenance_mode(db, student)
+
+    AdminService(db).setMaintenanceMode(enabled=True, adminUserId=int(admin.id), announcement="Back soon")
+    with pytest.raises(HTTPException) as exc:
+        _check_maintenance_mode(db, student)
+    assert exc.value.status_code == 503
+    assert exc.value.detail["announcement"] == "Back soon"
+    _check_maintenance_mode(db, admin)
+
+    AdminService(db).setMaintenanceMode(enabled=False, adminUserId=int(admin.id))
+    _check_maintenance_mode(db, student)
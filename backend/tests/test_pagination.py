@@ -0,0 +1,88 @@
+"""Keyset pagination: cursor round-trips and page walks over list endpoints."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.enums import UserRole
+from app.infrastructure.db.models.messaging import AnnouncementDB, MessageDB
+from app.infrastructure.db.models.user import UserDB
+from app.infrastructure.db.pagination import build_page, decode_cursor, encode_cursor, keyset
+from tests.conftest import login, make_user
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    at = datetime(2025, 3, 1, 12, 30)
+    assert decode_cursor(encode_cursor(at, 7)) == (at, 7)
+    assert decode_cursor(encode_cursor(None, 3)) == (None, 3)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_pages_cover_ties_and_nulls_exactly_once(db, descending):
+    same = datetime(2025, 1, 1)
+    # Sort keys: two distinct values, a run of ties and a run of NULLs, interleaved by id.
+    logins = [None, same, datetime(2025, 2, 1), same, None, same, datetime(2024, 12, 1), None, same, None]
+    users = []
+    for i, last_login in enumerate(logins):
+        user = make_user(db, name=f"User {i}")
+        user.last_login = last_login
+        users.append(user)
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        stmt = keyset(select(UserDB), UserDB.last_login, UserDB.id, cursor=cursor, limit=3, descending=descending)
+        page = build_page(db.scalars(stmt).all(), limit=3, key=lambda u: (u.last_login, u.id))
+        seen += [u.id for u in page.items]
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    # NULL sorts lowest: last when descending, first when ascending.
+    expected = sorted(users, key=lambda u: (u.last_login is not None, u.last_login or same, u.id), reverse=descending)
+    assert seen == [u.id for u in expected]
+
+
+def test_list_endpoints_page_with_next_cursor_header(api):
+    db = api.db
+    student = make_user(db, role=UserRole.STUDENT)
+    teacher = make_user(db, role=UserRole.TEACHER)
+    other = make_user(db, role=UserRole.STUDENT, email="other@example.com")
+    start = datetime.utcnow() - timedelta(hours=1)
+    for i in range(5):
+        db.add(MessageDB(sender_id=teacher.id, recipient_id=student.id, body=f"m{i}", sent_at=start + timedelta(minutes=i)))
+    for i in range(6):
+        # Every other announcement is addressed to someone else only.
+        recipients = None if i % 2 == 0 else [other.id]
+        db.add(
+            AnnouncementDB(
+                teacher_id=teacher.teacher.id,
+                title=f"a{i}",
+                content="-",
+                recipient_group_json=json.dumps({"targetAudience": "students", "recipients": recipients}),
+                created_at=start + timedelta(minutes=i),
+            )
+        )
+    db.commit()
+    login(api, student)
+
+    first = api.client.get("/api/messaging", params={"limit": 2})
+    assert [m["content"] for m in first.json()] == ["m4", "m3"]
+    bodies, cursor = [m["content"] for m in first.json()], first.headers["X-Next-Cursor"]
+    while cursor:
+        resp = api.client.get("/api/messaging", params={"limit": 2, "cursor": cursor})
+        bodies += [m["content"] for m in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+    assert bodies == ["m4", "m3", "m2", "m1", "m0"]
+
+    anns = api.client.get("/api/announcements", params={"limit": 2})
+    assert [a["title"] for a in anns.json()] == ["a4", "a2"]
+    rest = api.client.get("/api/announcements", params={"limit": 2, "cursor": anns.headers["X-Next-Cursor"]})
+    assert [a["title"] for a in rest.json()] == ["a0"]
+    assert "X-Next-Cursor" not in rest.headers
+
+    assert api.client.get("/api/messaging", params={"cursor": "garbage"}).status_code == 400
@@ -0,0 +1,72 @@
+"""Placement module questions, submissions and speaking analyses live in their own tables."""
+
+import json
+
+from sqlalchemy import select
+
+from app.application.services.placement_test_service import PlacementTestService
+from app.domain.enums import LanguageLevel, UserRole
+from app.infrastructure.db.migrations import _placement_submission_tables
+from app.infrastructure.db.models import tests as test_models
+from tests.conftest import make_user
+
+
+def test_resubmitting_a_module_upserts_rows(db):
+    user = make_user(db, role=UserRole.STUDENT)
+    service = PlacementTestService(db)
+    start = service.initializeTest(user.id)
+    questions = service.getModuleQuestions(start.testId, "reading")
+    module_id = next(m.moduleId for m in start.modules if m.moduleType == "reading")
+
+    first, second = questions[0], questions[1]
+    result = service.submitModule(
+        user.id,
+        start.testId,
+        "reading",
+        [
+            {"questionId": str(first.id), "answer": first.correct_answer},
+            {"questionId": str(second.id), "answer": "wrong"},
+        ],
+    )
+    assert result.score == 1
+
+    service.submitModule(user.id, start.testId, "reading", [{"questionId": str(second.id), "answer": second.correct_answer}])
+    rows = db.scalars(select(test_models.TestModuleSubmissionDB).where(test_models.TestModuleSubmissionDB.module_id == module_id)).all()
+    assert [(r.question_id, r.is_correct) for r in rows] == [(str(second.id), True)]
+    assert db.get(test_models.TestModuleDB, module_id).questions_json is None
+
+
+def test_backfill_moves_legacy_module_json(db, engine):
+    user = make_user(db, role=UserRole.STUDENT)
+    service = PlacementTestService(db)
+    start = service.initializeTest(user.id)
+    placement = db.scalar(select(test_models.PlacementTestDB).where(test_models.PlacementTestDB.test_id == start.testId))
+
+    # Rewrite the speaking module the way it was stored before the normalised tables.
+    speaking = db.get(test_models.TestModuleDB, placement.speaking_module_id)
+    question_ids = [q.id for q in service.getModuleQuestions(start.testId, "speaking")]
+    db.query(test_models.TestModuleQuestionDB).filter(test_models.TestModuleQuestionDB.module_id == speaking.id).delete()
+    speaking.questions_json = json.dumps(
+        {
+            "question_ids": question_ids,
+            "submissions": [{"questionId": "7", "answer": " hello "}],
+            "speaking_audio": [
+                {"questionId": "7", "receivedBytes": 10, "overallScore": 40, "cefrLevel": "A2"},
+                {"questionId": "8", "receivedBytes": 12, "overallScore": 80, "cefrLevel": "B2"},
+            ],
+            "cefr_level": "B2",
+        }
+    )
+    db.commit()
+
+    with engine.begin() as conn:
+        _placement_submission_tables(conn)
+        _placement_submission_tables(conn)  # idempotent
+
+    assert [q.id for q in service.getModuleQuestions(start.testId, "speaking")] == question_ids
+    subs = db.scalars(select(test_models.TestModuleSubmissionDB).where(test_models.TestModuleSubmissionDB.module_id == speaking.id)).all()
+    assert [(s.question_id, s.answer) for s in subs] == [("7", "hello")]
+    analyses = db.scalars(select(test_models.SpeakingAnalysisDB).where(test_models.SpeakingAnalysisDB.module_id == speaking.id)).all()
+    assert sorted(a.cefr_level for a in analyses) == ["A2", "B2"]
+
+    assert service.completeTest(user.id, start.testId).speakingLevel == LanguageLevel.B2
@@ -0,0 +1,108 @@
+"""Progress cache: hits, TTL expiry, LRU eviction and invalidation."""
+
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.domain.enums import UserRole
+from app.infrastructure.db.models.progress import ProgressDB
+from app.infrastructure.repositories.cached_progress_repository import (
+    CachedSqlAlchemyProgressRepository,
+    ProgressCache,
+)
+from tests.conftest import count_statements, make_user
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _student_with_progress(db, name, rate=0.5):
+    student_id = make_user(db, role=UserRole.STUDENT, name=name).student.id
+    db.add(ProgressDB(student_id=student_id, correct_answer_rate=rate, last_updated=datetime.utcnow()))
+    db.commit()
+    return student_id
+
+
+def test_reads_hit_until_ttl_and_invalidation(engine, db):
+    clock = _Clock()
+    cache = ProgressCache(ttl_seconds=10, clock=clock)
+    repo = CachedSqlAlchemyProgressRepository(db, cache)
+    student_id = _student_with_progress(db, "Student")
+
+    with count_statements(engine) as n:
+        assert repo.fetch_progress(student_id).correct_answer_rate == 0.5
+        assert repo.fetch_progress(student_id).correct_answer_rate == 0.5
+    assert n["n"] == 1
+
+    progress = db.scalar(select(ProgressDB).where(ProgressDB.student_id == student_id))
+    progress.correct_answer_rate = 0.9
+    db.commit()
+    assert repo.fetch_progress(student_id).correct_answer_rate == 0.5
+
+    repo.invalidate(student_id)
+    assert repo.fetch_progress(student_id).correct_answer_rate == 0.9
+
+    clock.now = 11
+    with count_statements(engine) as n:
+        repo.fetch_progress(student_id)
+    assert n["n"] == 1
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["invalidated"]) == (2, 3, 1, 1)
+    assert stats["hit_ratio"] == 2 / 5
+
+
+def test_least_recently_used_student_is_evicted(db):
+    cache = ProgressCache(max_entries=2)
+    repo = CachedSqlAlchemyProgressRepository(db, cache)
+    first, second, third = (_student_with_progress(db, name) for name in ("A", "B", "C"))
+
+    repo.fetch_progress(first)
+    repo.fetch_progress(second)
+    repo.fetch_progress(first)
+    repo.fetch_progress(third)
+
+    assert cache.stats()["evicted"] == 1
+    assert cache.get(db.get_bind(), first, "progress") is not None
+    repo.fetch_progress(second)
+    assert cache.stats()["misses"] == 4
+
+
+def test_read_racing_an_invalidation_is_not_stored(db):
+    cache = ProgressCache()
+    bind = db.get_bind()
+    generation = cache.generation(bind, 1)
+    cache.invalidate(bind, 1)
+    cache.put(bind, 1, "progress", "stale", generation=generation)
+    assert cache.stats()["entries"] == 0
+
+
+def test_disabled_cache_reads_through(engine, db):
+    cache = ProgressCache(enabled=False)
+    repo = CachedSqlAlchemyProgressRepository(db, cache)
+    student_id = _student_with_progress(db, "Student")
+
+    with count_statements(engine) as n:
+        repo.fetch_progress(student_id)
+        repo.fetch_progress(student_id)
+    assert n["n"] == 2
+    assert cache.stats()["hits"] == 0 and cache.stats()["entries"] == 0
+
+
+def test_stored_summary_is_not_built_from_cached_rows(db):
+    from app.application.services.progress_summary_service import ProgressSummaryService
+
+    student_id = _student_with_progress(db, "Student")
+    CachedSqlAlchemyProgressRepository(db).fetch_progress(student_id)  # cached at 0.5
+
+    # Changed by another worker or a script: this worker's cache was not invalidated.
+    progress = db.scalar(select(ProgressDB).where(ProgressDB.student_id == student_id))
+    progress.correct_answer_rate = 0.9
+    db.commit()
+
+    assert ProgressSummaryService(db).refreshSummary(student_id)["correctAnswerRate"] == 0.9
@@ -0,0 +1,57 @@
+"""GET /progress/me served from the materialised student_progress_summary row, with an ETag."""
+
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from app.application.services.progress_summary_service import ProgressSummaryRefreshJob
+from app.domain.enums import ContentType, LanguageLevel, UserRole
+from app.infrastructure.db.models.content import ContentDB
+from app.infrastructure.db.models.progress import StudentProgressSummaryDB
+from app.infrastructure.db.models.student_ai_content import StudentAIContentDB
+from tests.conftest import count_statements, login, make_user
+
+
+def _complete_content(db, student):
+    content = ContentDB(
+        title="Lesson", body="{}", content_type=ContentType.LESSON, level=LanguageLevel.A1,
+        created_by=student.id, is_draft=False,
+    )
+    db.add(content)
+    db.flush()
+    db.add(
+        StudentAIContentDB(
+            student_id=student.student.id, content_id=content.id, is_active=False, completed_at=datetime.utcnow()
+        )
+    )
+    db.commit()
+
+
+def test_summary_is_served_in_one_statement_with_etag(api):
+    student = make_user(api.db, role=UserRole.STUDENT, name="Student")
+    login(api, student)
+
+    # Without a stored summary the response is built in memory; the read stores nothing.
+    first = api.client.get("/api/progress/me")
+    assert first.status_code == 200
+    assert first.json()["completedContentCount"] == 0
+    etag = first.headers["ETag"]
+    assert api.db.get(StudentProgressSummaryDB, student.student.id) is None
+
+    refresh = ProgressSummaryRefreshJob(sessionmaker(bind=api.engines[0]), interval_seconds=60)
+    assert refresh.run_once() == 1
+    assert refresh.run_once() == 0
+
+    with count_statements(api.engines[1]) as n:
+        again = api.client.get("/api/progress/me")
+    assert n["n"] == 1
+    assert again.headers["ETag"] == etag
+    assert api.client.get("/api/progress/me", headers={"If-None-Match": etag}).status_code == 304
+
+    # A completion bumps the student's context version in its transaction: the stored summary is stale.
+    _complete_content(api.db, student)
+    changed = api.client.get("/api/progress/me", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["completedContentCount"] == 1
+    assert changed.json()["contentTypeProgress"] == [{"contentType": "LESSON", "completedCount": 1}]
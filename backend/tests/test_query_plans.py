@@ -0,0 +1,32 @@
+"""Every registered hot query must be served by an index, never a full table scan."""
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.migrations import create_missing_indexes
+from tests.query_plans import HOT_QUERIES, explain_query_plan, full_scans
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_an_index(engine, name):
+    with engine.connect() as conn:
+        plan = explain_query_plan(conn, HOT_QUERIES[name]())
+    assert plan
+    assert not full_scans(plan), f"{name} falls back to a full scan: {plan}"
+
+
+def test_missing_indexes_are_created_on_existing_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_test_results_student_completed")
+        conn.exec_driver_sql("DROP INDEX ix_messages_recipient_sent")
+
+    with engine.begin() as conn:
+        created = create_missing_indexes(conn)
+    assert sorted(created) == ["ix_messages_recipient_sent", "ix_test_results_student_completed"]
+    assert "ix_test_results_student_completed" in {ix["name"] for ix in inspect(engine).get_indexes("test_results")}
+    with engine.begin() as conn:
+        assert create_missing_indexes(conn) == []
+    engine.dispose()
@@ -0,0 +1,41 @@
+"""The authenticated user's profile ids are resolved once per request and reused."""
+
+from app.api.deps.auth import get_current_user
+from app.domain.enums import UserRole
+from app.infrastructure.db.identity import bind_identity, load_identity, student_for_user, student_id_for_user
+from app.infrastructure.security.tokens import token_manager
+from tests.conftest import count_statements, make_user
+
+
+def test_bound_identity_answers_profile_lookups_without_queries(engine, db):
+    student = make_user(db, role=UserRole.STUDENT, name="Student")
+    other = make_user(db, role=UserRole.STUDENT, name="Other")
+    identity = load_identity(db, student.id)
+    assert identity.studentId == student.student.id and identity.teacherId is None
+
+    bind_identity(db, identity)
+    with count_statements(engine) as n:
+        assert student_id_for_user(db, student.id) == student.student.id
+        assert student_for_user(db, student.id).id == student.student.id
+    assert n["n"] == 0
+
+    # Any other user still goes to the database.
+    other_student_id = other.student.id
+    with count_statements(engine) as n:
+        assert student_id_for_user(db, other.id) == other_student_id
+    assert n["n"] == 1
+
+
+def test_real_token_binds_identity_for_the_request(api):
+    student = make_user(api.db, role=UserRole.STUDENT, name="Student")
+    del api.client.app.dependency_overrides[get_current_user]
+    headers = {"Authorization": f"Bearer {token_manager.issue_access_token(int(student.id))}"}
+
+    resp = api.client.get("/api/assignments/student/my-assignments", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"assignments": []}
+    # The user with its profiles, then the assignment list: the student row is never selected
+    # by user_id (and the maintenance flag is served from the worker's cache).
+    with count_statements(*api.engines) as n:
+        api.client.get("/api/assignments/student/my-assignments", headers=headers)
+    assert n["n"] == 2
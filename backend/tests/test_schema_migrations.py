@@ -0,0 +1,51 @@
+"""Versioned migration runner and the startup schema check."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, select
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.migrations import (
+    LATEST_VERSION,
+    SchemaVersionError,
+    check_schema_version,
+    run_migrations,
+)
+from app.infrastructure.db.models.rewards import RewardDB
+
+
+def test_fresh_database_is_migrated_once(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    with pytest.raises(SchemaVersionError):
+        check_schema_version(engine)
+
+    applied = run_migrations(engine)
+    assert [m.version for m in applied] == list(range(1, LATEST_VERSION + 1))
+    assert check_schema_version(engine) == LATEST_VERSION
+    assert run_migrations(engine) == []
+    with engine.connect() as conn:
+        assert conn.scalar(select(RewardDB.id).where(RewardDB.name == "First Step")) is not None
+    # Every model's table comes from some migration, not from create_all over the current models.
+    assert set(inspect(engine).get_table_names()) == set(Base.metadata.tables)
+    engine.dispose()
+
+
+def test_pre_migration_database_is_upgraded(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        # chat_sessions as it looked before the rolling summary columns.
+        conn.exec_driver_sql(
+            "CREATE TABLE chat_sessions (id INTEGER PRIMARY KEY, student_id INTEGER NOT NULL, "
+            "started_at DATETIME NOT NULL, ended_at DATETIME)"
+        )
+
+    run_migrations(engine, target=3)
+    with pytest.raises(SchemaVersionError):
+        check_schema_version(engine)
+
+    run_migrations(engine)
+    columns = {c["name"] for c in inspect(engine).get_columns("chat_sessions")}
+    assert {"summary", "summary_through_message_id"} <= columns
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("chat_sessions")}
+    assert "ix_chat_sessions_student_open" in indexes
+    assert check_schema_version(engine) == LATEST_VERSION
+    engine.dispose()
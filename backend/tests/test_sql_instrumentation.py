@@ -0,0 +1,74 @@
+"""Per-request SQL statistics: statement counts, N+1 detection, slow queries, Server-Timing."""
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+
+from app.api.middleware import SQLInstrumentationMiddleware
+from app.domain.enums import UserRole
+from app.infrastructure.db.instrumentation import SQLStatsRecorder, get_sql_stats, instrument_engine, statement_shape
+from app.infrastructure.db.models.user import UserDB
+from tests.conftest import login, make_user
+
+
+def test_statement_shape_collapses_literals_and_in_lists():
+    a = statement_shape("SELECT * FROM users WHERE id IN (?, ?, ?) AND name = 'x'  LIMIT 5")
+    b = statement_shape("SELECT * FROM users WHERE id IN (?, ?) AND name = 'y' LIMIT 10")
+    assert a == b == "SELECT * FROM users WHERE id IN (?) AND name = ? LIMIT ?"
+
+
+def test_middleware_counts_statements_and_flags_repeats(engine, session_factory):
+    recorder = SQLStatsRecorder(n_plus_one_threshold=3, slow_query_ms=0.0)
+    instrument_engine(engine, recorder)
+    app = FastAPI()
+
+    def _db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/loop/{n}")
+    def loop(n: int, db=Depends(_db)) -> dict:
+        for i in range(n):
+            db.scalar(select(UserDB).where(UserDB.id == i))
+        return {}
+
+    client = TestClient(SQLInstrumentationMiddleware(app, recorder, server_timing=True))
+    ok = client.get("/loop/2")
+    client.get("/loop/5")
+
+    assert ok.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="2 queries"' in ok.headers["Server-Timing"]
+    report = recorder.snapshot()
+    assert [r["statements"] for r in report["requests"]] == [5, 2]
+    assert report["requests"][0]["path"] == "/loop/{n}"
+    assert [r["repeated"][0]["count"] for r in report["nPlusOne"]] == [5]
+    assert report["routes"][0]["requests"] == 2
+    # slow_query_ms=0: every statement lands in the slow-query log.
+    assert len(report["slowQueries"]) == 7
+
+
+def test_statements_outside_requests_are_only_slow_logged(engine):
+    recorder = SQLStatsRecorder(slow_query_ms=0.0, slow_query_sample_rate=0.0)
+    instrument_engine(engine, recorder)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert recorder.snapshot()["requests"] == []
+    assert recorder.snapshot()["slowQueries"] == []
+
+
+def test_admin_endpoint_reports_recent_requests(api):
+    get_sql_stats().clear()
+    admin = make_user(api.db, role=UserRole.ADMIN, name="Admin")
+    login(api, admin)
+    api.client.get("/api/admin/users")
+
+    resp = api.client.get("/api/admin/sql-stats")
+    assert resp.status_code == 200
+    paths = [r["path"] for r in resp.json()["requests"]]
+    assert "/api/admin/users" in paths
+
+    login(api, make_user(api.db, role=UserRole.STUDENT, name="Student"))
+    assert api.client.get("/api/admin/sql-stats").status_code == 403
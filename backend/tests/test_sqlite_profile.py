@@ -0,0 +1,27 @@
+"""Tests for the SQLite engine profile."""
+
+from app.config.settings import Settings
+from app.infrastructure.db.session import create_db_engine, sqlite_pragma_report
+
+
+def test_profile_pragmas_apply_to_file_databases(tmp_path):
+    cfg = Settings(sqlite_busy_timeout_ms=1234, sqlite_cache_size_kib=1024, db_pool_size=3)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'profile.db'}", cfg)
+    try:
+        report = sqlite_pragma_report(engine)
+        assert report["journal_mode"] == "wal"
+        assert report["synchronous"] == 1  # NORMAL
+        assert report["busy_timeout"] == 1234
+        assert report["cache_size"] == -1024
+        assert report["temp_store"] == 2  # MEMORY
+        assert engine.pool.size() == 3
+    finally:
+        engine.dispose()
+
+
+def test_profile_can_be_disabled(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'plain.db'}", Settings(), profile=False)
+    try:
+        assert sqlite_pragma_report(engine)["journal_mode"] == "delete"
+    finally:
+        engine.dispose()
@@ -0,0 +1,50 @@
+"""Daily streak: advanced once per active day on completion, lapsed lazily on read."""
+
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app.domain.enums import UserRole
+from app.infrastructure.db.streaks import current_streak, record_activity, streak_ending_at
+from tests.conftest import login, make_user
+
+
+def test_record_activity_and_rollover(db):
+    student = make_user(db, role=UserRole.STUDENT, name="Student").student
+    d = date(2024, 3, 1)
+    assert current_streak(student, today=d) == 0
+
+    assert record_activity(student, d) == 1
+    assert record_activity(student, d) == 1  # same day counts once
+    assert record_activity(student, d + timedelta(days=1)) == 2
+    assert record_activity(student, d) == 2  # a late, older completion does not rewind
+    assert current_streak(student, today=d + timedelta(days=2)) == 2  # yesterday still counts
+    assert current_streak(student, today=d + timedelta(days=3)) == 0
+    assert record_activity(student, d + timedelta(days=4)) == 1
+
+    assert streak_ending_at({d, d + timedelta(days=1), d + timedelta(days=3)}) == (d + timedelta(days=3), 1)
+    assert streak_ending_at({d, d + timedelta(days=1)}) == (d + timedelta(days=1), 2)
+
+
+def test_progress_read_does_not_write(api):
+    student = make_user(api.db, role=UserRole.STUDENT, name="Student")
+    record_activity(student.student, date.today() - timedelta(days=5))
+    api.db.commit()
+    login(api, student)
+
+    writes = []
+
+    def _record(conn, cursor, statement, *args):
+        if not statement.lstrip().upper().startswith("SELECT"):
+            writes.append(statement)
+
+    for engine in api.engines:
+        event.listen(engine, "before_cursor_execute", _record)
+    try:
+        body = api.client.get("/api/progress/me").json()
+    finally:
+        for engine in api.engines:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    assert body["dailyStreak"] == 0  # lapsed
+    assert writes == []